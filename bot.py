@@ -11,6 +11,8 @@ import signal
 import time
 from datetime import datetime
 
+from polymarket_algo.data.outcomes import OutcomeStore
+
 from src.config import LOCAL_TZ, TIMEZONE_NAME, Config
 from src.core.polymarket import PolymarketClient
 from src.core.trader import LiveTrader, PaperTrader, TradingState
@@ -129,7 +131,7 @@ Related Commands:
     max_daily_loss = args.max_loss or Config.MAX_DAILY_LOSS
 
     # Init
-    client = PolymarketClient()
+    client = PolymarketClient(outcome_store=OutcomeStore())
     state = TradingState.load()
     if args.bankroll:
         state.bankroll = args.bankroll
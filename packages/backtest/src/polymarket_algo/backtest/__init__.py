@@ -1,4 +1,9 @@
 from .engine import BacktestResult as BacktestResult
+from .engine import backtest_metrics as backtest_metrics
 from .engine import parameter_sweep as parameter_sweep
 from .engine import run_backtest as run_backtest
 from .engine import walk_forward_split as walk_forward_split
+from .walkforward import WalkForwardFold as WalkForwardFold
+from .walkforward import WalkForwardResult as WalkForwardResult
+from .walkforward import walk_forward as walk_forward
+from .walkforward import walk_forward_folds as walk_forward_folds
@@ -1,17 +1,23 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from itertools import product
 from typing import Any, TypeGuard, cast
 
 import numpy as np
 import pandas as pd
-from polymarket_algo.core import Strategy
+from polymarket_algo.core import BatchStrategy, Strategy
+
+from .metrics import column_metrics
+from .parallel import map_over_shared_candles, resolve_n_jobs, worker_candles
 
 StrategyCallable = Callable[..., pd.Series | pd.DataFrame]
 StrategyLike = Strategy | StrategyCallable
 
+# Upper bound on candles x param-set cells held in one sweep chunk (~32 MB per float64 matrix).
+SWEEP_CELL_BUDGET = 4_000_000
+
 
 def _has_evaluate(strategy: StrategyLike) -> TypeGuard[Strategy]:
     """Return True if strategy is an object with a callable .evaluate() method."""
@@ -41,6 +47,37 @@ def _evaluate_strategy_output(
     return cast(StrategyCallable, strategy)(candles, **strategy_params)
 
 
+def _signals_and_sizes(out: pd.Series | pd.DataFrame, index: pd.Index) -> tuple[pd.Series, pd.Series]:
+    if isinstance(out, pd.DataFrame):
+        signals = out["signal"].astype(int)
+        size = out["size"].astype(float) if "size" in out.columns else pd.Series(15.0, index=index)
+    else:
+        signals = out.astype(int)
+        size = pd.Series(15.0, index=index)
+    return signals, size
+
+
+def _signal_arrays(out: pd.Series | pd.DataFrame, n: int) -> tuple[np.ndarray, np.ndarray]:
+    """NumPy counterpart of ``_signals_and_sizes`` (no intermediate Series)."""
+    if isinstance(out, pd.DataFrame):
+        signals = out["signal"].to_numpy(dtype=np.int64)
+        sizes = out["size"].to_numpy(dtype=np.float64) if "size" in out.columns else np.full(n, 15.0)
+    else:
+        signals = out.to_numpy(dtype=np.int64)
+        sizes = np.full(n, 15.0)
+    return signals, sizes
+
+
+def _metrics_at(metrics: dict[str, np.ndarray], j: int) -> dict[str, Any]:
+    return {
+        "win_rate": float(metrics["win_rate"][j]),
+        "total_pnl": float(metrics["total_pnl"][j]),
+        "max_drawdown": float(metrics["max_drawdown"][j]),
+        "sharpe_ratio": float(metrics["sharpe_ratio"][j]),
+        "trade_count": int(metrics["trade_count"][j]),
+    }
+
+
 def run_backtest(
     candles: pd.DataFrame,
     strategy: StrategyLike,
@@ -51,12 +88,7 @@ def run_backtest(
     strategy_params = strategy_params or {}
 
     out = _evaluate_strategy_output(candles, strategy, strategy_params)
-    if isinstance(out, pd.DataFrame):
-        signals = out["signal"].astype(int)
-        size = out["size"].astype(float) if "size" in out.columns else pd.Series(15.0, index=candles.index)
-    else:
-        signals = out.astype(int)
-        size = pd.Series(15.0, index=candles.index)
+    signals, size = _signals_and_sizes(out, candles.index)
 
     next_close = candles["close"].shift(-1)
     outcome_up = (next_close > candles["close"]).astype(int)
@@ -105,20 +137,128 @@ def run_backtest(
     return BacktestResult(metrics=metrics, trades=trades, pnl_curve=pnl_curve)
 
 
+def backtest_metrics(
+    candles: pd.DataFrame,
+    strategy: StrategyLike,
+    strategy_params: dict[str, Any] | None = None,
+    buy_price: float = 0.50,
+    win_payout: float = 0.95,
+) -> dict[str, Any]:
+    """Metrics-only fast path of ``run_backtest``: same metrics, computed straight from
+    NumPy arrays without building the trades frame or PnL curve."""
+    out = _evaluate_strategy_output(candles, strategy, strategy_params or {})
+    signals, sizes = _signal_arrays(out, len(candles))
+    close = candles["close"].to_numpy(dtype=np.float64)
+    return _metrics_at(column_metrics(close, signals[:, None], sizes[:, None], buy_price, win_payout), 0)
+
+
+def _grid_param_sets(param_grid: dict[str, list[Any]]) -> list[dict[str, Any]]:
+    keys = list(param_grid.keys())
+    return [dict(zip(keys, values, strict=False)) for values in product(*[param_grid[k] for k in keys])]
+
+
+def _sweep_chunk_size(n_candles: int, n_param_sets: int) -> int:
+    return max(1, min(n_param_sets, SWEEP_CELL_BUDGET // max(n_candles, 1)))
+
+
+def _iter_signal_batches(
+    candles: pd.DataFrame,
+    strategy: StrategyLike,
+    param_sets: list[dict[str, Any]],
+    chunk_size: int,
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """Yield (signals, sizes) matrices, one column per param set, chunk by chunk."""
+    if isinstance(strategy, BatchStrategy):
+        yield from strategy.evaluate_batch(candles, param_sets, chunk_size)
+        return
+
+    # Generic fallback: evaluate each param set, but still score the chunk column-wise.
+    for start in range(0, len(param_sets), chunk_size):
+        chunk = param_sets[start : start + chunk_size]
+        signals = np.empty((len(candles), len(chunk)), dtype=np.int64)
+        sizes = np.empty((len(candles), len(chunk)), dtype=np.float64)
+        for j, params in enumerate(chunk):
+            out = _evaluate_strategy_output(candles, strategy, params)
+            signals[:, j], sizes[:, j] = _signal_arrays(out, len(candles))
+        yield signals, sizes
+
+
+def _sweep_rows(
+    candles: pd.DataFrame,
+    strategy: StrategyLike,
+    param_sets: list[dict[str, Any]],
+    chunk_size: int | None = None,
+) -> list[dict[str, Any]]:
+    close = candles["close"].to_numpy(dtype=np.float64)
+    chunk_size = chunk_size or _sweep_chunk_size(len(candles), len(param_sets))
+
+    rows: list[dict[str, Any]] = []
+    offset = 0
+    for signals, sizes in _iter_signal_batches(candles, strategy, param_sets, chunk_size):
+        metrics = column_metrics(close, signals, sizes)
+        for j in range(signals.shape[1]):
+            rows.append({**param_sets[offset + j], **_metrics_at(metrics, j)})
+        offset += signals.shape[1]
+    return rows
+
+
+def _sweep_task(task: tuple[StrategyLike, list[dict[str, Any]], bool, int | None]) -> list[dict[str, Any]]:
+    """Pool worker: sweep one slice of the grid against the shared candles."""
+    strategy, param_sets, vectorized, chunk_size = task
+    return _run_sweep(worker_candles(), strategy, param_sets, vectorized, chunk_size)
+
+
+def _run_sweep(
+    candles: pd.DataFrame,
+    strategy: StrategyLike,
+    param_sets: list[dict[str, Any]],
+    vectorized: bool,
+    chunk_size: int | None,
+) -> list[dict[str, Any]]:
+    if vectorized:
+        return _sweep_rows(candles, strategy, param_sets, chunk_size)
+    return [{**params, **run_backtest(candles, strategy, params).metrics} for params in param_sets]
+
+
 def parameter_sweep(
     candles: pd.DataFrame,
     strategy: StrategyLike,
     param_grid: dict[str, list[Any]],
+    vectorized: bool = True,
+    chunk_size: int | None = None,
+    n_jobs: int | None = 1,
 ) -> pd.DataFrame:
-    keys = list(param_grid.keys())
-    rows: list[dict[str, Any]] = []
+    """Backtest every combination in ``param_grid``, best (win_rate, total_pnl) first.
+
+    With ``vectorized=True`` the grid is scored as (candles x param sets) NumPy matrices;
+    strategies implementing ``BatchStrategy`` also share indicator series across the grid.
+    ``chunk_size`` caps the param sets per matrix (default: sized to ``SWEEP_CELL_BUDGET``).
+
+    ``n_jobs`` > 1 (or -1 for all cores) splits the grid into contiguous slices swept in a
+    process pool; candles are shared once via shared memory and rows are merged in grid
+    order; metrics don't depend on chunk shapes, so the result equals the serial path bit
+    for bit. The strategy must be picklable.
+    """
+    param_sets = _grid_param_sets(param_grid)
+    n_jobs = min(resolve_n_jobs(n_jobs), len(param_sets))
+
+    if n_jobs > 1:
+        # A few slices per worker keeps the pool busy when slices finish unevenly.
+        bounds = np.linspace(0, len(param_sets), min(len(param_sets), n_jobs * 4) + 1).astype(int)
+        tasks = [
+            (strategy, param_sets[lo:hi], vectorized, chunk_size)
+            for lo, hi in zip(bounds[:-1], bounds[1:], strict=True)
+        ]
+        rows = [row for part in map_over_shared_candles(candles, _sweep_task, tasks, n_jobs) for row in part]
+    else:
+        rows = _run_sweep(candles, strategy, param_sets, vectorized, chunk_size)
+
+    return _rank_rows(rows).reset_index(drop=True)
 
-    for values in product(*[param_grid[k] for k in keys]):
-        params = dict(zip(keys, values, strict=False))
-        result = run_backtest(candles, strategy, params)
-        rows.append({**params, **result.metrics})
 
-    return pd.DataFrame(rows).sort_values(by=["win_rate", "total_pnl"], ascending=False).reset_index(drop=True)
+def _rank_rows(rows: list[dict[str, Any]]) -> pd.DataFrame:
+    """Sweep rows best-first; the index keeps each row's position in grid order."""
+    return pd.DataFrame(rows).sort_values(by=["win_rate", "total_pnl"], ascending=False)
 
 
 def walk_forward_split(candles: pd.DataFrame, train_ratio: float = 0.75) -> tuple[pd.DataFrame, pd.DataFrame]:
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 
@@ -5,3 +6,83 @@ def max_drawdown(equity_curve: pd.Series) -> float:
     running_max = equity_curve.cummax()
     drawdown = equity_curve - running_max
     return float(drawdown.min()) if not drawdown.empty else 0.0
+
+
+def outcome_up(close: np.ndarray) -> np.ndarray:
+    """True where the next close is above the current one (last candle is always False)."""
+    up = np.zeros(len(close), dtype=bool)
+    np.greater(close[1:], close[:-1], out=up[:-1])
+    return up
+
+
+def trade_outcomes(
+    close: np.ndarray,
+    signals: np.ndarray,
+    sizes: np.ndarray,
+    buy_price: float = 0.50,
+    win_payout: float = 0.95,
+    up: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Per-candle (trade_pnl, active, wins) for a (candles x param sets) signal matrix.
+
+    ``up`` overrides ``outcome_up(close)``; pass a slice of the full series' outcomes
+    when scoring a window, so its last candle is resolved by the candle after it.
+    """
+    up = (outcome_up(close) if up is None else up)[:, None]
+    active = signals != 0
+    wins = ((signals == 1) & up) | ((signals == -1) & ~up)
+
+    per_share_pnl = np.where(wins, win_payout - buy_price, -buy_price)
+    # Column-major so each column sum is a contiguous (pairwise) reduction, matching pandas exactly.
+    trade_pnl = np.asfortranarray(np.where(active, per_share_pnl * sizes, 0.0))
+    return trade_pnl, active, wins
+
+
+def reduce_metrics(trade_pnl: np.ndarray, active: np.ndarray, wins: np.ndarray) -> dict[str, np.ndarray]:
+    """Column-wise win rate, PnL, drawdown, Sharpe and trade count from ``trade_outcomes``."""
+    trade_count = active.sum(axis=0)
+    win_count = (wins & active).sum(axis=0)
+    total_pnl = trade_pnl.sum(axis=0)
+
+    if len(trade_pnl):
+        pnl_curve = np.cumsum(trade_pnl, axis=0)
+        drawdown = (pnl_curve - np.maximum.accumulate(pnl_curve, axis=0)).min(axis=0)
+    else:
+        drawdown = np.zeros(trade_pnl.shape[1])
+
+    # Mean and std over each column's own trades, in the order pandas reduces them in
+    # run_backtest, so Sharpe is bit-identical whatever the chunk width or trade layout.
+    mean = np.zeros(trade_pnl.shape[1])
+    std = np.zeros(trade_pnl.shape[1])
+    for j in np.flatnonzero(trade_count):
+        returns = trade_pnl[active[:, j], j]
+        mean[j] = returns.sum() / len(returns)
+        std[j] = np.sqrt(((mean[j] - returns) ** 2).sum() / len(returns))
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        win_rate = np.where(trade_count > 0, win_count / trade_count, 0.0)
+        sharpe = np.where((trade_count > 0) & (std > 0), mean / std * np.sqrt(trade_count), 0.0)
+
+    return {
+        "win_rate": win_rate,
+        "total_pnl": total_pnl,
+        "max_drawdown": drawdown,
+        "sharpe_ratio": sharpe,
+        "trade_count": trade_count,
+    }
+
+
+def column_metrics(
+    close: np.ndarray,
+    signals: np.ndarray,
+    sizes: np.ndarray,
+    buy_price: float = 0.50,
+    win_payout: float = 0.95,
+    up: np.ndarray | None = None,
+) -> dict[str, np.ndarray]:
+    """Backtest metrics for every column of a (candles x param sets) signal matrix.
+
+    Mirrors ``run_backtest`` exactly, but reduces column-wise with NumPy so a whole
+    chunk of a parameter sweep is scored in one pass.
+    """
+    return reduce_metrics(*trade_outcomes(close, signals, sizes, buy_price, win_payout, up))
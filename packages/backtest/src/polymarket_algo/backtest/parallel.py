@@ -0,0 +1,140 @@
+"""Process-pool fan-out for backtests over candles held in shared memory.
+
+The parent copies the candle index and numeric columns into one
+``multiprocessing.shared_memory`` block; each worker attaches once (pool
+initializer) and rebuilds a zero-copy DataFrame, so tasks only pickle their
+own arguments instead of the whole frame.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pandas as pd
+
+_worker_shm: SharedMemory | None = None
+_worker_candles: pd.DataFrame | None = None
+
+
+@dataclass(frozen=True)
+class SharedCandles:
+    """Picklable handle to candles copied into a shared memory block.
+
+    Layout: ``length`` 8-byte index values followed by one contiguous float64
+    run per column. Only numeric columns are shared (they are cast to float64).
+    """
+
+    shm_name: str
+    length: int
+    columns: tuple[str, ...]
+    index_dtype: str | None  # None => RangeIndex(length)
+    index_tz: str | None = None
+    index_name: str | None = None
+
+    @classmethod
+    def create(cls, candles: pd.DataFrame) -> tuple[SharedCandles, SharedMemory]:
+        """Copy ``candles`` into a new shared memory block owned by the caller."""
+        numeric = candles.select_dtypes(include="number")
+        n = len(candles)
+        index = candles.index
+
+        shm = SharedMemory(create=True, size=max(8 * n * (numeric.shape[1] + 1), 1))
+        index_dtype: str | None = None
+        index_tz: str | None = None
+        if not (isinstance(index, pd.RangeIndex) and index.start == 0 and index.step == 1):
+            if isinstance(index, pd.DatetimeIndex):
+                index_tz = str(index.tz) if index.tz is not None else None
+                values = index.tz_convert(None).to_numpy() if index_tz else index.to_numpy()
+            else:
+                values = index.to_numpy()
+            if values.dtype.itemsize != 8 or values.dtype.kind not in "iufM":
+                shm.close()
+                shm.unlink()
+                raise TypeError(f"Cannot share candle index of dtype {values.dtype}")
+            index_dtype = values.dtype.str
+            np.ndarray((n,), dtype=values.dtype, buffer=shm.buf)[:] = values
+
+        block = np.ndarray((numeric.shape[1], n), dtype=np.float64, buffer=shm.buf, offset=8 * n)
+        for i, col in enumerate(numeric.columns):
+            block[i] = numeric[col].to_numpy(dtype=np.float64)
+
+        spec = cls(
+            shm_name=shm.name,
+            length=n,
+            columns=tuple(str(c) for c in numeric.columns),
+            index_dtype=index_dtype,
+            index_tz=index_tz,
+            index_name=None if index.name is None else str(index.name),
+        )
+        return spec, shm
+
+    def attach(self) -> tuple[pd.DataFrame, SharedMemory]:
+        """Map the block and build a DataFrame over it without copying."""
+        shm = SharedMemory(name=self.shm_name, track=False)
+        n = self.length
+
+        index: pd.Index
+        if self.index_dtype is None:
+            index = pd.RangeIndex(n, name=self.index_name)
+        else:
+            index = pd.Index(np.ndarray((n,), dtype=np.dtype(self.index_dtype), buffer=shm.buf), name=self.index_name)
+            if self.index_tz is not None and isinstance(index, pd.DatetimeIndex):
+                index = index.tz_localize("UTC").tz_convert(self.index_tz)
+
+        block = np.ndarray((len(self.columns), n), dtype=np.float64, buffer=shm.buf, offset=8 * n)
+        block.flags.writeable = False
+        candles = pd.DataFrame({col: block[i] for i, col in enumerate(self.columns)}, index=index, copy=False)
+        return candles, shm
+
+
+def _init_worker(spec: SharedCandles) -> None:
+    global _worker_shm, _worker_candles
+    _worker_candles, _worker_shm = spec.attach()
+
+
+def worker_candles() -> pd.DataFrame:
+    """Candles attached by the current pool worker."""
+    if _worker_candles is None:
+        raise RuntimeError("worker_candles() called outside a shared-candles worker")
+    return _worker_candles
+
+
+def resolve_n_jobs(n_jobs: int | None) -> int:
+    """Normalize ``n_jobs``: None/0/1 => 1 (serial), -1 => all cores, -k => all but k-1."""
+    cpus = os.cpu_count() or 1
+    if not n_jobs:
+        return 1
+    if n_jobs < 0:
+        return max(1, cpus + 1 + n_jobs)
+    return n_jobs
+
+
+def map_over_shared_candles[T, R](
+    candles: pd.DataFrame,
+    fn: Callable[[T], R],
+    tasks: list[T],
+    n_jobs: int,
+) -> list[R]:
+    """Run ``fn(task)`` in a process pool whose workers see ``candles`` via ``worker_candles()``.
+
+    Results come back in task order regardless of completion order. Workers are spawned
+    (not forked) so callers with live threads, e.g. WebSocket feeds, cannot deadlock them.
+    """
+    spec, shm = SharedCandles.create(candles)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=min(n_jobs, len(tasks)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(spec,),
+        ) as pool:
+            return list(pool.map(fn, tasks))
+    finally:
+        shm.close()
+        shm.unlink()
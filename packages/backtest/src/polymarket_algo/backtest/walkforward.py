@@ -0,0 +1,216 @@
+"""Walk-forward optimization over rolling or anchored folds.
+
+Each fold sweeps ``param_grid`` on its train window, then trades the best
+params on the following out-of-sample window; OOS windows are adjacent, so
+their PnL stitches into one equity curve.
+
+The strategy is evaluated once over the full history (per worker) and its
+signal matrices are sliced per fold, so indicator work is shared by all
+overlapping folds instead of repeated per fold. Indicators on each window are
+therefore warmed by earlier candles — no look-ahead for causal strategies.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Literal
+
+import numpy as np
+import pandas as pd
+
+from .engine import (
+    StrategyLike,
+    _evaluate_strategy_output,
+    _grid_param_sets,
+    _iter_signal_batches,
+    _metrics_at,
+    _rank_rows,
+    _signal_arrays,
+    _sweep_chunk_size,
+)
+from .metrics import column_metrics, outcome_up, reduce_metrics, trade_outcomes
+from .parallel import map_over_shared_candles, resolve_n_jobs, worker_candles
+
+type WindowMode = Literal["rolling", "anchored"]
+
+
+@dataclass(frozen=True)
+class WalkForwardFold:
+    """Positional candle bounds of one fold (ends exclusive)."""
+
+    index: int
+    train_start: int
+    train_end: int
+    test_start: int
+    test_end: int
+
+
+@dataclass
+class WalkForwardResult:
+    folds: pd.DataFrame  # one row per fold: window bounds, best params, train_* and test_* metrics
+    metrics: dict[str, Any]  # over the stitched out-of-sample trades
+    oos_pnl_curve: pd.Series
+
+
+def walk_forward_folds(
+    n_candles: int,
+    n_folds: int = 4,
+    mode: WindowMode = "rolling",
+    train_size: int | None = None,
+    test_size: int | None = None,
+) -> list[WalkForwardFold]:
+    """Split ``n_candles`` into ``n_folds`` train/test folds.
+
+    Test windows are ``test_size`` candles, back to back, following the first train
+    window. ``rolling`` slides a ``train_size`` train window along with them;
+    ``anchored`` keeps every train window starting at candle 0. By default the history
+    is divided so each train window is 3x its test window (the 0.75 ratio used by
+    ``walk_forward_split``).
+    """
+    if n_folds < 1:
+        raise ValueError("n_folds must be >= 1")
+    if mode not in ("rolling", "anchored"):
+        raise ValueError(f"Unknown walk-forward mode: {mode!r}")
+
+    test_size = test_size or n_candles // (n_folds + 3)
+    train_size = train_size or 3 * test_size
+    if test_size < 1 or train_size + n_folds * test_size > n_candles:
+        raise ValueError(f"{n_candles} candles cannot hold {n_folds} folds of {train_size}+{test_size}")
+
+    folds: list[WalkForwardFold] = []
+    for i in range(n_folds):
+        test_start = train_size + i * test_size
+        folds.append(
+            WalkForwardFold(
+                index=i,
+                train_start=0 if mode == "anchored" else test_start - train_size,
+                train_end=test_start,
+                test_start=test_start,
+                test_end=test_start + test_size,
+            )
+        )
+    return folds
+
+
+def _run_folds(
+    candles: pd.DataFrame,
+    strategy: StrategyLike,
+    param_sets: list[dict[str, Any]],
+    folds: list[WalkForwardFold],
+    chunk_size: int | None,
+    buy_price: float,
+    win_payout: float,
+) -> list[dict[str, Any]]:
+    # Outcomes come from the full series: a window's last candle is resolved by the
+    # next one, and only the final candle of the dataset stays unresolved.
+    up = outcome_up(candles["close"].to_numpy(dtype=np.float64))
+    candles = candles.iloc[: max(f.test_end for f in folds)]
+    close = candles["close"].to_numpy(dtype=np.float64)
+    chunk_size = chunk_size or _sweep_chunk_size(len(candles), len(param_sets))
+
+    # One pass over the grid scores every fold's train window.
+    fold_rows: list[list[dict[str, Any]]] = [[] for _ in folds]
+    offset = 0
+    for signals, sizes in _iter_signal_batches(candles, strategy, param_sets, chunk_size):
+        for rows, fold in zip(fold_rows, folds, strict=True):
+            window = slice(fold.train_start, fold.train_end)
+            metrics = column_metrics(close[window], signals[window], sizes[window], buy_price, win_payout, up[window])
+            rows.extend({"_param_index": offset + j, **_metrics_at(metrics, j)} for j in range(signals.shape[1]))
+        offset += signals.shape[1]
+
+    oos_signals: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+    results: list[dict[str, Any]] = []
+    for rows, fold in zip(fold_rows, folds, strict=True):
+        best = _rank_rows(rows).iloc[0]
+        param_index = int(best["_param_index"])
+        if param_index not in oos_signals:
+            out = _evaluate_strategy_output(candles, strategy, param_sets[param_index])
+            oos_signals[param_index] = _signal_arrays(out, len(candles))
+        signal_arr, size_arr = oos_signals[param_index]
+
+        window = slice(fold.test_start, fold.test_end)
+        trade_pnl, active, wins = trade_outcomes(
+            close[window], signal_arr[window, None], size_arr[window, None], buy_price, win_payout, up[window]
+        )
+        results.append(
+            {
+                "fold": fold,
+                "params": param_sets[param_index],
+                "train": {
+                    **{k: float(best[k]) for k in ("win_rate", "total_pnl", "max_drawdown", "sharpe_ratio")},
+                    "trade_count": int(best["trade_count"]),  # the ranking frame holds it as float
+                },
+                "test": _metrics_at(reduce_metrics(trade_pnl, active, wins), 0),
+                "trade_pnl": trade_pnl[:, 0],
+                "active": active[:, 0],
+                "wins": wins[:, 0],
+            }
+        )
+    return results
+
+
+def _walk_forward_task(
+    task: tuple[StrategyLike, list[dict[str, Any]], list[WalkForwardFold], int | None, float, float],
+) -> list[dict[str, Any]]:
+    """Pool worker: run a contiguous group of folds against the shared candles."""
+    strategy, param_sets, folds, chunk_size, buy_price, win_payout = task
+    return _run_folds(worker_candles(), strategy, param_sets, folds, chunk_size, buy_price, win_payout)
+
+
+def walk_forward(
+    candles: pd.DataFrame,
+    strategy: StrategyLike,
+    param_grid: dict[str, list[Any]],
+    n_folds: int = 4,
+    mode: WindowMode = "rolling",
+    train_size: int | None = None,
+    test_size: int | None = None,
+    chunk_size: int | None = None,
+    n_jobs: int | None = 1,
+    buy_price: float = 0.50,
+    win_payout: float = 0.95,
+) -> WalkForwardResult:
+    """Walk-forward optimize ``strategy`` over ``param_grid``.
+
+    Folds come from ``walk_forward_folds``. Each train window is ranked like
+    ``parameter_sweep`` (win_rate, then total_pnl) and its best params are backtested
+    on the next test window. ``n_jobs`` > 1 runs contiguous groups of folds in a process
+    pool over shared-memory candles; each worker evaluates the grid once for its group.
+    """
+    folds = walk_forward_folds(len(candles), n_folds, mode, train_size, test_size)
+    param_sets = _grid_param_sets(param_grid)
+    n_jobs = min(resolve_n_jobs(n_jobs), len(folds))
+
+    if n_jobs > 1:
+        groups = [list(group) for group in np.array_split(np.array(folds, dtype=object), n_jobs)]
+        tasks = [(strategy, param_sets, group, chunk_size, buy_price, win_payout) for group in groups]
+        results = [r for part in map_over_shared_candles(candles, _walk_forward_task, tasks, n_jobs) for r in part]
+    else:
+        results = _run_folds(candles, strategy, param_sets, folds, chunk_size, buy_price, win_payout)
+
+    rows: list[dict[str, Any]] = []
+    for r in results:
+        fold: WalkForwardFold = r["fold"]
+        rows.append(
+            {
+                "fold": fold.index,
+                "train_start": candles.index[fold.train_start],
+                "train_end": candles.index[fold.train_end - 1],
+                "test_start": candles.index[fold.test_start],
+                "test_end": candles.index[fold.test_end - 1],
+                **r["params"],
+                **{f"train_{k}": v for k, v in r["train"].items()},
+                **{f"test_{k}": v for k, v in r["test"].items()},
+            }
+        )
+
+    trade_pnl = np.concatenate([r["trade_pnl"] for r in results])
+    active = np.concatenate([r["active"] for r in results])
+    wins = np.concatenate([r["wins"] for r in results])
+    oos_index = candles.index[folds[0].test_start : folds[-1].test_end]
+
+    return WalkForwardResult(
+        folds=pd.DataFrame(rows),
+        metrics=_metrics_at(reduce_metrics(trade_pnl[:, None], active[:, None], wins[:, None]), 0),
+        oos_pnl_curve=pd.Series(np.cumsum(trade_pnl), index=oos_index, name="equity"),
+    )
@@ -5,7 +5,9 @@ from .plugin import PluginRegistry as PluginRegistry
 from .plugin import discover_indicators as discover_indicators
 from .plugin import discover_strategies as discover_strategies
 from .plugin import load_local_plugins as load_local_plugins
+from .types import BatchStrategy as BatchStrategy
 from .types import DataFeed as DataFeed
+from .types import IncrementalStrategy as IncrementalStrategy
 from .types import Indicator as Indicator
 from .types import PriceTick as PriceTick
 from .types import Strategy as Strategy
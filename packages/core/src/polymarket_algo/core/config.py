@@ -58,6 +58,7 @@ class Config:
     WS_USER_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/user"
     WS_RTDS_URL = "wss://ws-live-data.polymarket.com"
     USE_WEBSOCKET: bool = os.getenv("USE_WEBSOCKET", "true").lower() == "true"
+    WS_JSON_DECODER: str = os.getenv("WS_JSON_DECODER", "auto")  # auto, orjson, msgspec or json
 
     # Fast polling mode (1-2s for copytrade)
     FAST_POLL_INTERVAL: float = float(os.getenv("FAST_POLL_INTERVAL", "1.5"))
@@ -65,6 +66,11 @@ class Config:
     # REST client settings
     REST_TIMEOUT: float = float(os.getenv("REST_TIMEOUT", "3"))  # Faster timeout
     REST_RETRIES: int = int(os.getenv("REST_RETRIES", "2"))
+    REST_BACKOFF: float = float(os.getenv("REST_BACKOFF", "0.1"))
+    REST_POOL_CONNECTIONS: int = int(os.getenv("REST_POOL_CONNECTIONS", "10"))  # hosts kept pooled
+    REST_POOL_MAXSIZE: int = int(os.getenv("REST_POOL_MAXSIZE", "20"))  # connections per host
+    # SQLite cache of resolved markets and token IDs, e.g. data/markets.sqlite (opt-in; empty = disabled)
+    MARKET_CACHE_DB: str = os.getenv("MARKET_CACHE_DB", "")
 
     # Trading client settings
     SIGNATURE_TYPE: int = int(os.getenv("SIGNATURE_TYPE", "0"))  # 0=EOA/MetaMask, 1=Magic/proxy
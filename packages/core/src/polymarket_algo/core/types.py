@@ -1,7 +1,8 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterator, Mapping
 from dataclasses import dataclass
 from typing import Any, Protocol, runtime_checkable
 
+import numpy as np
 import pandas as pd
 
 
@@ -23,6 +24,36 @@ class Strategy(Protocol):
     def param_grid(self) -> dict[str, list[Any]]: ...
 
 
+@runtime_checkable
+class BatchStrategy(Protocol):
+    """Optional extension for strategies that can evaluate many param sets at once.
+
+    ``evaluate_batch`` yields one ``(signals, sizes)`` pair per consecutive chunk of
+    ``param_sets``. Both arrays have shape ``(len(candles), len(chunk))`` — one column
+    per param set, in order — and must match what ``evaluate`` returns column by column.
+    """
+
+    def evaluate_batch(
+        self,
+        candles: pd.DataFrame,
+        param_sets: list[dict[str, Any]],
+        chunk_size: int,
+    ) -> Iterator[tuple[np.ndarray, np.ndarray]]: ...
+
+
+@runtime_checkable
+class IncrementalStrategy(Protocol):
+    """Optional extension for strategies that can be advanced one candle at a time.
+
+    ``warmup`` (re)starts the stream with ``params`` and replays historical candles;
+    each ``on_candle`` then returns the ``(signal, size)`` that ``evaluate`` would give
+    for that candle appended to everything seen so far, without re-running the frame.
+    """
+
+    def warmup(self, candles: pd.DataFrame, **params: Any) -> None: ...
+    def on_candle(self, candle: Mapping[str, Any] | pd.Series) -> tuple[int, float]: ...
+
+
 @dataclass
 class PriceTick:
     """Normalized price update from any data feed."""
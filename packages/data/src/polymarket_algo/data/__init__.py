@@ -1,3 +1,13 @@
 from .binance import fetch_klines as fetch_klines
+from .binance import update_klines as update_klines
+from .download import download_klines as download_klines
+from .outcomes import OutcomeStore as OutcomeStore
+from .ratelimit import WeightRateLimiter as WeightRateLimiter
+from .resample import load_resampled as load_resampled
+from .resample import resample_candles as resample_candles
+from .storage import CandleArrays as CandleArrays
+from .storage import open_candles_mmap as open_candles_mmap
+from .storage import partition_paths as partition_paths
 from .storage import read_candles as read_candles
+from .storage import write_candle_partitions as write_candle_partitions
 from .storage import write_candles as write_candles
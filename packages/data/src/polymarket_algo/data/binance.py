@@ -1,21 +1,190 @@
 from __future__ import annotations
 
 import time
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import requests
 
+from .ratelimit import KLINES_WEIGHT, WeightRateLimiter
+from .storage import DEFAULT_ROOT, read_candles, write_candle_partitions
+
 BASE_URL = "https://api.binance.com/api/v3/klines"
 SYMBOLS = ["BTCUSDT", "ETHUSDT"]
 INTERVALS = ["15m", "1h", "4h"]
 START = datetime(2022, 1, 1, tzinfo=UTC)
 MAX_LIMIT = 1000
+# Rows preallocated per fetch before the buffer falls back to geometric growth.
+PREALLOC_ROWS = 16 * MAX_LIMIT
+
+_UNIT_MS = {"s": 1_000, "m": 60_000, "h": 3_600_000, "d": 86_400_000, "w": 604_800_000}
+
+
+def interval_ms(interval: str) -> int:
+    """Length of a Binance kline interval (``"1s"``, ``"15m"``, ``"4h"``, ``"1d"``...) in milliseconds.
+
+    Raises ``ValueError`` for intervals without a fixed length, such as ``"1M"``.
+    """
+    try:
+        return int(interval[:-1]) * _UNIT_MS[interval[-1]]
+    except (KeyError, ValueError):
+        raise ValueError(f"Unsupported interval: {interval!r}") from None
+
+
+KLINE_COLUMNS = [
+    "open_time",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "close_time",
+    "quote_asset_volume",
+    "number_of_trades",
+    "taker_buy_base_asset_volume",
+    "taker_buy_quote_asset_volume",
+]
+# Position of each stored column in a raw kline row (field 11, "ignore", is dropped).
+_INT_FIELDS = {"open_time": 0, "close_time": 6, "number_of_trades": 8}
+_FLOAT_FIELDS = {
+    "open": 1,
+    "high": 2,
+    "low": 3,
+    "close": 4,
+    "volume": 5,
+    "quote_asset_volume": 7,
+    "taker_buy_base_asset_volume": 9,
+    "taker_buy_quote_asset_volume": 10,
+}
+
+
+class KlineBuffer:
+    """Typed column buffers that kline pages are decoded into as they arrive.
+
+    Each column is a preallocated int64/float64 array that grows geometrically, so a
+    multi-million-row history never exists as Python lists or object columns; only one
+    page at a time is transposed.
+    """
+
+    def __init__(self, capacity: int = MAX_LIMIT):
+        capacity = max(capacity, 1)
+        self._columns = {name: np.empty(capacity, dtype=np.int64) for name in _INT_FIELDS}
+        self._columns.update({name: np.empty(capacity, dtype=np.float64) for name in _FLOAT_FIELDS})
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def capacity(self) -> int:
+        return len(self._columns["open_time"])
+
+    def _reserve(self, extra: int) -> None:
+        needed = self.size + extra
+        if needed <= self.capacity:
+            return
+        capacity = max(needed, self.capacity * 2)
+        for name, old in self._columns.items():
+            grown = np.empty(capacity, dtype=old.dtype)
+            grown[: self.size] = old[: self.size]
+            self._columns[name] = grown
+
+    def append(self, rows: list[list]) -> None:
+        """Decode one API page (list of kline rows) into the buffers."""
+        n = len(rows)
+        if not n:
+            return
+        self._reserve(n)
+        fields = list(zip(*rows, strict=False))
+        lo, hi = self.size, self.size + n
+        for name, i in _INT_FIELDS.items():
+            self._columns[name][lo:hi] = fields[i]
+        for name, i in _FLOAT_FIELDS.items():
+            self._columns[name][lo:hi] = np.asarray(fields[i], dtype=np.float64)  # parses the decimal strings
+        self.size = hi
+
+    def extend(self, other: KlineBuffer) -> None:
+        self._reserve(other.size)
+        for name, column in self._columns.items():
+            column[self.size : self.size + other.size] = other._columns[name][: other.size]
+        self.size += other.size
+
+    def to_frame(self) -> pd.DataFrame:
+        """Sorted, de-duplicated (first row wins) frame.
+
+        When the rows are already sorted and unique and the buffer is exactly full, the
+        frame's columns are views of the buffers (no copy); otherwise spare capacity is trimmed.
+        """
+        columns = {name: column[: self.size] for name, column in self._columns.items()}
+        open_time = columns["open_time"]
+        if self.size > 1 and not (np.diff(open_time) > 0).all():
+            order = np.argsort(open_time, kind="stable")
+            ordered = open_time[order]
+            keep = np.empty(len(order), dtype=bool)
+            keep[0] = True
+            np.not_equal(ordered[1:], ordered[:-1], out=keep[1:])
+            columns = {name: column[order[keep]] for name, column in columns.items()}
+        elif self.size < self.capacity:
+            columns = {name: column.copy() for name, column in columns.items()}
+
+        frame = {name: columns[name] for name in KLINE_COLUMNS}
+        frame["open_time"] = pd.to_datetime(columns["open_time"], unit="ms", utc=True)
+        frame["close_time"] = pd.to_datetime(columns["close_time"], unit="ms", utc=True)
+        return pd.DataFrame(frame, columns=KLINE_COLUMNS, copy=False)
+
 
+def fetch_klines(
+    symbol: str,
+    interval: str,
+    start_ms: int,
+    end_ms: int,
+    session: requests.Session | None = None,
+    limiter: WeightRateLimiter | None = None,
+    base_url: str = BASE_URL,
+) -> pd.DataFrame:
+    """Page through ``[start_ms, end_ms]`` (``MAX_LIMIT`` klines per request).
 
-def fetch_klines(symbol: str, interval: str, start_ms: int, end_ms: int) -> pd.DataFrame:
-    rows: list[list] = []
+    Without a ``limiter`` pages are paced with a fixed 100 ms sleep; with one, each
+    request first acquires its weight and the server's used-weight header is fed back.
+    """
+    return fetch_kline_buffer(symbol, interval, start_ms, end_ms, session, limiter, base_url).to_frame()
+
+
+def fetch_kline_buffer(
+    symbol: str,
+    interval: str,
+    start_ms: int,
+    end_ms: int,
+    session: requests.Session | None = None,
+    limiter: WeightRateLimiter | None = None,
+    base_url: str = BASE_URL,
+) -> KlineBuffer:
+    """Fetch ``[start_ms, end_ms]`` page by page straight into a ``KlineBuffer``."""
+    # Size for the range up front (capped at a few pages); the buffer grows if that is short.
+    try:
+        expected = (end_ms - start_ms) // interval_ms(interval) + 1 if end_ms >= start_ms else 0
+    except ValueError:  # e.g. "1M": passed through to Binance, sized as we go
+        expected = MAX_LIMIT
+    buffer = KlineBuffer(min(expected, PREALLOC_ROWS))
+    for page in iter_kline_pages(symbol, interval, start_ms, end_ms, session, limiter, base_url):
+        buffer.append(page)
+    return buffer
+
+
+def iter_kline_pages(
+    symbol: str,
+    interval: str,
+    start_ms: int,
+    end_ms: int,
+    session: requests.Session | None = None,
+    limiter: WeightRateLimiter | None = None,
+    base_url: str = BASE_URL,
+) -> Iterator[list[list]]:
+    """Yield raw kline pages for ``[start_ms, end_ms]`` as returned by the API."""
+    http = session or requests
     cursor = start_ms
 
     while cursor < end_ms:
@@ -26,75 +195,113 @@ def fetch_klines(symbol: str, interval: str, start_ms: int, end_ms: int) -> pd.D
             "endTime": end_ms,
             "limit": MAX_LIMIT,
         }
-        resp = requests.get(BASE_URL, params=params, timeout=30)
+        if limiter is not None:
+            limiter.acquire(KLINES_WEIGHT)
+        resp = http.get(base_url, params=params, timeout=30)
+        if limiter is not None:
+            limiter.observe_used_weight(resp.headers.get("X-MBX-USED-WEIGHT-1M"))
         resp.raise_for_status()
         data = resp.json()
         if not data:
             break
 
-        rows.extend(data)
+        yield data
         last_open_time = data[-1][0]
         if last_open_time <= cursor:
             break
         cursor = last_open_time + 1
-        time.sleep(0.1)
-
-    df = pd.DataFrame(
-        rows,
-        columns=[
-            "open_time",
-            "open",
-            "high",
-            "low",
-            "close",
-            "volume",
-            "close_time",
-            "quote_asset_volume",
-            "number_of_trades",
-            "taker_buy_base_asset_volume",
-            "taker_buy_quote_asset_volume",
-            "ignore",
-        ],
-    )
-    if df.empty:
-        return df
-
-    df = df.drop_duplicates(subset=["open_time"]).sort_values("open_time").reset_index(drop=True)
-    num_cols = [
-        "open",
-        "high",
-        "low",
-        "close",
-        "volume",
-        "quote_asset_volume",
-        "taker_buy_base_asset_volume",
-        "taker_buy_quote_asset_volume",
-    ]
-    for col in num_cols:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
-
-    trades_numeric = pd.to_numeric(df["number_of_trades"], errors="coerce")
-    df["number_of_trades"] = pd.Series(trades_numeric, index=df.index).astype("Int64")
-    df["open_time"] = pd.to_datetime(df["open_time"], unit="ms", utc=True)
-    df["close_time"] = pd.to_datetime(df["close_time"], unit="ms", utc=True)
-    return df
-
-
-def main() -> None:
+        if limiter is None:
+            time.sleep(0.1)
+
+
+def klines_frame(rows: list[list]) -> pd.DataFrame:
+    """Typed, sorted, de-duplicated DataFrame from raw kline rows."""
+    buffer = KlineBuffer(len(rows))
+    buffer.append(rows)
+    return buffer.to_frame()
+
+
+def find_gaps(open_times_ms: np.ndarray, step_ms: int) -> list[tuple[int, int]]:
+    """Missing ``[start_ms, end_ms)`` ranges between consecutive sorted open times."""
+    times = np.asarray(open_times_ms, dtype=np.int64)
+    breaks = np.flatnonzero(np.diff(times) > step_ms)
+    return [(int(times[i]) + step_ms, int(times[i + 1])) for i in breaks]
+
+
+def stored_open_times(symbol: str, interval: str, root: str | Path = DEFAULT_ROOT) -> np.ndarray:
+    """Open times (epoch ms, sorted) already in the partitioned store."""
+    stored = read_candles(symbol, interval, columns=["open_time"], root=root)
+    if stored.empty:
+        return np.empty(0, dtype=np.int64)
+    return pd.DatetimeIndex(stored["open_time"]).as_unit("ms").asi8
+
+
+def update_klines(
+    symbol: str,
+    interval: str,
+    start_ms: int | None = None,
+    end_ms: int | None = None,
+    root: str | Path = DEFAULT_ROOT,
+    backfill_gaps: bool = True,
+) -> pd.DataFrame:
+    """Bring the stored klines for ``symbol``/``interval`` up to date; return the rows fetched.
+
+    An empty store is filled from ``start_ms`` (default ``START``). Otherwise only the
+    tail from the last stored candle onwards is fetched (re-fetching that candle, which
+    may have been stored while still open), plus, with ``backfill_gaps``, any interior
+    holes. Results are merged into the monthly partitions, each replaced atomically,
+    so an interrupted run resumes where it stopped.
+    """
+    step = interval_ms(interval)
+    end_ms = end_ms if end_ms is not None else int(datetime.now(tz=UTC).timestamp() * 1000)
+    stored = stored_open_times(symbol, interval, root)
+
+    if len(stored) == 0:
+        ranges = [(start_ms if start_ms is not None else int(START.timestamp() * 1000), end_ms)]
+    else:
+        ranges = find_gaps(stored, step) if backfill_gaps else []
+        ranges = [(lo, hi - 1) for lo, hi in ranges]  # endTime is inclusive
+        ranges.append((int(stored[-1]), end_ms))
+
+    frames = [df for lo, hi in ranges if lo <= hi and not (df := fetch_klines(symbol, interval, lo, hi)).empty]
+    if not frames:
+        return pd.DataFrame()
+    fetched = pd.concat(frames, ignore_index=True)
+    fetched = fetched.drop_duplicates(subset=["open_time"], keep="last").sort_values("open_time")
+    write_candle_partitions(fetched, symbol, interval, root=root)
+    return fetched.reset_index(drop=True)
+
+
+def main(full: bool = False) -> None:
+    """Update the candle store for ``SYMBOLS`` x ``INTERVALS``.
+
+    By default only missing candles are fetched (see ``update_klines``). ``full=True``
+    refetches everything from ``START`` with the concurrent downloader and also writes
+    the flat ``data/<asset>_<interval>.parquet`` files used by older scripts.
+    """
+    from .download import download_klines  # download builds on this module
+
     start_ms = int(START.timestamp() * 1000)
     end_ms = int(datetime.now(tz=UTC).timestamp() * 1000)
 
     data_dir = Path("data")
     data_dir.mkdir(exist_ok=True)
 
-    for symbol in SYMBOLS:
-        asset = symbol.replace("USDT", "").lower()
-        for interval in INTERVALS:
-            print(f"Fetching {symbol} {interval}...")
-            df = fetch_klines(symbol, interval, start_ms, end_ms)
-            out = data_dir / f"{asset}_{interval}.parquet"
-            df.to_parquet(out, index=False)
-            print(f"Saved {len(df):,} candles -> {out}")
+    if not full:
+        for symbol in SYMBOLS:
+            for interval in INTERVALS:
+                started = time.monotonic()
+                df = update_klines(symbol, interval, start_ms, end_ms)
+                print(f"{symbol} {interval}: {len(df):,} new candles in {time.monotonic() - started:.1f}s")
+        return
+
+    print(f"Fetching {', '.join(SYMBOLS)} x {', '.join(INTERVALS)}...")
+    frames = download_klines([(s, i) for s in SYMBOLS for i in INTERVALS], start_ms, end_ms)
+    for (symbol, interval), df in frames.items():
+        out = data_dir / f"{symbol.replace('USDT', '').lower()}_{interval}.parquet"
+        df.to_parquet(out, index=False)
+        write_candle_partitions(df, symbol, interval)
+        print(f"Saved {len(df):,} candles -> {out}")
 
 
 if __name__ == "__main__":
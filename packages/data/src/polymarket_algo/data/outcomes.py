@@ -0,0 +1,163 @@
+"""Resolved Polymarket BTC 5-minute up/down markets.
+
+One row per resolved ``btc-updown-5m-<timestamp>`` window, stored like candles
+(monthly Parquet partitions, see ``storage``) under
+``<root>/BTC-UPDOWN-5M/5m``. The store is filled incrementally from any
+``fetch_market(timestamp)`` callable returning an object shaped like the
+executor's ``Market`` (``PolymarketClient.get_market``), so this package does not
+depend on the executor.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from .storage import DEFAULT_ROOT, TIME_COLUMN, TimeLike, partition_paths, read_candles, write_candle_partitions
+
+OUTCOME_SYMBOL = "BTC-UPDOWN-5M"
+OUTCOME_INTERVAL = "5m"
+WINDOW_S = 300
+OUTCOME_COLUMNS = [TIME_COLUMN, "timestamp", "outcome", "up_price", "down_price", "volume", "taker_fee_bps"]
+# Windows this recent that are missing or not resolved yet are retried on every update.
+RESOLUTION_GRACE_S = 3600
+
+type MarketFetcher = Callable[[int], Any]
+type BatchMarketFetcher = Callable[[list[int]], Mapping[int, Any]]
+
+
+def outcome_frame(markets: Iterable[Any]) -> pd.DataFrame:
+    """Rows for the resolved markets in ``markets`` (objects with ``Market``'s attributes)."""
+    rows = [
+        (m.timestamp, m.outcome, float(m.up_price), float(m.down_price), float(m.volume or 0.0), int(m.taker_fee_bps))
+        for m in markets
+        if m is not None and m.outcome in ("up", "down")
+    ]
+    df = pd.DataFrame(rows, columns=OUTCOME_COLUMNS[1:])
+    df["timestamp"] = df["timestamp"].astype(np.int64)
+    df["taker_fee_bps"] = df["taker_fee_bps"].astype(np.int64)
+    df.insert(0, TIME_COLUMN, pd.to_datetime(df["timestamp"], unit="s", utc=True))
+    return df
+
+
+class OutcomeStore:
+    """Local history of resolved 5-minute markets."""
+
+    def __init__(self, root: str | Path = DEFAULT_ROOT):
+        self.root = Path(root)
+
+    def read(self, start: TimeLike | None = None, end: TimeLike | None = None) -> pd.DataFrame:
+        """Stored windows with ``start <= open_time < end``, oldest first."""
+        df = read_candles(OUTCOME_SYMBOL, OUTCOME_INTERVAL, start, end, root=self.root)
+        return df if not df.empty else pd.DataFrame(columns=OUTCOME_COLUMNS)
+
+    def first_timestamp(self) -> int | None:
+        """Start of the oldest stored window (epoch seconds)."""
+        files = partition_paths(OUTCOME_SYMBOL, OUTCOME_INTERVAL, root=self.root)
+        if not files:
+            return None
+        return int(pd.read_parquet(files[0], columns=["timestamp"])["timestamp"].min())
+
+    def last_timestamp(self) -> int | None:
+        """Start of the newest stored window (epoch seconds)."""
+        files = partition_paths(OUTCOME_SYMBOL, OUTCOME_INTERVAL, root=self.root)
+        if not files:
+            return None
+        return int(pd.read_parquet(files[-1], columns=["timestamp"])["timestamp"].max())
+
+    def append(self, markets: Iterable[Any]) -> int:
+        """Merge resolved ``markets`` into the store; returns how many rows were written."""
+        df = outcome_frame(markets)
+        write_candle_partitions(df, OUTCOME_SYMBOL, OUTCOME_INTERVAL, root=self.root)
+        return len(df)
+
+    def update(
+        self,
+        fetch_market: MarketFetcher,
+        start_ts: int | None = None,
+        end_ts: int | None = None,
+        pause_s: float = 0.05,
+        fetch_markets: BatchMarketFetcher | None = None,
+    ) -> int:
+        """Fetch the windows in ``[start_ts, end_ts)`` that are not stored yet.
+
+        That is the windows after the newest stored one, those before the oldest when
+        ``start_ts`` reaches further back (an empty store defaults to one day before
+        ``end_ts``), and recent windows missing from the store. Missing or unresolved
+        markets are skipped; while younger than ``RESOLUTION_GRACE_S`` their gap is
+        retried on every update, so one failed lookup does not hold back later windows.
+        With ``fetch_markets`` (e.g. ``PolymarketClient.get_markets``) all windows are
+        requested in one batched call instead of one paced call each. Returns rows
+        written.
+        """
+        now = int(time.time())
+        end_ts = end_ts if end_ts is not None else (now // WINDOW_S) * WINDOW_S
+        start = start_ts - start_ts % WINDOW_S if start_ts is not None else None
+        first, last = self.first_timestamp(), self.last_timestamp()
+        if first is None or last is None:
+            start = start if start is not None else end_ts - 86_400 - end_ts % WINDOW_S
+            windows = list(range(start, end_ts, WINDOW_S))
+        else:
+            windows = list(range(start, first, WINDOW_S)) if start is not None else []
+            recent = max(now - RESOLUTION_GRACE_S, first, start or first)
+            recent += -recent % WINDOW_S  # first window at or after it
+            if recent < last:
+                stored = set(self.read(pd.Timestamp(recent, unit="s", tz="UTC"))["timestamp"].tolist())
+                windows += [w for w in range(recent, min(last, end_ts), WINDOW_S) if w not in stored]
+            windows += range(max(last + WINDOW_S, start or 0), end_ts, WINDOW_S)
+
+        if fetch_markets is not None and windows:
+            batch = fetch_markets(windows)
+            markets: Iterable[Any] = (batch.get(w) for w in windows)
+        else:
+            markets = _paced(fetch_market, windows, pause_s)
+
+        resolved = [m for m in markets if m is not None and m.outcome in ("up", "down")]
+        return self.append(resolved) if resolved else 0
+
+    def recent_outcomes(
+        self,
+        count: int,
+        fetch_market: MarketFetcher,
+        now: int | None = None,
+        fetch_markets: BatchMarketFetcher | None = None,
+    ) -> list[str]:
+        """Last ``count`` outcomes (oldest first) among the ``count + 10`` windows before the current one.
+
+        Only windows not stored yet hit the API (see ``update``); this mirrors
+        ``PolymarketClient.get_recent_outcomes`` without re-walking history each call.
+        """
+        now = now if now is not None else int(time.time())
+        current = (now // WINDOW_S) * WINDOW_S
+        first = current - (count + 10) * WINDOW_S
+        self.update(fetch_market, start_ts=first, end_ts=current, fetch_markets=fetch_markets)
+
+        window = self.read(pd.Timestamp(first, unit="s", tz="UTC"), pd.Timestamp(current, unit="s", tz="UTC"))
+        return window["outcome"].tail(count).tolist()
+
+    def as_candles(self, start: TimeLike | None = None, end: TimeLike | None = None) -> pd.DataFrame:
+        """Outcomes as a candle frame the backtest engine and strategies consume directly.
+
+        Indexed by ``open_time``; ``close`` is a +1/-1 random walk of the outcomes, so
+        ``close[i] > close[i - 1]`` exactly when window ``i`` resolved up (the engine's
+        next-candle rule then scores a signal at ``i`` against market ``i + 1``). The
+        stored prices, volume and fees are kept as extra columns.
+        """
+        df = self.read(start, end)
+        up = (df["outcome"] == "up").to_numpy()
+        out = df.drop(columns=["outcome"]).set_index(TIME_COLUMN)
+        out["up"] = up.astype(np.int64)
+        out["close"] = np.cumsum(np.where(up, 1.0, -1.0))
+        return out
+
+
+def _paced(fetch_market: MarketFetcher, windows: list[int], pause_s: float) -> Iterator[Any]:
+    for i, window in enumerate(windows):
+        if i and pause_s:
+            time.sleep(pause_s)
+        yield fetch_market(window)
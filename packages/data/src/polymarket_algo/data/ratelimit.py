@@ -0,0 +1,56 @@
+"""Thread-safe request-weight limiter for the Binance REST API."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+# Binance spot REQUEST_WEIGHT budget per minute and the weight of one /api/v3/klines call.
+BINANCE_WEIGHT_PER_MINUTE = 6000
+KLINES_WEIGHT = 2
+
+
+class WeightRateLimiter:
+    """Token bucket over request weight, shared by all threads of a download.
+
+    The bucket holds up to ``weight_per_minute * headroom`` units and refills
+    continuously. ``observe_used_weight`` folds in the server's own accounting
+    (``X-MBX-USED-WEIGHT-1M``) so other clients on the same IP are respected.
+    """
+
+    def __init__(self, weight_per_minute: int = BINANCE_WEIGHT_PER_MINUTE, headroom: float = 0.8):
+        self.capacity = weight_per_minute * headroom
+        self._refill_per_s = self.capacity / 60.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.waited_s = 0.0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self._refill_per_s)
+        self._updated = now
+
+    def acquire(self, weight: float = KLINES_WEIGHT) -> None:
+        """Block until ``weight`` units are available, then consume them."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= weight:
+                    self._tokens -= weight
+                    return
+                wait = (weight - self._tokens) / self._refill_per_s
+                self.waited_s += wait
+            time.sleep(wait)
+
+    def observe_used_weight(self, used: int | str | None) -> None:
+        """Clamp the bucket to what the server says is left this minute."""
+        if used is None:
+            return
+        try:
+            remaining = self.capacity - float(used)
+        except ValueError:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, max(remaining, 0.0))
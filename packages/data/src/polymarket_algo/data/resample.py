@@ -0,0 +1,157 @@
+"""Derive coarser candle intervals from the finest one in the store.
+
+``resample_candles`` aggregates OHLCV rows into epoch-aligned buckets (Binance's
+own alignment) with one pass of NumPy ``reduceat`` per column. ``load_resampled``
+serves any interval that a stored one divides evenly: the derived series is cached
+as ``<root>/<SYMBOL>/_derived/<interval>/<source>-<version>.parquet``, where
+``version`` digests the source partitions, so appending to the source
+invalidates the cache without any bookkeeping.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .binance import interval_ms
+from .storage import (
+    DEFAULT_ROOT,
+    TIME_COLUMN,
+    TimeLike,
+    _atomic_write_parquet,
+    _time_column,
+    _to_utc,
+    dataset_version,
+    partition_paths,
+    read_candles,
+)
+
+DERIVED_DIR = "_derived"
+
+# How each kline column folds into a coarser bucket; other columns are dropped.
+AGGREGATIONS = {
+    "open": "first",
+    "high": "max",
+    "low": "min",
+    "close": "last",
+    "volume": "sum",
+    "quote_asset_volume": "sum",
+    "number_of_trades": "sum",
+    "taker_buy_base_asset_volume": "sum",
+    "taker_buy_quote_asset_volume": "sum",
+}
+_MONDAY_MS = 4 * 86_400_000  # the epoch is a Thursday; weekly klines open on Monday
+
+
+def resample_candles(df: pd.DataFrame, interval: str, drop_incomplete: bool = False) -> pd.DataFrame:
+    """Aggregate candles sorted by ``open_time`` into ``interval`` buckets.
+
+    ``close_time`` (if present) becomes the bucket's last millisecond, as Binance
+    reports it. With ``drop_incomplete`` buckets missing any source candle (e.g. the
+    still-open last one) are dropped; the source interval is inferred from the data.
+    """
+    step = interval_ms(interval)
+    origin = _MONDAY_MS if interval.endswith("w") else 0
+    times = pd.DatetimeIndex(_time_column(df[TIME_COLUMN])).as_unit("ms").asi8
+    if len(times) == 0:
+        return df.iloc[:0].copy()
+
+    buckets = (times - origin) // step
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(times)] - 1
+
+    out: dict[str, np.ndarray] = {TIME_COLUMN: buckets[starts] * step + origin}
+    for name, how in AGGREGATIONS.items():
+        if name not in df.columns:
+            continue
+        values = df[name].to_numpy()
+        if how == "first":
+            out[name] = values[starts]
+        elif how == "last":
+            out[name] = values[ends]
+        elif how == "max":
+            out[name] = np.maximum.reduceat(values, starts)
+        elif how == "min":
+            out[name] = np.minimum.reduceat(values, starts)
+        else:
+            out[name] = np.add.reduceat(values, starts)
+    if "close_time" in df.columns:
+        out["close_time"] = out[TIME_COLUMN] + step - 1
+
+    if drop_incomplete and len(times) > 1:
+        source_step = int(np.diff(times).min())
+        complete = (ends - starts + 1) * source_step >= step
+        out = {name: values[complete] for name, values in out.items()}
+
+    result = pd.DataFrame(out, columns=[c for c in df.columns if c in out])
+    result[TIME_COLUMN] = pd.to_datetime(result[TIME_COLUMN], unit="ms", utc=True)
+    if "close_time" in result.columns:
+        result["close_time"] = pd.to_datetime(result["close_time"], unit="ms", utc=True)
+    return result
+
+
+def stored_intervals(symbol: str, root: str | Path = DEFAULT_ROOT) -> list[str]:
+    """Intervals with at least one partition for ``symbol``, finest first."""
+    directory = Path(root) / symbol.upper()
+    if not directory.is_dir():
+        return []
+    found = []
+    for child in directory.iterdir():
+        try:
+            step = interval_ms(child.name)
+        except ValueError:
+            continue
+        if partition_paths(symbol, child.name, root=root):
+            found.append((step, child.name))
+    return [name for _, name in sorted(found)]
+
+
+def source_interval(symbol: str, interval: str, root: str | Path = DEFAULT_ROOT) -> str | None:
+    """Finest stored interval that ``interval`` can be built from, or None."""
+    step = interval_ms(interval)
+    for candidate in stored_intervals(symbol, root):
+        if step % interval_ms(candidate) == 0:
+            return candidate
+    return None
+
+
+def load_resampled(
+    symbol: str,
+    interval: str,
+    start: TimeLike | None = None,
+    end: TimeLike | None = None,
+    root: str | Path = DEFAULT_ROOT,
+) -> pd.DataFrame:
+    """Candles for ``symbol`` at ``interval``, derived from the store when not stored natively.
+
+    Returns rows with ``start <= open_time < end``. Raises ``ValueError`` when no
+    stored interval divides ``interval`` (e.g. ``5m`` with only ``15m`` on disk).
+    """
+    source = source_interval(symbol, interval, root)
+    if source is None:
+        raise ValueError(f"No stored interval for {symbol} that {interval} can be derived from")
+    if source == interval:
+        return read_candles(symbol, interval, start, end, root=root)
+
+    version = dataset_version(partition_paths(symbol, source, root=root))
+    cache_dir = Path(root) / symbol.upper() / DERIVED_DIR / interval
+    cached = cache_dir / f"{source}-{version}.parquet"
+    if cached.exists():
+        derived = pd.read_parquet(cached)
+    else:
+        derived = resample_candles(read_candles(symbol, source, root=root), interval)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        _atomic_write_parquet(derived, cached)
+        for stale in cache_dir.glob("*.parquet"):
+            if stale != cached:
+                stale.unlink(missing_ok=True)
+
+    start_ts, end_ts = _to_utc(start), _to_utc(end)
+    mask = np.ones(len(derived), dtype=bool)
+    if start_ts is not None:
+        mask &= (derived[TIME_COLUMN] >= start_ts).to_numpy()
+    if end_ts is not None:
+        mask &= (derived[TIME_COLUMN] < end_ts).to_numpy()
+    return derived[mask].reset_index(drop=True) if not mask.all() else derived
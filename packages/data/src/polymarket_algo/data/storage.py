@@ -1,19 +1,328 @@
+"""Candle storage.
+
+Two layouts are supported:
+
+* single files (``write_candles(df, path)`` / ``read_candles(path)``), CSV or Parquet;
+* a partitioned Parquet dataset, one file per month under
+  ``<root>/<SYMBOL>/<interval>/<YYYY-MM>.parquet``. ``read_candles(symbol, interval,
+  start, end, columns=...)`` only opens the months overlapping ``[start, end)`` and
+  pushes the time predicate and column projection down into Parquet, so a query
+  over one quarter never materializes the full history.
+
+Either layout can also be opened as read-only memory-mapped NumPy columns
+(``open_candles_mmap``), backed by a ``.npy``-per-column sidecar cache. Every
+process mapping the same sidecar shares one page-cache copy of the data.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+DEFAULT_ROOT = Path("data") / "candles"
+TIME_COLUMN = "open_time"
+SIDECAR_SUFFIX = ".mmap"
+_DATASET_SIDECAR = "_mmap"
+_SIDECAR_INDEX = "index.json"
+
+type TimeLike = str | datetime | pd.Timestamp
+
 
+def write_candles(df: pd.DataFrame, path: str | Path, mmap_sidecar: bool = False) -> None:
+    """Write ``df`` to a CSV/Parquet file.
 
-def write_candles(df: pd.DataFrame, path: str | Path) -> None:
+    ``open_candles_mmap`` builds the memory-map sidecar on first open; pass
+    ``mmap_sidecar=True`` to build it now instead (``df`` then needs a time axis).
+    """
+    if mmap_sidecar and not _has_time_axis(df):
+        raise ValueError(f"Candles need an {TIME_COLUMN!r} column or a DatetimeIndex")
     p = Path(path)
     p.parent.mkdir(parents=True, exist_ok=True)
     if p.suffix == ".csv":
         df.to_csv(p, index=False)
     else:
         df.to_parquet(p, index=False)
+    if mmap_sidecar:
+        _write_sidecar(df, _sidecar_dir(p), _file_version(p))
 
 
-def read_candles(path: str | Path) -> pd.DataFrame:
-    p = Path(path)
-    if p.suffix == ".csv":
-        return pd.read_csv(p)
-    return pd.read_parquet(p)
+def read_candles(
+    path_or_symbol: str | Path,
+    interval: str | None = None,
+    start: TimeLike | None = None,
+    end: TimeLike | None = None,
+    columns: list[str] | None = None,
+    root: str | Path = DEFAULT_ROOT,
+) -> pd.DataFrame:
+    """Read candles from a single file, or from the partitioned dataset.
+
+    ``read_candles(path)`` reads one CSV/Parquet file as before. With an ``interval``
+    the first argument is a symbol and the dataset under ``root`` is queried: rows with
+    ``start <= open_time < end`` (naive times are UTC), sorted by ``open_time``.
+    ``columns`` restricts the columns read; ``open_time`` is always included.
+    """
+    if interval is None:
+        p = Path(path_or_symbol)
+        if p.suffix == ".csv":
+            return pd.read_csv(p, usecols=columns)
+        return pd.read_parquet(p, columns=columns)
+
+    symbol = str(path_or_symbol)
+    wanted = None if columns is None else list(dict.fromkeys([TIME_COLUMN, *columns]))
+    start_ts, end_ts = _to_utc(start), _to_utc(end)
+
+    files = partition_paths(symbol, interval, start_ts, end_ts, root)
+    if not files:
+        return pd.DataFrame(columns=wanted or [TIME_COLUMN])
+
+    dataset = ds.dataset([str(f) for f in files], format="parquet")
+    time_type = dataset.schema.field(TIME_COLUMN).type
+    predicate = None
+    if start_ts is not None:
+        predicate = pc.field(TIME_COLUMN) >= pa.scalar(start_ts.to_pydatetime(), type=time_type)
+    if end_ts is not None:
+        upper = pc.field(TIME_COLUMN) < pa.scalar(end_ts.to_pydatetime(), type=time_type)
+        predicate = upper if predicate is None else predicate & upper
+
+    # Partitions are disjoint, sorted months and each file is sorted, so file order is time order.
+    table = dataset.to_table(columns=wanted, filter=predicate)
+    return table.to_pandas()
+
+
+def dataset_dir(symbol: str, interval: str, root: str | Path = DEFAULT_ROOT) -> Path:
+    return Path(root) / symbol.upper() / interval
+
+
+def partition_paths(
+    symbol: str,
+    interval: str,
+    start: TimeLike | None = None,
+    end: TimeLike | None = None,
+    root: str | Path = DEFAULT_ROOT,
+) -> list[Path]:
+    """Existing monthly partitions overlapping ``[start, end)``, oldest first."""
+    directory = dataset_dir(symbol, interval, root)
+    if not directory.is_dir():
+        return []
+    start_ts, end_ts = _to_utc(start), _to_utc(end)
+    first = _month_key(start_ts) if start_ts is not None else None
+    last = _month_key(end_ts - pd.Timedelta(1, "ns")) if end_ts is not None else None
+    return [
+        p
+        for p in sorted(directory.glob("????-??.parquet"))
+        if (first is None or p.stem >= first) and (last is None or p.stem <= last)
+    ]
+
+
+def write_candle_partitions(
+    df: pd.DataFrame,
+    symbol: str,
+    interval: str,
+    root: str | Path = DEFAULT_ROOT,
+) -> list[Path]:
+    """Merge ``df`` into the monthly partitions of ``symbol``/``interval``.
+
+    Rows are de-duplicated on ``open_time`` (new rows win) and each touched month is
+    rewritten atomically (temp file + rename), so readers never see a partial file.
+    Returns the partitions written.
+    """
+    if df.empty:
+        return []
+    df = df.copy()
+    df[TIME_COLUMN] = _time_column(df[TIME_COLUMN])
+
+    directory = dataset_dir(symbol, interval, root)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    written: list[Path] = []
+    months = df[TIME_COLUMN].dt.year * 100 + df[TIME_COLUMN].dt.month
+    for month, part in df.groupby(months, sort=True):
+        path = directory / f"{int(month) // 100:04d}-{int(month) % 100:02d}.parquet"
+        if path.exists():
+            part = pd.concat([pd.read_parquet(path), part], ignore_index=True)
+        part = part.drop_duplicates(subset=[TIME_COLUMN], keep="last").sort_values(TIME_COLUMN)
+        _atomic_write_parquet(part.reset_index(drop=True), path)
+        written.append(path)
+    return written
+
+
+@dataclass(frozen=True)
+class CandleArrays(Mapping[str, np.ndarray]):
+    """Read-only candle columns, usually memory-mapped from a sidecar.
+
+    ``open_time`` is ``datetime64[ns]`` (UTC); every other numeric column keeps its
+    stored int64/float64 dtype. Behaves as a mapping of column name to array.
+    """
+
+    open_time: np.ndarray
+    columns: dict[str, np.ndarray]
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        if name == TIME_COLUMN:
+            return self.open_time
+        return self.columns[name]
+
+    def __iter__(self) -> Iterator[str]:
+        yield TIME_COLUMN
+        yield from self.columns
+
+    def __len__(self) -> int:
+        return len(self.columns) + 1
+
+    @property
+    def length(self) -> int:
+        return len(self.open_time)
+
+    def to_frame(self) -> pd.DataFrame:
+        """DataFrame indexed by ``open_time`` whose columns are views of the arrays."""
+        index = pd.DatetimeIndex(self.open_time, name=TIME_COLUMN).tz_localize("UTC")
+        return pd.DataFrame(self.columns, index=index, copy=False)
+
+
+def open_candles_mmap(
+    path_or_symbol: str | Path,
+    interval: str | None = None,
+    columns: list[str] | None = None,
+    root: str | Path = DEFAULT_ROOT,
+) -> CandleArrays:
+    """Memory-map candles from a single file or the partitioned dataset.
+
+    Arguments select the source as in ``read_candles``. The sidecar lives next to it
+    (``<file>.mmap/`` or ``<dataset>/_mmap/``) in a subdirectory named after the
+    source's version (size and mtime of its files); if that version is missing it is
+    built once from the source, so after an append the next call rebuilds it and the
+    old version is removed (mappings already open in other processes stay valid).
+    """
+    if interval is None:
+        source = Path(path_or_symbol)
+        directory, version = _sidecar_dir(source), _file_version(source)
+        load = partial(read_candles, source)
+    else:
+        files = partition_paths(str(path_or_symbol), interval, root=root)
+        if not files:
+            raise FileNotFoundError(f"No stored candles for {path_or_symbol} {interval} under {root}")
+        directory, version = files[0].parent / _DATASET_SIDECAR, dataset_version(files)
+        load = partial(read_candles, str(path_or_symbol), interval, root=root)
+
+    target = directory / version
+    if not (target / _SIDECAR_INDEX).exists():
+        _write_sidecar(load(), directory, version)
+
+    index = json.loads((target / _SIDECAR_INDEX).read_text())
+    names = index["columns"] if columns is None else [c for c in columns if c != TIME_COLUMN]
+    missing = set(names) - set(index["columns"])
+    if missing:
+        raise KeyError(f"Columns not in candle sidecar: {sorted(missing)}")
+    return CandleArrays(
+        open_time=np.load(target / f"{TIME_COLUMN}.npy", mmap_mode="r"),
+        columns={name: np.load(target / f"{name}.npy", mmap_mode="r") for name in names},
+    )
+
+
+def dataset_version(files: list[Path]) -> str:
+    """Short digest of the partition files' names, sizes and mtimes."""
+    digest = hashlib.sha1()
+    for f in files:
+        st = f.stat()
+        digest.update(f"{f.name}:{st.st_size}:{st.st_mtime_ns};".encode())
+    return digest.hexdigest()[:16]
+
+
+def _file_version(path: Path) -> str:
+    st = path.stat()
+    return f"{st.st_size:x}-{st.st_mtime_ns:x}"
+
+
+def _sidecar_dir(path: Path) -> Path:
+    return path.with_name(path.name + SIDECAR_SUFFIX)
+
+
+def _has_time_axis(df: pd.DataFrame) -> bool:
+    return TIME_COLUMN in df.columns or isinstance(df.index, pd.DatetimeIndex)
+
+
+def _write_sidecar(df: pd.DataFrame, directory: Path, version: str) -> Path:
+    """Write ``df`` as ``<column>.npy`` files plus ``index.json`` under ``directory/version``.
+
+    The version directory is built under a temporary name and renamed into place, so a
+    reader either finds a complete sidecar or none. Stale versions are removed.
+    """
+    if TIME_COLUMN in df.columns:
+        open_time = _time_column(df[TIME_COLUMN])
+    elif isinstance(df.index, pd.DatetimeIndex):
+        open_time = pd.Series(df.index if df.index.tz is not None else df.index.tz_localize("UTC"))
+    else:
+        raise ValueError(f"Candles need an {TIME_COLUMN!r} column or a DatetimeIndex")
+    times = open_time.dt.tz_convert("UTC").dt.tz_localize(None).to_numpy(dtype="datetime64[ns]")
+
+    arrays = {TIME_COLUMN: times}
+    for name in df.columns:
+        values = df[name]
+        if name == TIME_COLUMN or not pd.api.types.is_numeric_dtype(values) or pd.api.types.is_bool_dtype(values):
+            continue
+        as_int = pd.api.types.is_integer_dtype(values) and not values.isna().any()
+        arrays[str(name)] = values.to_numpy(np.int64) if as_int else values.to_numpy(np.float64, na_value=np.nan)
+
+    directory.mkdir(parents=True, exist_ok=True)
+    target = directory / version
+    staging = Path(tempfile.mkdtemp(dir=directory, prefix=f".{version}."))
+    try:
+        for name, values in arrays.items():
+            np.save(staging / f"{name}.npy", np.ascontiguousarray(values))
+        index = {"version": version, "rows": len(times), "columns": [c for c in arrays if c != TIME_COLUMN]}
+        (staging / _SIDECAR_INDEX).write_text(json.dumps(index))
+        try:
+            os.rename(staging, target)
+        except OSError:  # another process published this version first
+            if not (target / _SIDECAR_INDEX).exists():
+                raise
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+    for stale in directory.iterdir():
+        if stale.name != version and not stale.name.startswith("."):
+            shutil.rmtree(stale, ignore_errors=True)
+    return target
+
+
+def _atomic_write_parquet(df: pd.DataFrame, path: Path) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _time_column(values: pd.Series) -> pd.Series:
+    if pd.api.types.is_numeric_dtype(values):
+        return pd.to_datetime(values, unit="ms", utc=True)
+    return pd.to_datetime(values, utc=True)
+
+
+def _to_utc(value: TimeLike | None) -> pd.Timestamp | None:
+    if value is None:
+        return None
+    ts = pd.Timestamp(value)
+    return ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
+
+
+def _month_key(ts: pd.Timestamp) -> str:
+    return f"{ts.year:04d}-{ts.month:02d}"
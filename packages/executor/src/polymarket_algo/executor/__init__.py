@@ -1,8 +1,10 @@
 from .blockchain import OnChainTxData, PolygonscanClient
 from .client import DelayImpactModel, Market, PolymarketClient
 from .feed import PolymarketDataFeed
+from .market_store import MarketStore, shared_market_store
 from .resilience import CircuitBreaker, HealthCheck, RateLimiter
 from .trader import LiveTrader, PaperTrader, Trade, TradingState
+from .transport import PooledTransport, TransportConfig, shared_transport
 from .ws import MarketDataCache, PolymarketWebSocket, UserWebSocket
 
 __all__ = [
@@ -22,4 +24,9 @@ __all__ = [
     "OnChainTxData",
     "PolygonscanClient",
     "PolymarketDataFeed",
+    "PooledTransport",
+    "TransportConfig",
+    "shared_transport",
+    "MarketStore",
+    "shared_market_store",
 ]
@@ -0,0 +1,163 @@
+"""asyncio counterpart of ``PolymarketClient`` for market, orderbook and fee lookups.
+
+Built on aiohttp (already pulled in by web3). It is meant to run on the event loop
+``PolymarketWebSocket`` drives (see ``PolymarketWebSocket.submit``), so the lookups a
+signal needs go out concurrently instead of one after another::
+
+    market, book, fee = await asyncio.gather(
+        client.get_market(ts), client.get_orderbook(token_id), client.get_fee_rate(token_id)
+    )
+
+Parsing, caching and the book walk are shared with the blocking client.
+"""
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+from polymarket_algo.core.config import Config
+
+from .client import Market, _MarketCache, execution_price_from_book, market_slug, parse_market_event
+
+if TYPE_CHECKING:
+    from .market_store import MarketStore
+
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+DEFAULT_FEE_BPS = 1000  # Fallback: 10% base rate (typical Polymarket fee)
+
+
+class AsyncPolymarketClient(_MarketCache):
+    """Read-only asyncio client for Polymarket APIs (no auth needed).
+
+    The aiohttp session is created lazily on the loop that first uses it and is
+    closed by ``close()`` / ``async with``. Pool limits, retries and backoff follow
+    the same ``Config.REST_*`` settings as the blocking transport.
+    """
+
+    def __init__(
+        self,
+        timeout: float | None = None,
+        use_cache: bool = True,
+        session: aiohttp.ClientSession | None = None,
+        market_store: "MarketStore | None" = None,
+    ):
+        self.gamma = Config.GAMMA_API
+        self.clob = Config.CLOB_API
+        self.timeout = timeout or Config.REST_TIMEOUT
+        self._session = session
+        self._own_session = session is None
+        self._init_caches(use_cache, market_store)
+
+    async def __aenter__(self) -> "AsyncPolymarketClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._own_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    @property
+    def stats(self) -> dict:
+        """Cache hit/miss/eviction counters."""
+        return self.cache_stats
+
+    def _http(self) -> aiohttp.ClientSession:
+        if self._session is None:
+            connector = aiohttp.TCPConnector(
+                limit=Config.REST_POOL_CONNECTIONS * Config.REST_POOL_MAXSIZE,
+                limit_per_host=Config.REST_POOL_MAXSIZE,
+                keepalive_timeout=30,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={"User-Agent": "PolymarketBot/2.0", "Accept": "application/json"},
+            )
+        return self._session
+
+    async def _get_json(self, url: str, params: Any = None) -> Any:
+        """GET with retries on 429/5xx and exponential backoff."""
+        for attempt in range(Config.REST_RETRIES + 1):
+            async with self._http().get(url, params=params) as resp:
+                if resp.status in _RETRY_STATUSES and attempt < Config.REST_RETRIES:
+                    await asyncio.sleep(Config.REST_BACKOFF * 2**attempt)
+                    continue
+                resp.raise_for_status()
+                return await resp.json(content_type=None)
+
+    async def get_market(self, timestamp: int, use_cache: bool = True) -> Market | None:
+        """Fetch a BTC 5-min market by its timestamp."""
+        if use_cache and self._use_cache:
+            cached = self._cached_market(timestamp)
+            if cached is not None:
+                return cached
+
+        slug = market_slug(timestamp)
+        try:
+            data = await self._get_json(f"{self.gamma}/events", {"slug": slug})
+            if not data:
+                return None
+            market = parse_market_event(timestamp, data[0])
+            if market is None:
+                return None
+            if self._needs_persist(market):
+                await asyncio.to_thread(self._persist, market)  # keep SQLite off the event loop
+            return self._remember(market, persist=False)
+        except TimeoutError:
+            return None
+        except Exception as e:
+            print(f"[polymarket] Error fetching {slug}: {e}")
+            return None
+
+    async def get_orderbook(self, token_id: str) -> dict:
+        """Get order book for a token."""
+        try:
+            return await self._get_json(f"{self.clob}/book", {"token_id": token_id})
+        except TimeoutError:
+            return {}
+        except Exception as e:
+            print(f"[polymarket] Error fetching orderbook: {e}")
+            return {}
+
+    async def get_orderbooks(self, token_ids: list[str]) -> dict[str, dict]:
+        """Get several order books: the batch endpoint if available, else concurrent single requests."""
+        try:
+            books = await self._get_json(f"{self.clob}/books", {"token_ids": ",".join(token_ids)})
+            if books:
+                return books
+        except Exception:
+            pass
+
+        books = await asyncio.gather(*(self.get_orderbook(tid) for tid in token_ids))
+        return {tid: book for tid, book in zip(token_ids, books, strict=True) if book}
+
+    async def get_midpoint(self, token_id: str) -> float | None:
+        """Get midpoint price for a token."""
+        try:
+            data = await self._get_json(f"{self.clob}/midpoint", {"token_id": token_id})
+            return float(data.get("mid", 0.5))
+        except TimeoutError:
+            return None
+        except Exception as e:
+            print(f"[polymarket] Error fetching midpoint: {e}")
+            return None
+
+    async def get_fee_rate(self, token_id: str) -> int:
+        """Get fee rate in basis points for a token (``DEFAULT_FEE_BPS`` on failure)."""
+        try:
+            data = await self._get_json(f"{self.clob}/fee-rate", {"token_id": token_id})
+            return int(data.get("base_fee", DEFAULT_FEE_BPS))
+        except TimeoutError:
+            return DEFAULT_FEE_BPS
+        except Exception as e:
+            print(f"[polymarket] Error fetching fee rate: {e}, using default {DEFAULT_FEE_BPS} bps")
+            return DEFAULT_FEE_BPS
+
+    async def get_execution_price(
+        self, token_id: str, side: str, amount_usd: float, copy_delay_ms: int = 0
+    ) -> tuple[float, float, float, float, float, dict | None]:
+        """Execution price with slippage; same result tuple as ``PolymarketClient.get_execution_price``."""
+        return execution_price_from_book(await self.get_orderbook(token_id), side, amount_usd, copy_delay_ms)
@@ -0,0 +1,83 @@
+"""Bounded TTL + LRU cache for REST lookups.
+
+Entries carry their own expiry (absolute wall-clock time, or None for values that
+never change), the least recently used entry is evicted once ``maxsize`` is
+reached, and hit/miss/eviction/expiry counters are kept for ``stats``.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+
+
+class TTLCache[K: Hashable, V]:
+    """Thread-safe bounded LRU whose entries expire individually."""
+
+    def __init__(self, maxsize: int = 1024, clock: Callable[[], float] = time.time):
+        self.maxsize = maxsize
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[V, float | None]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: K) -> V | None:
+        """Return the live value for ``key`` (marking it recently used), else None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at = entry
+            if expires_at is not None and self._clock() >= expires_at:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: K, value: V, ttl: float | None = None) -> None:
+        """Store ``value`` for ``ttl`` seconds (None = until evicted)."""
+        if self.maxsize <= 0:
+            return
+        expires_at = None if ttl is None else self._clock() + ttl
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: K) -> V | None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            return None if entry is None else entry[0]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = self.expirations = 0
+
+    @property
+    def stats(self) -> dict:
+        """Get cache statistics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
@@ -2,13 +2,41 @@
 
 import json
 import math
+import sqlite3
 import time
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import partial
+from typing import TYPE_CHECKING
 
+import numpy as np
 import requests
 from polymarket_algo.core.config import Config
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+
+from .cache import TTLCache
+from .messages import parse_book
+from .orderbook import BookSide, CachedOrderBook
+from .transport import PooledTransport, shared_transport
+
+if TYPE_CHECKING:
+    from polymarket_algo.data.outcomes import OutcomeStore
+
+    from .market_store import MarketStore
+
+# Gamma /events accepts repeated ``slug`` params; windows per batched lookup.
+GAMMA_SLUGS_PER_REQUEST = 20
+GAMMA_FALLBACK_WORKERS = 8
+
+# Cache bounds: roughly 3.5 days of 5-min windows for markets, 7 days for token IDs.
+MARKET_CACHE_SIZE = 1024
+TOKEN_CACHE_SIZE = 2048
+UNRESOLVED_MARKET_TTL_S = 15
+
+
+def market_slug(timestamp: int) -> str:
+    """Gamma slug of the BTC 5-min up/down market starting at ``timestamp``."""
+    return f"btc-updown-5m-{timestamp}"
 
 
 @dataclass
@@ -110,52 +138,171 @@ class Market:
     resolved: bool = False  # True when umaResolutionStatus == "resolved"
 
 
-class PolymarketClient:
+def parse_market_event(timestamp: int, event: dict) -> Market | None:
+    """Parse a Gamma ``/events`` entry for the window starting at ``timestamp``."""
+    markets = event.get("markets", [])
+    if not markets:
+        return None
+
+    slug = market_slug(timestamp)
+    m = markets[0]
+    # Parse token IDs
+    token_ids = json.loads(m.get("clobTokenIds", "[]"))
+    up_token = token_ids[0] if len(token_ids) > 0 else None
+    down_token = token_ids[1] if len(token_ids) > 1 else None
+
+    # Parse prices
+    prices = json.loads(m.get("outcomePrices", "[0.5, 0.5]"))
+    up_price = float(prices[0]) if prices else 0.5
+    down_price = float(prices[1]) if len(prices) > 1 else 0.5
+
+    # Determine outcome if resolved
+    # A market is truly resolved when:
+    # 1. closed=true AND
+    # 2. umaResolutionStatus="resolved" (or outcomePrices shows 1.0/0.0)
+    outcome = None
+    is_closed = m.get("closed", False)
+    uma_status = m.get("umaResolutionStatus", "")
+    is_resolved = uma_status == "resolved"
+
+    if is_closed and (is_resolved or up_price > 0.99 or down_price > 0.99):
+        # Use threshold comparison to handle float precision
+        if up_price > 0.99:
+            outcome = "up"
+        elif down_price > 0.99:
+            outcome = "down"
+
+    # Extract fee rate from market data (already in Gamma response); 10% base fee if absent
+    taker_fee_bps = m.get("takerBaseFee")
+    taker_fee_bps = 1000 if taker_fee_bps is None else int(taker_fee_bps)
+
+    return Market(
+        timestamp=timestamp,
+        slug=slug,
+        title=event.get("title", ""),
+        closed=event.get("closed", False) or m.get("closed", False),
+        outcome=outcome,
+        up_token_id=up_token,
+        down_token_id=down_token,
+        up_price=up_price,
+        down_price=down_price,
+        volume=event.get("volume", 0),
+        accepting_orders=m.get("acceptingOrders", False),
+        taker_fee_bps=taker_fee_bps,
+        resolved=is_resolved,
+    )
+
+
+class _MarketCache:
+    """Token ID and market caches shared by the sync and async clients.
+
+    Market entries live as long as their lifecycle stage allows: an open market until
+    its window ends, a closed but unresolved one for ``UNRESOLVED_MARKET_TTL_S``, a
+    resolved one until evicted. Token IDs never change. Both caches are LRU-bounded.
+    Token IDs and newly resolved markets are also written through to ``market_store``
+    (once each) so they survive restarts.
+    """
+
+    def _init_caches(self, use_cache: bool, market_store: "MarketStore | None" = None) -> None:
+        from .market_store import shared_market_store
+
+        # Token ID cache for BTC 5-min markets: timestamp -> (up_token, down_token)
+        self._token_cache: TTLCache[int, tuple[str | None, str | None]] = TTLCache(TOKEN_CACHE_SIZE)
+        self._market_cache: TTLCache[int, Market] = TTLCache(MARKET_CACHE_SIZE)
+        self._use_cache = use_cache
+        # Persistent cache of resolved markets (None when Config.MARKET_CACHE_DB is empty)
+        self.market_store = market_store if market_store is not None else shared_market_store()
+
+    def _cached_market(self, timestamp: int) -> Market | None:
+        """Return the cached market for ``timestamp`` if it has not expired, else the stored resolved one."""
+        market = self._market_cache.get(timestamp)
+        if market is None and self.market_store is not None:
+            market = self.market_store.get_market(timestamp)
+            if market is not None:
+                self._token_cache.put(timestamp, (market.up_token_id, market.down_token_id))
+                self._market_cache.put(timestamp, market)
+        return market
+
+    def _cached_token_ids(self, timestamp: int) -> tuple[str | None, str | None] | None:
+        cached = self._token_cache.get(timestamp)
+        if cached is None and self.market_store is not None:
+            cached = self.market_store.get_token_ids(timestamp)
+            if cached is not None:
+                self._token_cache.put(timestamp, cached)
+        return cached
+
+    @staticmethod
+    def _market_ttl(market: Market, now: float) -> float | None:
+        if market.closed and market.outcome:
+            return None  # Resolved markets are final - safe to cache until evicted
+        market_end = market.timestamp + 300  # 5-min window ends 300s after start
+        if not market.closed and now < market_end:
+            return market_end - now  # Prices are reasonably fresh until the window ends
+        return UNRESOLVED_MARKET_TTL_S  # Resolution pending - re-check soon
+
+    def _remember(self, market: Market, persist: bool = True) -> Market:
+        # Cache token IDs (these never change)
+        self._token_cache.put(market.timestamp, (market.up_token_id, market.down_token_id))
+        if self._use_cache:
+            self._market_cache.put(market.timestamp, market, self._market_ttl(market, time.time()))
+        if persist and self._needs_persist(market):
+            self._persist(market)
+        return market
+
+    def _needs_persist(self, market: Market) -> bool:
+        return self.market_store is not None and self.market_store.wants(market)
+
+    def _persist(self, market: Market) -> None:
+        if self.market_store is None:
+            return
+        try:
+            self.market_store.put_market(market)
+        except sqlite3.Error as e:
+            print(f"[polymarket] Market store write failed: {e}")
+
+    @property
+    def cache_stats(self) -> dict:
+        stats = {"market_cache": self._market_cache.stats, "token_cache": self._token_cache.stats}
+        if self.market_store is not None:
+            stats["market_store"] = self.market_store.stats
+        return stats
+
+
+class PolymarketClient(_MarketCache):
     """Read-only client for Polymarket APIs (no auth needed).
 
     Features:
-    - Connection pooling for better performance
+    - Connection pooling shared process-wide (see ``transport``)
     - Configurable timeouts and retries
+    - Per-endpoint latency histograms in ``stats``
     - Token ID caching for BTC 5-min markets
     """
 
-    def __init__(self, timeout: float | None = None, use_cache: bool = True):
+    def __init__(
+        self,
+        timeout: float | None = None,
+        use_cache: bool = True,
+        outcome_store: "OutcomeStore | None" = None,
+        transport: PooledTransport | None = None,
+        market_store: "MarketStore | None" = None,
+    ):
         self.gamma = Config.GAMMA_API
         self.clob = Config.CLOB_API
         self.timeout = timeout or Config.REST_TIMEOUT
 
-        # Create session with connection pooling
-        self.session = requests.Session()
-
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=Config.REST_RETRIES,
-            backoff_factor=0.1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET"],
-        )
+        # Pooled, retrying transport shared with the other REST clients in this process;
+        # it has the same get() signature as requests.Session and times every request
+        self.transport = transport or shared_transport()
+        self.session = self.transport
 
-        # Configure connection pooling
-        adapter = HTTPAdapter(
-            pool_connections=20,
-            pool_maxsize=20,
-            max_retries=retry_strategy,
-        )
-        self.session.mount("https://", adapter)
-
-        self.session.headers.update(
-            {
-                "User-Agent": "PolymarketBot/2.0",
-                "Accept": "application/json",
-                "Connection": "keep-alive",
-            }
-        )
+        self._init_caches(use_cache, market_store)
+        # Local history of resolved windows; get_recent_outcomes only fetches what it lacks
+        self.outcome_store = outcome_store
 
-        # Token ID cache for BTC 5-min markets: timestamp -> (up_token, down_token)
-        self._token_cache: dict[int, tuple[str | None, str | None]] = {}
-        self._market_cache: dict[int, Market] = {}
-        self._cache_ttl = 300  # 5 minutes
-        self._use_cache = use_cache
+    @property
+    def stats(self) -> dict:
+        """Transport counters and latency histograms, plus cache hit/miss/eviction counters."""
+        return {**self.transport.stats, **self.cache_stats}
 
     def get_market(self, timestamp: int, use_cache: bool = True) -> Market | None:
         """Fetch a BTC 5-min market by its timestamp.
@@ -165,96 +312,19 @@ class PolymarketClient:
             use_cache: Whether to use cached market data (for token IDs)
         """
         # Check cache first (for recently fetched markets)
-        if use_cache and self._use_cache and timestamp in self._market_cache:
-            cached = self._market_cache[timestamp]
-            # Only return cached if:
-            # 1. Market is fully resolved (outcome known) - state is final
-            # 2. OR market is still well within its window (prices stable)
-            now = int(time.time())
-            market_end = timestamp + 300  # 5-min window ends 300s after start
-
-            if cached.closed and cached.outcome:
-                # Resolved markets are final - safe to cache forever
-                return cached
-            elif now < market_end:
-                # Market still in window - cache is reasonably fresh
+        if use_cache and self._use_cache:
+            cached = self._cached_market(timestamp)
+            if cached is not None:
                 return cached
-            # Otherwise, market may have closed/resolved - fetch fresh data
 
-        slug = f"btc-updown-5m-{timestamp}"
+        slug = market_slug(timestamp)
         try:
             resp = self.session.get(f"{self.gamma}/events", params={"slug": slug}, timeout=self.timeout)
             resp.raise_for_status()
             data = resp.json()
             if not data:
                 return None
-
-            event = data[0]
-            markets = event.get("markets", [])
-            if not markets:
-                return None
-
-            m = markets[0]
-            # Parse token IDs
-            token_ids = json.loads(m.get("clobTokenIds", "[]"))
-            up_token = token_ids[0] if len(token_ids) > 0 else None
-            down_token = token_ids[1] if len(token_ids) > 1 else None
-
-            # Cache token IDs (these never change)
-            self._token_cache[timestamp] = (up_token, down_token)
-
-            # Parse prices
-            prices = json.loads(m.get("outcomePrices", "[0.5, 0.5]"))
-            up_price = float(prices[0]) if prices else 0.5
-            down_price = float(prices[1]) if len(prices) > 1 else 0.5
-
-            # Determine outcome if resolved
-            # A market is truly resolved when:
-            # 1. closed=true AND
-            # 2. umaResolutionStatus="resolved" (or outcomePrices shows 1.0/0.0)
-            outcome = None
-            is_closed = m.get("closed", False)
-            uma_status = m.get("umaResolutionStatus", "")
-            is_resolved = uma_status == "resolved"
-
-            if is_closed and (is_resolved or up_price > 0.99 or down_price > 0.99):
-                # Use threshold comparison to handle float precision
-                if up_price > 0.99:
-                    outcome = "up"
-                elif down_price > 0.99:
-                    outcome = "down"
-
-            # Extract fee rate from market data (already in Gamma response)
-            taker_fee_bps = m.get("takerBaseFee")
-            if taker_fee_bps is None:
-                taker_fee_bps = 1000
-                # Only log once per market
-                if timestamp not in self._token_cache:
-                    print(f"[polymarket] No takerBaseFee in response for {slug}, using default {taker_fee_bps} bps")
-            else:
-                taker_fee_bps = int(taker_fee_bps)
-
-            market = Market(
-                timestamp=timestamp,
-                slug=slug,
-                title=event.get("title", ""),
-                closed=event.get("closed", False) or m.get("closed", False),
-                outcome=outcome,
-                up_token_id=up_token,
-                down_token_id=down_token,
-                up_price=up_price,
-                down_price=down_price,
-                volume=event.get("volume", 0),
-                accepting_orders=m.get("acceptingOrders", False),
-                taker_fee_bps=taker_fee_bps,
-                resolved=is_resolved,
-            )
-
-            # Cache market
-            if self._use_cache:
-                self._market_cache[timestamp] = market
-
-            return market
+            return self._market_from_event(timestamp, data[0])
         except requests.exceptions.Timeout:
             # Don't spam logs for timeouts
             return None
@@ -262,13 +332,73 @@ class PolymarketClient:
             print(f"[polymarket] Error fetching {slug}: {e}")
             return None
 
+    def get_markets(self, timestamps: Iterable[int], use_cache: bool = True) -> dict[int, Market]:
+        """Fetch many BTC 5-min markets with as few Gamma requests as possible.
+
+        Cached markets are served first; the rest are requested ``GAMMA_SLUGS_PER_REQUEST``
+        slugs per ``/events`` call. Chunks whose batch request fails (or where Gamma
+        only honored one slug) fall back to concurrent single requests over the pooled
+        session. Both caches are filled along the way.
+
+        Returns: timestamp -> Market for every market found
+        """
+        markets: dict[int, Market] = {}
+        wanted: list[int] = []
+        for ts in dict.fromkeys(timestamps):
+            cached = self._cached_market(ts) if use_cache and self._use_cache else None
+            if cached is not None:
+                markets[ts] = cached
+            else:
+                wanted.append(ts)
+
+        retry: list[int] = []
+        for i in range(0, len(wanted), GAMMA_SLUGS_PER_REQUEST):
+            chunk = wanted[i : i + GAMMA_SLUGS_PER_REQUEST]
+            events = self._get_events_by_slug([market_slug(ts) for ts in chunk])
+            if events is None or (len(chunk) > 1 and len(events) <= 1):
+                retry.extend(ts for ts in chunk if market_slug(ts) not in (events or {}))
+                events = events or {}
+            for ts in chunk:
+                event = events.get(market_slug(ts))
+                market = self._market_from_event(ts, event) if event else None
+                if market is not None:
+                    markets[ts] = market
+
+        if retry:
+            fetch_fresh = partial(self.get_market, use_cache=False)
+            with ThreadPoolExecutor(max_workers=min(GAMMA_FALLBACK_WORKERS, len(retry))) as pool:
+                for ts, market in zip(retry, pool.map(fetch_fresh, retry), strict=True):
+                    if market is not None:
+                        markets[ts] = market
+        return markets
+
+    def _get_events_by_slug(self, slugs: list[str]) -> dict[str, dict] | None:
+        """One ``/events`` request for several slugs; None if the request failed."""
+        try:
+            resp = self.session.get(
+                f"{self.gamma}/events",
+                params=[("slug", slug) for slug in slugs],
+                timeout=self.timeout,
+            )
+            resp.raise_for_status()
+            return {event.get("slug"): event for event in resp.json() or []}
+        except Exception as e:
+            print(f"[polymarket] Batch event lookup failed ({len(slugs)} slugs): {e}")
+            return None
+
+    def _market_from_event(self, timestamp: int, event: dict) -> Market | None:
+        """Parse a Gamma event into a Market and fill the token/market caches."""
+        market = parse_market_event(timestamp, event)
+        return self._remember(market) if market is not None else None
+
     def get_token_ids(self, timestamp: int) -> tuple[str | None, str | None]:
         """Get cached token IDs for a market, fetching if needed.
 
         Returns: (up_token_id, down_token_id)
         """
-        if timestamp in self._token_cache:
-            return self._token_cache[timestamp]
+        cached = self._cached_token_ids(timestamp)
+        if cached is not None:
+            return cached
 
         # Fetch market to populate cache
         market = self.get_market(timestamp)
@@ -281,11 +411,7 @@ class PolymarketClient:
 
         Returns number of successfully fetched markets.
         """
-        success = 0
-        for ts in timestamps:
-            if self.get_market(ts) is not None:
-                success += 1
-        return success
+        return len(self.get_markets(timestamps))
 
     def get_upcoming_market_timestamps(self, count: int = 5) -> list[int]:
         """Get timestamps of upcoming BTC 5-min windows.
@@ -297,23 +423,21 @@ class PolymarketClient:
         return [current_window + (i * 300) for i in range(count)]
 
     def get_recent_outcomes(self, count: int = 10) -> list[str]:
-        """Get the last N resolved market outcomes (oldest first)."""
+        """Get the last N resolved market outcomes (oldest first).
+
+        With an ``outcome_store`` the outcomes come from the store, which is first
+        topped up with the windows it does not have yet.
+        """
+        if self.outcome_store is not None:
+            return self.outcome_store.recent_outcomes(count, self.get_market, fetch_markets=self.get_markets)
+
         now = int(time.time())
         current_window = (now // 300) * 300
-        outcomes: list[str] = []
-
-        # Walk backwards from the most recent completed window
-        ts = current_window - 300  # previous window (should be resolved or resolving)
-        attempts = 0
-        max_attempts = count + 10  # some buffer for missing markets
 
-        while len(outcomes) < count and attempts < max_attempts:
-            market = self.get_market(ts)
-            if market and market.closed and market.outcome:
-                outcomes.append(market.outcome)
-            ts -= 300
-            attempts += 1
-            time.sleep(0.05)
+        # Most recent completed window first, with some buffer for missing markets
+        windows = [current_window - 300 * (i + 1) for i in range(count + 10)]
+        markets = self.get_markets(windows)
+        outcomes = [m.outcome for ts in windows if (m := markets.get(ts)) and m.closed and m.outcome][:count]
 
         # Reverse so oldest is first
         outcomes.reverse()
@@ -470,105 +594,87 @@ class PolymarketClient:
             - delay_impact_pct: Additional price impact from copy delay
             - delay_breakdown: Detailed breakdown of delay model calculation (or None)
         """
-        book = self.get_orderbook(token_id)
-        if not book:
-            return (0.5, 0.0, 0.0, 100.0, 0.0, None)
-
-        # Get best bid/ask for spread calculation
-        bids = book.get("bids", [])
-        asks = book.get("asks", [])
-
-        if not bids or not asks:
-            return (0.5, 0.0, 0.0, 100.0, 0.0, None)
+        return execution_price_from_book(self.get_orderbook(token_id), side, amount_usd, copy_delay_ms)
 
-        # Sort: asks ascending (lowest first), bids descending (highest first)
-        asks_sorted = sorted(asks, key=lambda x: float(x["price"]))
-        bids_sorted = sorted(bids, key=lambda x: float(x["price"]), reverse=True)
+    def get_execution_curve(
+        self, token_id: str, side: str, amounts: Sequence[float]
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Price several order sizes against one ``/book`` fetch.
 
-        best_ask = float(asks_sorted[0]["price"])
-        best_bid = float(bids_sorted[0]["price"])
-        spread = best_ask - best_bid
-
-        # Calculate depth at best price level
-        if side == "BUY":
-            # Depth at best ask
-            best_level = asks_sorted[0]
-            depth_at_best = float(best_level["price"]) * float(best_level["size"])
-            levels = asks_sorted
-        else:
-            # Depth at best bid
-            best_level = bids_sorted[0]
-            depth_at_best = float(best_level["price"]) * float(best_level["size"])
-            levels = bids_sorted
-
-        remaining_usd = amount_usd
-        total_shares = 0.0
-        total_cost = 0.0
-
-        for level in levels:
-            price = float(level["price"])
-            size = float(level["size"])
-            level_value = price * size  # USD value at this level
-
-            if remaining_usd <= 0:
-                break
-
-            if level_value >= remaining_usd:
-                # This level can fill the rest
-                shares_to_take = remaining_usd / price
-                total_shares += shares_to_take
-                total_cost += remaining_usd
-                remaining_usd = 0
-            else:
-                # Take entire level
-                total_shares += size
-                total_cost += level_value
-                remaining_usd -= level_value
+        Returns: (execution_price, slippage_pct, fill_pct) arrays, as ``CachedOrderBook.execution_curve``
+        (no copy-delay impact).
+        """
+        book = CachedOrderBook(token_id)
+        book.update_from_snapshot(self.get_orderbook(token_id))
+        return book.execution_curve(side, amounts)
 
-        # Calculate fill percentage
-        filled_amount = amount_usd - remaining_usd
-        fill_pct = (filled_amount / amount_usd * 100) if amount_usd > 0 else 100.0
 
-        if total_shares == 0:
-            midpoint = (best_ask + best_bid) / 2
-            return (midpoint, spread, 0.0, 0.0, 0.0, None)
+def execution_price_from_book(
+    book: dict, side: str, amount_usd: float, copy_delay_ms: int = 0
+) -> tuple[float, float, float, float, float, dict | None]:
+    """Price ``amount_usd`` against a CLOB ``/book`` response; see ``PolymarketClient.get_execution_price``.
 
-        execution_price = total_cost / total_shares
+    The book is loaded into ``BookSide``s, so the fill is a bisect over cumulative depth.
+    """
+    if not book:
+        return (0.5, 0.0, 0.0, 100.0, 0.0, None)
+
+    msg = parse_book(book)
+    bids, asks = BookSide(descending=True, levels=msg.bids), BookSide(levels=msg.asks)
+    if not bids or not asks:
+        return (0.5, 0.0, 0.0, 100.0, 0.0, None)
+
+    best_ask = asks[0].price
+    best_bid = bids[0].price
+    spread = best_ask - best_bid
+
+    # Depth at the best price level on the side we take from
+    levels = asks if side == "BUY" else bids
+    depth_at_best = levels[0].price * levels[0].size
+
+    total_shares, filled_amount = levels.fill(amount_usd)
+    fill_pct = (filled_amount / amount_usd * 100) if amount_usd > 0 else 100.0
+
+    if total_shares == 0:
+        midpoint = (best_ask + best_bid) / 2
+        return (midpoint, spread, 0.0, 0.0, 0.0, None)
+
+    execution_price = filled_amount / total_shares
+
+    # Calculate slippage vs best price
+    if side == "BUY":
+        slippage_pct = (execution_price - best_ask) / best_ask * 100 if best_ask > 0 else 0
+    else:
+        slippage_pct = (best_bid - execution_price) / best_bid * 100 if best_bid > 0 else 0
+
+    # Calculate copy delay price impact using the improved model
+    delay_impact_pct = 0.0
+    delay_breakdown = None
+
+    if copy_delay_ms > 0:
+        delay_model = DelayImpactModel()
+        delay_impact_pct, delay_breakdown = delay_model.calculate_impact(
+            delay_ms=copy_delay_ms,
+            order_size=amount_usd,
+            depth_at_best=depth_at_best,
+            spread=spread,
+            side=side,
+        )
 
-        # Calculate slippage vs best price
+        # Apply delay impact to execution price
         if side == "BUY":
-            slippage_pct = (execution_price - best_ask) / best_ask * 100 if best_ask > 0 else 0
+            execution_price *= 1 + delay_impact_pct / 100
         else:
-            slippage_pct = (best_bid - execution_price) / best_bid * 100 if best_bid > 0 else 0
-
-        # Calculate copy delay price impact using the improved model
-        delay_impact_pct = 0.0
-        delay_breakdown = None
-
-        if copy_delay_ms > 0:
-            delay_model = DelayImpactModel()
-            delay_impact_pct, delay_breakdown = delay_model.calculate_impact(
-                delay_ms=copy_delay_ms,
-                order_size=amount_usd,
-                depth_at_best=depth_at_best,
-                spread=spread,
-                side=side,
-            )
-
-            # Apply delay impact to execution price
-            if side == "BUY":
-                execution_price *= 1 + delay_impact_pct / 100
-            else:
-                execution_price *= 1 - delay_impact_pct / 100
-
-            # Cap execution price at reasonable bounds
-            execution_price = max(0.01, min(0.99, execution_price))
-
-        return (
-            execution_price,
-            spread,
-            max(0, slippage_pct),
-            fill_pct,
-            delay_impact_pct,
-            delay_breakdown,
-        )
+            execution_price *= 1 - delay_impact_pct / 100
+
+        # Cap execution price at reasonable bounds
+        execution_price = max(0.01, min(0.99, execution_price))
+
+    return (
+        execution_price,
+        spread,
+        max(0, slippage_pct),
+        fill_pct,
+        delay_impact_pct,
+        delay_breakdown,
+    )
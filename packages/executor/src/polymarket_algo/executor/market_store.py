@@ -0,0 +1,138 @@
+"""Persistent SQLite cache of resolved markets and token IDs.
+
+Resolved markets never change, so once seen they are kept on disk and survive
+restarts; ``PolymarketClient`` checks here before asking Gamma. The database is
+opened lazily (WAL mode, so several bot processes can share it) and every access
+is serialized on one connection. Rows this process has already seen on disk are
+remembered, so re-fetching an open market does not rewrite its tokens.
+"""
+
+import sqlite3
+import threading
+from collections.abc import Iterable
+from dataclasses import astuple, fields
+from pathlib import Path
+
+from polymarket_algo.core.config import Config
+
+from .client import Market
+
+_MARKET_FIELDS = [f.name for f in fields(Market)]
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS markets ({", ".join(_MARKET_FIELDS)}, PRIMARY KEY (timestamp));
+CREATE TABLE IF NOT EXISTS tokens (timestamp INTEGER PRIMARY KEY, up_token_id TEXT, down_token_id TEXT);
+"""
+
+
+class MarketStore:
+    """On-disk store for resolved ``Market`` rows and token ID pairs, keyed by window timestamp."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._known_markets: set[int] = set()  # timestamps whose resolved row is on disk
+        self._known_tokens: set[int] = set()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def get_market(self, timestamp: int, market_type: type = Market) -> Market | None:
+        """Stored resolved market for ``timestamp``, built as ``market_type`` (any dataclass with ``Market``'s fields)."""
+        with self._lock:
+            row = self._db().execute("SELECT * FROM markets WHERE timestamp = ?", (timestamp,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._known_markets.add(timestamp)
+            self._known_tokens.add(timestamp)
+        market = market_type(*row)
+        market.closed, market.accepting_orders, market.resolved = (
+            bool(market.closed),
+            bool(market.accepting_orders),
+            bool(market.resolved),
+        )
+        return market
+
+    def get_token_ids(self, timestamp: int) -> tuple[str | None, str | None] | None:
+        with self._lock:
+            row = (
+                self._db()
+                .execute("SELECT up_token_id, down_token_id FROM tokens WHERE timestamp = ?", (timestamp,))
+                .fetchone()
+            )
+            if row is not None:
+                self._known_tokens.add(timestamp)
+        return None if row is None else (row[0], row[1])
+
+    def wants(self, market: Market) -> bool:
+        """Whether ``put_market`` would write anything: tokens not stored yet, or a newly resolved market."""
+        resolved = market.closed and market.outcome
+        return market.timestamp not in self._known_tokens or bool(
+            resolved and market.timestamp not in self._known_markets
+        )
+
+    def put_markets(self, markets: Iterable[Market]) -> int:
+        """Store token IDs and resolved rows not already on disk; returns resolved rows written."""
+        markets = list(markets)
+        resolved = [astuple(m) for m in markets if m.closed and m.outcome and m.timestamp not in self._known_markets]
+        tokens = [
+            (m.timestamp, m.up_token_id, m.down_token_id) for m in markets if m.timestamp not in self._known_tokens
+        ]
+        if not tokens and not resolved:
+            return 0
+        placeholders = ", ".join("?" * len(_MARKET_FIELDS))
+        with self._lock:
+            db = self._db()
+            with db:  # one transaction
+                db.execute("BEGIN")
+                db.executemany("INSERT OR REPLACE INTO tokens VALUES (?, ?, ?)", tokens)
+                db.executemany(f"INSERT OR REPLACE INTO markets VALUES ({placeholders})", resolved)
+            self._known_tokens.update(row[0] for row in tokens)
+            self._known_markets.update(row[0] for row in resolved)
+            self.writes += len(resolved)
+        return len(resolved)
+
+    def put_market(self, market: Market) -> None:
+        self.put_markets([market])
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db().execute("SELECT COUNT(*) FROM markets").fetchone()[0]
+
+    @property
+    def stats(self) -> dict:
+        """Get store statistics."""
+        return {"path": str(self.path), "hits": self.hits, "misses": self.misses, "writes": self.writes}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_shared: dict[str, MarketStore] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_market_store() -> MarketStore | None:
+    """Process-wide store at ``Config.MARKET_CACHE_DB`` (None when that is empty, i.e. disabled)."""
+    path = Config.MARKET_CACHE_DB
+    if not path:
+        return None
+    with _shared_lock:
+        if path not in _shared:
+            _shared[path] = MarketStore(path)
+        return _shared[path]
@@ -0,0 +1,232 @@
+"""Decoding of market-channel WebSocket frames into typed messages.
+
+Frames are parsed straight from bytes by the fastest JSON backend available
+(orjson, an executor dependency, then msgspec, then the stdlib; ``Config.WS_JSON_DECODER``
+or ``set_json_decoder`` pins one) and turned into slotted message structs with prices
+and sizes already converted to float, once, at the edge of the feed. The typed parse
+only pays for itself with a native decoder: on the stdlib alone it is slower than the
+old dict handler.
+
+Both price_change layouts are understood: the per-asset ``changes`` list and the
+per-market ``price_changes`` list (split into one message per asset).
+"""
+
+import json
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from polymarket_algo.core.config import Config
+
+
+@dataclass(slots=True)
+class PriceChange:
+    """One level change; ``best_bid``/``best_ask`` are the server's top of book after it, when sent."""
+
+    side: str
+    price: float
+    size: float
+    best_bid: float | None = None
+    best_ask: float | None = None
+
+
+@dataclass(slots=True)
+class BookMessage:
+    """Full order book snapshot (``book`` event or REST ``/book`` response)."""
+
+    asset_id: str
+    market: str = ""
+    timestamp: int = 0  # server time, ms
+    hash: str = ""
+    bids: list[tuple[float, float]] = field(default_factory=list)
+    asks: list[tuple[float, float]] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class PriceChangeMessage:
+    """Order book delta for one asset."""
+
+    asset_id: str
+    market: str = ""
+    timestamp: int = 0
+    hash: str = ""
+    changes: list[PriceChange] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class LastTradeMessage:
+    """Trade print (``last_trade_price`` event)."""
+
+    asset_id: str
+    market: str
+    price: float
+    size: float
+    side: str
+    timestamp: float | None = None
+
+
+type MarketMessage = BookMessage | PriceChangeMessage | LastTradeMessage
+
+
+def _stdlib_loads(raw: bytes | str) -> Any:
+    # json.loads(bytes) works but sniffs the encoding first; decoding here is cheaper
+    return json.loads(raw.decode() if isinstance(raw, bytes) else raw)
+
+
+def _backends() -> dict[str, Callable[[bytes | str], Any]]:
+    backends: dict[str, Callable[[bytes | str], Any]] = {}
+    try:
+        import orjson
+
+        backends["orjson"] = orjson.loads  # raises orjson.JSONDecodeError, a ValueError
+    except ImportError:
+        pass
+    try:
+        import msgspec
+
+        decoder = msgspec.json.Decoder()
+
+        def _msgspec_loads(raw: bytes | str) -> Any:
+            try:
+                return decoder.decode(raw)
+            except msgspec.DecodeError as e:
+                raise ValueError(str(e)) from e
+
+        backends["msgspec"] = _msgspec_loads
+    except ImportError:
+        pass
+    backends["json"] = _stdlib_loads
+    return backends
+
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = _backends()
+_loads: Callable[[bytes | str], Any] = _stdlib_loads
+json_decoder = "json"
+
+
+def set_json_decoder(name: str = "auto") -> str:
+    """Select the JSON backend ("auto", "orjson", "msgspec" or "json"); returns the one in use."""
+    global _loads, json_decoder
+    if name == "auto":
+        name = next(iter(BACKENDS))
+    if name not in BACKENDS:
+        raise ValueError(f"JSON decoder {name!r} is not available (installed: {', '.join(BACKENDS)})")
+    _loads, json_decoder = BACKENDS[name], name
+    return name
+
+
+# Why the configured decoder isn't in use, if it isn't; logged once by log_decoder_notice()
+_decoder_notice: str | None = None
+try:
+    set_json_decoder(Config.WS_JSON_DECODER)
+except ValueError as e:
+    _decoder_notice = f"{e}; using {set_json_decoder()}"
+if _decoder_notice is None and json_decoder == "json" and Config.WS_JSON_DECODER != "json":
+    _decoder_notice = "orjson is not installed; decoding frames with the slower stdlib json"
+
+
+def log_decoder_notice() -> None:
+    """Log the decoder fallback picked at import, once (the feeds call this on connect)."""
+    global _decoder_notice
+    if _decoder_notice is not None:
+        logger.warning(_decoder_notice)
+        _decoder_notice = None
+
+
+def loads(raw: bytes | str) -> Any:
+    """Parse a JSON frame with the selected backend; raises ``ValueError`` on malformed input."""
+    return _loads(raw)
+
+
+def _levels(levels: list[dict]) -> list[tuple[float, float]]:
+    return [(float(level["price"]), float(level["size"])) for level in levels]
+
+
+def _timestamp(data: dict) -> int:
+    try:
+        return int(data.get("timestamp") or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _change(data: dict) -> PriceChange:
+    # Positional construction and inline conversions: this runs for every delta
+    best_bid = data.get("best_bid")
+    best_ask = data.get("best_ask")
+    return PriceChange(
+        data.get("side", ""),
+        float(data.get("price", 0)),
+        float(data.get("size", 0)),
+        float(best_bid) if best_bid else None,
+        float(best_ask) if best_ask else None,
+    )
+
+
+def parse_book(data: dict) -> BookMessage:
+    """Build a ``BookMessage`` from a ``book`` event or REST ``/book`` payload."""
+    return BookMessage(
+        asset_id=data.get("asset_id", ""),
+        market=data.get("market", ""),
+        timestamp=_timestamp(data),
+        hash=data.get("hash", ""),
+        bids=_levels(data.get("bids", [])),
+        asks=_levels(data.get("asks", [])),
+    )
+
+
+def parse_price_change(data: dict) -> list[PriceChangeMessage]:
+    """One ``PriceChangeMessage`` per asset touched by a ``price_change`` event."""
+    if "price_changes" not in data:
+        return [
+            PriceChangeMessage(
+                data.get("asset_id", ""),
+                data.get("market", ""),
+                _timestamp(data),
+                data.get("hash", ""),
+                [_change(c) for c in data.get("changes", [])],
+            )
+        ]
+    by_asset: dict[str, PriceChangeMessage] = {}
+    for c in data["price_changes"]:
+        asset_id = c.get("asset_id", "")
+        msg = by_asset.get(asset_id)
+        if msg is None:
+            msg = by_asset[asset_id] = PriceChangeMessage(asset_id, data.get("market", ""), _timestamp(data))
+        msg.changes.append(_change(c))
+        msg.hash = c.get("hash", msg.hash)
+    return list(by_asset.values())
+
+
+def parse_message(data: dict) -> list[MarketMessage | dict]:
+    """Typed messages for one decoded event; other event types come back as the raw dict."""
+    msg_type = data.get("type", data.get("event_type", ""))
+    if msg_type == "book":
+        return [parse_book(data)]
+    if msg_type == "price_change":
+        return list(parse_price_change(data))
+    if msg_type == "last_trade_price":
+        timestamp = data.get("timestamp")
+        return [
+            LastTradeMessage(
+                asset_id=data.get("asset_id", ""),
+                market=data.get("market", ""),
+                price=float(data.get("price", 0)),
+                size=float(data.get("size", 0)),
+                side=data.get("side", "BUY"),
+                timestamp=float(timestamp) if timestamp is not None else None,
+            )
+        ]
+    return [data]
+
+
+def decode_messages(raw: bytes | str) -> list[MarketMessage | dict]:
+    """Decode a frame (a single event or a JSON array of events) into messages."""
+    data = loads(raw)
+    if isinstance(data, list):
+        return [msg for item in data if isinstance(item, dict) for msg in parse_message(item)]
+    if isinstance(data, dict):
+        return parse_message(data)
+    return []
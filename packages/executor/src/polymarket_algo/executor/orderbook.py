@@ -0,0 +1,423 @@
+"""Price-level order book kept by integer tick.
+
+Polymarket prices sit on a 0.01 or 0.001 grid, so each level is keyed by
+``round(price * TICKS_PER_UNIT)``: no float-epsilon matching, an O(1) dict lookup
+to change an existing level, a bisect insert for a new one, and the best level is
+always at index 0 of its side (no re-sorting after each ``price_change``).
+
+Each published side carries running notional and share depth over its levels,
+built on the first pricing query and shared by the live book and its snapshot, so
+the VWAP fill for any USD amount is a bisect instead of a walk over the levels.
+Memory and rebuild cost scale with the number of levels, not the tick grid.
+
+Only the feed thread mutates a ``CachedOrderBook``. After every change it publishes
+an immutable ``BookSnapshot`` in ``view`` (a single attribute store, atomic for
+readers), so trading threads price orders against a consistent book without
+taking the feed's lock. Levels are immutable and shared between snapshots, so
+publishing copies only level references.
+"""
+
+import bisect
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from itertools import accumulate
+from typing import NamedTuple
+
+import numpy as np
+
+from .messages import BookMessage, PriceChange, PriceChangeMessage, parse_book, parse_price_change
+
+# 0.0001 resolution: finer than any Polymarket tick size.
+TICKS_PER_UNIT = 10_000
+
+
+def price_to_tick(price: float) -> int:
+    return round(price * TICKS_PER_UNIT)
+
+
+class OrderBookLevel(NamedTuple):
+    """Single price level in orderbook (immutable; a size change replaces the level)."""
+
+    price: float
+    size: float
+
+
+class SideDepth:
+    """One immutable tuple of levels (best first) and its running depth.
+
+    The prefix sums are not maintained incrementally: a delta usually lands near the
+    top of the book, so patching them would cost O(n) per update even with no reader.
+    They are rebuilt lazily instead, in O(n) on the first query after a change, and
+    shared by every query (and every ``BookSnapshot``) until the side changes again.
+    ``cumulative`` holds (running notional, running shares); ``arrays`` the same
+    prefix sums with the prices as NumPy arrays, for vectorized curves.
+    """
+
+    __slots__ = ("levels", "cumulative", "arrays")
+
+    def __init__(self, levels: tuple[OrderBookLevel, ...]):
+        self.levels = levels
+        self.cumulative: tuple[list[float], list[float]] | None = None
+        self.arrays: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None
+
+    def running(self) -> tuple[list[float], list[float]]:
+        """(running notional, running shares), built on first use."""
+        cumulative = self.cumulative
+        if cumulative is None:  # benign race: concurrent readers build identical lists
+            levels = self.levels
+            cumulative = self.cumulative = (
+                list(accumulate(lv.price * lv.size for lv in levels)),
+                list(accumulate(lv.size for lv in levels)),
+            )
+        return cumulative
+
+    def fill(self, amount_usd: float) -> tuple[float, float]:
+        """``(shares, usd)`` filled by sweeping ``amount_usd`` from the best level (O(log n)).
+
+        ``usd`` is less than ``amount_usd`` only when the side is too thin.
+        """
+        levels = self.levels
+        if amount_usd <= 0 or not levels:
+            return 0.0, 0.0
+        notional, shares = self.running()
+        i = bisect.bisect_left(notional, amount_usd)
+        if i == len(levels):
+            return shares[-1], notional[-1]
+        before_usd, before_shares = (notional[i - 1], shares[i - 1]) if i else (0.0, 0.0)
+        return before_shares + (amount_usd - before_usd) / levels[i].price, amount_usd
+
+    def curve(self, amounts: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """``fill`` for each of ``amounts`` (the side must not be empty)."""
+        arrays = self.arrays
+        if arrays is None:
+            notional, shares = self.running()
+            prices = np.fromiter((lv.price for lv in self.levels), dtype=np.float64, count=len(self.levels))
+            arrays = self.arrays = (prices, np.asarray(notional), np.asarray(shares))
+        return vwap_curve(*arrays, amounts)
+
+
+_EMPTY_DEPTH = SideDepth(())
+
+
+class BookSide:
+    """One side of the book, iterated and indexed best price first.
+
+    ``_keys`` is the sorted array of sort keys (the tick for asks, its negation for
+    bids) so both sides ascend towards worse prices; ``_levels`` holds the level for
+    each key at the same index. ``_view`` caches ``_levels`` as a ``SideDepth`` until
+    the next change, so publishing a snapshot copies each side at most once per update
+    and the snapshot prices from the same depth index as the live book.
+    Levels priced outside [0, 1] (or NaN) are dropped and counted in ``rejected``.
+    """
+
+    __slots__ = ("descending", "rejected", "_keys", "_levels", "_view")
+
+    def __init__(self, descending: bool = False, levels: Iterable[tuple[float, float]] = ()):
+        self.descending = descending
+        self.rejected = 0
+        self._keys: list[int] = []
+        self._levels: list[OrderBookLevel] = []
+        self.replace(levels)
+
+    def _key(self, price: float) -> int | None:
+        if not 0.0 <= price <= 1.0:
+            self.rejected += 1
+            return None
+        tick = price_to_tick(price)
+        return -tick if self.descending else tick
+
+    def replace(self, levels: Iterable[tuple[float, float]]) -> None:
+        """Reset the side to ``(price, size)`` pairs (a snapshot)."""
+        by_key: dict[int, OrderBookLevel] = {}
+        for price, size in levels:
+            if size > 0 and (key := self._key(price)) is not None:
+                by_key[key] = OrderBookLevel(price, size)
+        self._keys = sorted(by_key)
+        self._levels = [by_key[key] for key in self._keys]
+        self._view: SideDepth | None = None
+
+    def set(self, price: float, size: float) -> None:
+        """Set the size at ``price``; a size of 0 removes the level."""
+        key = self._key(price)
+        if key is None:
+            return
+        keys = self._keys
+        i = bisect.bisect_left(keys, key)
+        level = self._levels[i] if i < len(keys) and keys[i] == key else None
+        if size <= 0:
+            if level is None:
+                return
+            del keys[i], self._levels[i]
+        elif level is not None:
+            self._levels[i] = OrderBookLevel(level.price, size)
+        else:
+            keys.insert(i, key)
+            self._levels.insert(i, OrderBookLevel(price, size))
+        self._view = None
+
+    def fill(self, amount_usd: float) -> tuple[float, float]:
+        """``(shares, usd)`` filled by sweeping ``amount_usd`` from the best level (see ``SideDepth.fill``)."""
+        return self.depth().fill(amount_usd)
+
+    def depth(self) -> SideDepth:
+        """The levels and their depth index, immutable (cached until the next change)."""
+        if self._view is None:
+            self._view = SideDepth(tuple(self._levels)) if self._levels else _EMPTY_DEPTH
+        return self._view
+
+    def levels(self) -> tuple[OrderBookLevel, ...]:
+        """The levels, best first, as an immutable tuple (cached until the next change)."""
+        return self.depth().levels
+
+    def arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        """Prices and sizes, best first."""
+        levels = self.levels()
+        return (
+            np.fromiter((lv.price for lv in levels), dtype=np.float64, count=len(levels)),
+            np.fromiter((lv.size for lv in levels), dtype=np.float64, count=len(levels)),
+        )
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self) -> Iterator[OrderBookLevel]:
+        return iter(self._levels)
+
+    def __getitem__(self, index: int) -> OrderBookLevel:
+        return self._levels[index]
+
+    def __repr__(self) -> str:
+        return f"BookSide({list(self)!r})"
+
+
+def vwap_curve(
+    prices: np.ndarray, cum_notional: np.ndarray, cum_shares: np.ndarray, amounts: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """``(shares, usd)`` filled for each of ``amounts`` swept through levels given best first,
+    from the level prices and their running notional and shares."""
+    amounts = np.maximum(amounts, 0.0)
+    # First level whose cumulative notional covers the amount
+    idx = np.searchsorted(cum_notional, amounts, side="left")
+    inside = idx < len(prices)
+    at = np.minimum(idx, len(prices) - 1)
+    before_notional = np.where(idx > 0, cum_notional[np.maximum(idx - 1, 0)], 0.0)
+    before_shares = np.where(idx > 0, cum_shares[np.maximum(idx - 1, 0)], 0.0)
+    shares = np.where(inside, before_shares + (amounts - before_notional) / prices[at], cum_shares[-1])
+    usd = np.where(inside, amounts, cum_notional[-1])
+    return shares, usd
+
+
+def _differs(reported: float | None, price: float) -> bool:
+    return reported is not None and price_to_tick(reported) != price_to_tick(price)
+
+
+def _price_fill(
+    shares: float, usd: float, amount_usd: float, mid: float, best_price: float
+) -> tuple[float, float, float]:
+    """(execution_price, slippage_pct, fill_pct) for a fill of ``shares`` for ``usd``."""
+    if shares == 0:
+        return mid, 0.0, 0.0
+    exec_price = usd / shares
+    fill_pct = (usd / amount_usd * 100) if amount_usd > 0 else 100.0
+    slippage_pct = abs(exec_price - best_price) / best_price * 100 if best_price > 0 else 0.0
+    return exec_price, slippage_pct, fill_pct
+
+
+def _price_curve(
+    depth: SideDepth, amounts: np.ndarray, mid: float, best_price: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized ``_price_fill`` over ``amounts``."""
+    if not depth.levels:
+        return np.full(amounts.shape, mid), np.zeros(amounts.shape), np.zeros(amounts.shape)
+    shares, usd = depth.curve(amounts)
+    filled = shares > 0
+    exec_price = np.where(filled, usd / np.where(filled, shares, 1.0), mid)
+    if best_price > 0:
+        slippage_pct = np.where(filled, np.abs(exec_price - best_price) / best_price * 100, 0.0)
+    else:
+        slippage_pct = np.zeros(amounts.shape)
+    safe_amounts = np.where(amounts > 0, amounts, 1.0)
+    fill_pct = np.where(filled, np.where(amounts > 0, usd / safe_amounts * 100, 100.0), 0.0)
+    return exec_price, slippage_pct, fill_pct
+
+
+class BookSnapshot(NamedTuple):
+    """Immutable view of a ``CachedOrderBook`` as of one update.
+
+    Same read API as the live book (levels best first, best bid/ask, mid, execution
+    pricing). Like ``OrderBookLevel`` a NamedTuple rather than a frozen dataclass:
+    these are built on every delta and tuple construction is ~4x cheaper.
+    ``depth`` holds the ``(bids, asks)`` ``SideDepth`` the book published, so pricing
+    reuses the live book's depth index instead of rebuilding one per snapshot.
+    """
+
+    token_id: str
+    bids: tuple[OrderBookLevel, ...] = ()
+    asks: tuple[OrderBookLevel, ...] = ()
+    timestamp: float = 0.0
+    best_bid: float = 0.0
+    best_ask: float = 0.0
+    mid: float = 0.5
+    in_sync: bool = False
+    depth: tuple[SideDepth, SideDepth] | None = None
+
+    def _fill(self, side: str, amount_usd: float) -> tuple[float, float]:
+        if self.depth is not None:
+            return self.depth[side == "BUY"].fill(amount_usd)
+        return SideDepth(self.asks if side == "BUY" else self.bids).fill(amount_usd)
+
+    def get_execution_price(self, side: str, amount_usd: float) -> tuple[float, float, float]:
+        """Returns: (execution_price, slippage_pct, fill_pct), as ``CachedOrderBook.get_execution_price``."""
+        levels = self.asks if side == "BUY" else self.bids
+        if not levels:
+            return self.mid, 0.0, 0.0
+        best_price = self.best_ask if side == "BUY" else self.best_bid
+        return _price_fill(*self._fill(side, amount_usd), amount_usd, self.mid, best_price)
+
+    def execution_curve(
+        self, side: str, amounts: Sequence[float] | np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Returns: (execution_price, slippage_pct, fill_pct) arrays, as ``CachedOrderBook.execution_curve``."""
+        amounts = np.asarray(amounts, dtype=np.float64)
+        best_price = self.best_ask if side == "BUY" else self.best_bid
+        if self.depth is not None:
+            depth = self.depth[side == "BUY"]
+        else:
+            depth = SideDepth(self.asks if side == "BUY" else self.bids)
+        return _price_curve(depth, amounts, self.mid, best_price)
+
+
+@dataclass
+class CachedOrderBook:
+    """Cached order book state with timestamp."""
+
+    token_id: str
+    bids: BookSide = field(default_factory=lambda: BookSide(descending=True))
+    asks: BookSide = field(default_factory=BookSide)
+    timestamp: float = 0.0
+    best_bid: float = 0.0
+    best_ask: float = 0.0
+    mid: float = 0.5
+    # Sync state: server timestamp (ms) and hash of the last message applied, and whether
+    # the book has had a snapshot with no drift detected since
+    server_ts: int = 0
+    hash: str = ""
+    in_sync: bool = False
+    # Latest immutable view, replaced (never mutated) after every change
+    view: BookSnapshot = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.view = BookSnapshot(self.token_id)
+
+    def _publish(self):
+        """Publish a new ``view`` (an unchanged side reuses its cached tuple)."""
+        bids, asks = self.bids.depth(), self.asks.depth()
+        self.view = BookSnapshot(
+            self.token_id,
+            bids.levels,
+            asks.levels,
+            self.timestamp,
+            self.best_bid,
+            self.best_ask,
+            self.mid,
+            self.in_sync,
+            (bids, asks),
+        )
+
+    def mark_unsynced(self):
+        """Flag the book as untrusted (e.g. after a reconnect) until the next snapshot."""
+        self.in_sync = False
+        self.view = self.view._replace(in_sync=False)
+
+    def update_from_snapshot(self, data: dict):
+        """Update from full orderbook snapshot (``book`` event or REST ``/book`` payload)."""
+        self.load_snapshot(parse_book(data))
+
+    def load_snapshot(self, msg: BookMessage):
+        """Replace the book with a decoded snapshot and mark it in sync."""
+        self.bids.replace(msg.bids)
+        self.asks.replace(msg.asks)
+        self._recalculate()
+        self.server_ts = msg.timestamp or self.server_ts
+        self.hash = msg.hash
+        self.in_sync = True
+        self._publish()
+
+    def apply_delta(self, msg: PriceChangeMessage) -> str:
+        """Validate and apply a ``price_change``.
+
+        Returns "ok", "stale" (older than the book; skipped), "unsynced" (no trusted
+        snapshot to apply it to; skipped) or the drift detected after applying it:
+        "crossed" (best bid at or above best ask) or "best_mismatch" (our top of book
+        disagrees with the ``best_bid``/``best_ask`` the server sends with each change).
+        Any result but "ok" and "stale" leaves the book out of sync until the next snapshot.
+        """
+        if not self.in_sync:
+            return "unsynced"
+        if msg.timestamp and msg.timestamp < self.server_ts:
+            return "stale"
+        self._apply_changes(msg.changes)
+        self.server_ts = msg.timestamp or self.server_ts
+        self.hash = msg.hash or self.hash
+
+        best_bid = self.bids[0].price if self.bids else 0.0
+        best_ask = self.asks[0].price if self.asks else 0.0
+        last = msg.changes[-1] if msg.changes else PriceChange("", 0.0, 0.0)  # top of book after the message
+        status = "ok"
+        if best_bid and best_ask and best_bid >= best_ask:
+            status = "crossed"
+        elif _differs(last.best_bid, best_bid) or _differs(last.best_ask, best_ask):
+            status = "best_mismatch"
+        if status != "ok":
+            self.in_sync = False
+        self._publish()
+        return status
+
+    def update_from_delta(self, data: dict):
+        """Update from orderbook delta (price_change event), without validation."""
+        for msg in parse_price_change(data):
+            if "price_changes" not in data or msg.asset_id == self.token_id:
+                self._apply_changes(msg.changes)
+                self._publish()
+
+    def _apply_changes(self, changes: list[PriceChange]):
+        for change in changes:
+            if change.side == "BUY":
+                self.bids.set(change.price, change.size)
+            elif change.side == "SELL":
+                self.asks.set(change.price, change.size)
+        self._recalculate()
+
+    def _recalculate(self):
+        """Refresh best bid/ask and mid (O(1): the best level is first on each side)."""
+        self.timestamp = time.time()
+        if self.bids:
+            self.best_bid = self.bids[0].price
+        if self.asks:
+            self.best_ask = self.asks[0].price
+        if self.best_bid > 0 and self.best_ask > 0:
+            self.mid = (self.best_bid + self.best_ask) / 2
+
+    def get_execution_price(self, side: str, amount_usd: float) -> tuple[float, float, float]:
+        """Calculate execution price by walking the book.
+
+        Returns: (execution_price, slippage_pct, fill_pct)
+        """
+        levels = self.asks if side == "BUY" else self.bids
+        if not levels:
+            return self.mid, 0.0, 0.0
+        best_price = self.best_ask if side == "BUY" else self.best_bid
+        return _price_fill(*levels.fill(amount_usd), amount_usd, self.mid, best_price)
+
+    def execution_curve(
+        self, side: str, amounts: Sequence[float] | np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """``get_execution_price`` for many USD sizes at once.
+
+        Returns: (execution_price, slippage_pct, fill_pct) arrays aligned with ``amounts``
+        """
+        amounts = np.asarray(amounts, dtype=np.float64)
+        best_price = self.best_ask if side == "BUY" else self.best_bid
+        levels = self.asks if side == "BUY" else self.bids
+        return _price_curve(levels.depth(), amounts, self.mid, best_price)
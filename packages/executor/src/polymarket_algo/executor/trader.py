@@ -778,17 +778,22 @@ class TradingState:
         print(f"Current Bankroll: ${self.bankroll:.2f}")
         print(f"{'=' * 80}\n")
 
-    def update_unrealized_pnl(self):
-        """Update unrealized PnL for all pending trades based on current market prices."""
+    def update_unrealized_pnl(self, client: PolymarketClient | None = None):
+        """Update unrealized PnL for all pending trades based on current market prices.
+
+        All pending markets are fetched in one batched lookup over the shared pooled
+        transport (pass ``client`` to reuse its caches).
+        """
         pending = [t for t in self.trades if t.outcome is None]
         if not pending:
             return
 
-        client = PolymarketClient()
+        client = client or PolymarketClient()
+        markets = client.get_markets(t.timestamp for t in pending)
 
         for trade in pending:
             try:
-                market = client.get_market(trade.timestamp)
+                market = markets.get(trade.timestamp)
                 if not market:
                     continue
 
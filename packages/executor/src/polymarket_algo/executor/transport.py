@@ -0,0 +1,170 @@
+"""Shared pooled HTTP transport for the Polymarket REST clients.
+
+One ``requests.Session`` with a tuned ``HTTPAdapter`` (pool sizes, keep-alive,
+retry/backoff) serves ``PolymarketClient``, the copytrade monitor and
+``TradingState``, so they reuse warm connections instead of each opening their
+own. Every request's latency is recorded in a per-endpoint histogram.
+"""
+
+import bisect
+import threading
+import time
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+import requests
+from polymarket_algo.core.config import Config
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Upper bounds (ms) of the latency histogram buckets; a final bucket catches the rest.
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+@dataclass(frozen=True)
+class TransportConfig:
+    """Connection pool and retry settings (defaults from ``Config``)."""
+
+    pool_connections: int = field(default_factory=lambda: Config.REST_POOL_CONNECTIONS)  # hosts kept pooled
+    pool_maxsize: int = field(default_factory=lambda: Config.REST_POOL_MAXSIZE)  # connections per host
+    pool_block: bool = False  # wait for a free connection instead of opening a throwaway one
+    keep_alive: bool = True
+    retries: int = field(default_factory=lambda: Config.REST_RETRIES)
+    backoff_factor: float = field(default_factory=lambda: Config.REST_BACKOFF)
+    status_forcelist: tuple[int, ...] = (429, 500, 502, 503, 504)
+    timeout: float = field(default_factory=lambda: Config.REST_TIMEOUT)
+    user_agent: str = "PolymarketBot/2.0"
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram in milliseconds (not thread-safe; guarded by the owner)."""
+
+    def __init__(self, bounds: tuple[float, ...] = LATENCY_BUCKETS_MS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, ms: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the ``q`` quantile (``max_ms`` for the overflow bucket)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                return float(self.bounds[i]) if i < len(self.bounds) else self.max_ms
+        return self.max_ms
+
+    def snapshot(self) -> dict:
+        labels = [f"<={b}ms" for b in self.bounds] + [f">{self.bounds[-1]}ms"]
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 2) if self.count else 0.0,
+            "p50_ms": self.percentile(0.50),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": round(self.max_ms, 2),
+            "buckets": dict(zip(labels, self.counts, strict=True)),
+        }
+
+
+class PooledTransport:
+    """Pooled, retrying ``requests`` session that times every request per endpoint.
+
+    ``get``/``post``/``request`` take the same arguments as ``requests.Session``,
+    so it can stand in wherever a session is used.
+    """
+
+    def __init__(self, config: TransportConfig | None = None):
+        self.config = config or TransportConfig()
+        self.session = requests.Session()
+
+        retry_strategy = Retry(
+            total=self.config.retries,
+            backoff_factor=self.config.backoff_factor,
+            status_forcelist=list(self.config.status_forcelist),
+            allowed_methods=["GET"],
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.config.pool_connections,
+            pool_maxsize=self.config.pool_maxsize,
+            pool_block=self.config.pool_block,
+            max_retries=retry_strategy,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(
+            {
+                "User-Agent": self.config.user_agent,
+                "Accept": "application/json",
+                "Connection": "keep-alive" if self.config.keep_alive else "close",
+            }
+        )
+
+        self._lock = threading.Lock()
+        self._latency: dict[str, LatencyHistogram] = {}
+        self._requests = 0
+        self._errors = 0
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", self.config.timeout)
+        started = time.perf_counter()
+        failed = True
+        try:
+            response = self.session.request(method, url, **kwargs)
+            failed = response.status_code >= 400
+            return response
+        finally:
+            self._record(url, (time.perf_counter() - started) * 1000, failed)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def _record(self, url: str, ms: float, failed: bool) -> None:
+        parts = urlsplit(url)
+        endpoint = f"{parts.netloc}{parts.path}"
+        with self._lock:
+            histogram = self._latency.get(endpoint)
+            if histogram is None:
+                histogram = self._latency[endpoint] = LatencyHistogram()
+            histogram.record(ms)
+            self._requests += 1
+            self._errors += failed
+
+    @property
+    def stats(self) -> dict:
+        """Request/error counts and a latency histogram per ``host/path``."""
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "errors": self._errors,
+                "endpoints": {endpoint: h.snapshot() for endpoint, h in sorted(self._latency.items())},
+            }
+
+    def close(self) -> None:
+        self.session.close()
+
+
+_shared: PooledTransport | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_transport() -> PooledTransport:
+    """Process-wide transport used by default by all REST clients."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = PooledTransport()
+        return _shared
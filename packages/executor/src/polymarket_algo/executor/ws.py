@@ -4,128 +4,39 @@ Provides ~100ms latency vs ~1s for REST API polling.
 """
 
 import asyncio
+import concurrent.futures
 import json
 import threading
 import time
-from collections.abc import Callable
-from dataclasses import dataclass, field
+from collections.abc import Callable, Coroutine, Sequence
+from dataclasses import dataclass
+from typing import Any
 
+import numpy as np
 import websockets
 from polymarket_algo.executor.client import DelayImpactModel, PolymarketClient
+from polymarket_algo.executor.messages import (
+    BookMessage,
+    LastTradeMessage,
+    PriceChangeMessage,
+    decode_messages,
+    loads,
+    log_decoder_notice,
+    parse_book,
+)
+from polymarket_algo.executor.orderbook import BookSnapshot, CachedOrderBook, OrderBookLevel  # noqa: F401 - re-exported
 from websockets.exceptions import ConnectionClosed
 
-
-@dataclass
-class OrderBookLevel:
-    """Single price level in orderbook."""
-
-    price: float
-    size: float
-
-
-@dataclass
-class CachedOrderBook:
-    """Cached order book state with timestamp."""
-
-    token_id: str
-    bids: list[OrderBookLevel] = field(default_factory=list)
-    asks: list[OrderBookLevel] = field(default_factory=list)
-    timestamp: float = 0.0
-    best_bid: float = 0.0
-    best_ask: float = 0.0
-    mid: float = 0.5
-
-    def update_from_snapshot(self, data: dict):
-        """Update from full orderbook snapshot."""
-        self.bids = [OrderBookLevel(float(b["price"]), float(b["size"])) for b in data.get("bids", [])]
-        self.asks = [OrderBookLevel(float(a["price"]), float(a["size"])) for a in data.get("asks", [])]
-        self._recalculate()
-
-    def update_from_delta(self, data: dict):
-        """Update from orderbook delta (price_change event)."""
-        changes = data.get("changes", [])
-        for change in changes:
-            side = change.get("side")
-            price = float(change.get("price", 0))
-            size = float(change.get("size", 0))
-
-            if side == "BUY":
-                self._update_level(self.bids, price, size, reverse=True)
-            elif side == "SELL":
-                self._update_level(self.asks, price, size, reverse=False)
-        self._recalculate()
-
-    def _update_level(self, levels: list[OrderBookLevel], price: float, size: float, reverse: bool):
-        """Update a single price level."""
-        # Find existing level
-        for i, level in enumerate(levels):
-            if abs(level.price - price) < 0.0001:
-                if size == 0:
-                    levels.pop(i)
-                else:
-                    level.size = size
-                return
-
-        # Add new level if size > 0
-        if size > 0:
-            levels.append(OrderBookLevel(price, size))
-            levels.sort(key=lambda x: x.price, reverse=reverse)
-
-    def _recalculate(self):
-        """Recalculate best bid/ask and mid."""
-        self.timestamp = time.time()
-        if self.bids:
-            self.bids.sort(key=lambda x: x.price, reverse=True)
-            self.best_bid = self.bids[0].price
-        if self.asks:
-            self.asks.sort(key=lambda x: x.price)
-            self.best_ask = self.asks[0].price
-        if self.best_bid > 0 and self.best_ask > 0:
-            self.mid = (self.best_bid + self.best_ask) / 2
-
-    def get_execution_price(self, side: str, amount_usd: float) -> tuple[float, float, float]:
-        """Calculate execution price by walking the book.
-
-        Returns: (execution_price, slippage_pct, fill_pct)
-        """
-        levels = self.asks if side == "BUY" else self.bids
-
-        if not levels:
-            return self.mid, 0.0, 0.0
-
-        remaining = amount_usd
-        total_shares = 0.0
-        total_cost = 0.0
-
-        for level in levels:
-            if remaining <= 0:
-                break
-            level_value = level.price * level.size
-            if level_value >= remaining:
-                shares = remaining / level.price
-                total_shares += shares
-                total_cost += remaining
-                remaining = 0
-            else:
-                total_shares += level.size
-                total_cost += level_value
-                remaining -= level_value
-
-        if total_shares == 0:
-            return self.mid, 0.0, 0.0
-
-        exec_price = total_cost / total_shares
-        filled_amount = amount_usd - remaining
-        fill_pct = (filled_amount / amount_usd * 100) if amount_usd > 0 else 100.0
-
-        # Calculate slippage vs best price
-        best_price = self.best_ask if side == "BUY" else self.best_bid
-        if best_price > 0:
-            slippage_pct = abs(exec_price - best_price) / best_price * 100
-        else:
-            slippage_pct = 0.0
-
-        return exec_price, slippage_pct, fill_pct
+# A drifted book is resynced from REST at most this often per token.
+RESYNC_MIN_INTERVAL_S = 1.0
+# How long an in-sync book is trusted without updates before falling back to REST: sync
+# checks only cover top of book, so these keep the pre-validation staleness cutoffs.
+SYNCED_BOOK_MAX_AGE_S = 5.0
+EXECUTION_BOOK_MAX_AGE_S = 2.0
+# Deltas kept per out-of-sync token for replay over the next snapshot.
+PENDING_DELTAS_MAX = 2000
+# MarketDataCache unsubscribes (and drops the books of) a 5-min market this long after it closes.
+EXPIRED_MARKET_GRACE_S = 300
 
 
 @dataclass
@@ -158,18 +69,22 @@ class PolymarketWebSocket:
         self,
         on_trade: Callable[[TradeEvent], None] | None = None,
         on_mid_change: Callable[[str, float], None] | None = None,
+        rest_client: PolymarketClient | None = None,
     ):
         """Initialize WebSocket client.
 
         Args:
             on_trade: Callback for trade events (called from asyncio thread)
             on_mid_change: Callback for orderbook midpoint changes (token_id, mid_price)
+            rest_client: Client used to resync drifted books (created on first resync if omitted)
         """
         self._on_trade = on_trade
         self._on_mid_change = on_mid_change
+        self._rest_client = rest_client
         self._orderbooks: dict[str, CachedOrderBook] = {}
         self._subscribed_tokens: set[str] = set()
         self._subscribed_markets: set[str] = set()  # condition IDs
+        self._market_tokens: dict[str, list[str]] = {}  # condition ID -> token IDs
         self._ws = None
         self._running = False
         self._loop: asyncio.AbstractEventLoop | None = None
@@ -185,6 +100,16 @@ class PolymarketWebSocket:
         self.last_message_time = 0.0
         self.messages_received = 0
 
+        # Book integrity: drift detected per reason, REST resyncs, deltas dropped as out of order
+        self._resyncing: set[str] = set()
+        self._last_resync: dict[str, float] = {}
+        # Deltas received while a book is out of sync, replayed over the next snapshot
+        self._pending: dict[str, list[PriceChangeMessage]] = {}
+        self.book_drift: dict[str, int] = {}
+        self.resyncs = 0
+        self.resync_failures = 0
+        self.stale_deltas = 0
+
     def start(self):
         """Start WebSocket connection in background thread."""
         if self._running:
@@ -237,6 +162,17 @@ class PolymarketWebSocket:
         if tasks:
             await asyncio.gather(*tasks, return_exceptions=True)
 
+    def submit[T](self, coro: Coroutine[Any, Any, T]) -> concurrent.futures.Future[T]:
+        """Run ``coro`` on this connection's event loop from any thread.
+
+        Lets REST lookups (e.g. ``AsyncPolymarketClient``) share the loop that already
+        serves the feed instead of blocking the caller's thread one request at a time.
+        """
+        if self._loop is None or not self._loop.is_running():
+            coro.close()
+            raise RuntimeError("WebSocket event loop is not running; call start() first")
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
     def _run_loop(self):
         """Run asyncio event loop in background thread."""
         self._loop = asyncio.new_event_loop()
@@ -271,6 +207,13 @@ class PolymarketWebSocket:
                     self._ws = ws
                     self._connected.set()
                     print(f"[ws] Connected to {self.WS_URL}")
+                    log_decoder_notice()
+
+                    # Deltas may have been missed while disconnected; books are trusted
+                    # again once the snapshot that follows each subscription arrives
+                    with self._lock:
+                        for book in self._orderbooks.values():
+                            book.mark_unsynced()
 
                     # Resubscribe to any existing subscriptions
                     await self._resubscribe()
@@ -315,57 +258,126 @@ class PolymarketWebSocket:
         await self._ws.send(json.dumps(msg))
 
     async def _handle_message(self, raw: str | bytes):
-        """Handle incoming WebSocket message."""
-        if isinstance(raw, bytes):
-            raw = raw.decode("utf-8")
+        """Handle incoming WebSocket message (one event or a JSON array of events)."""
         try:
-            data = json.loads(raw)
-        except json.JSONDecodeError:
+            messages = decode_messages(raw)
+        except (ValueError, KeyError, TypeError):
             return
 
-        msg_type = data.get("type", data.get("event_type", ""))
+        for msg in messages:
+            if isinstance(msg, BookMessage):
+                # Full orderbook snapshot
+                if msg.asset_id:
+                    with self._lock:
+                        if msg.asset_id not in self._orderbooks:
+                            self._orderbooks[msg.asset_id] = CachedOrderBook(token_id=msg.asset_id)
+                        status = self._load_snapshot(self._orderbooks[msg.asset_id], msg)
+                    if status not in ("ok", "stale"):
+                        self._request_resync(msg.asset_id, status)
+
+            elif isinstance(msg, PriceChangeMessage):
+                self._handle_price_change(msg)
+
+            elif isinstance(msg, LastTradeMessage):
+                trade = TradeEvent(
+                    token_id=msg.asset_id,
+                    market_id=msg.market,
+                    price=msg.price,
+                    size=msg.size,
+                    side=msg.side,
+                    timestamp=msg.timestamp if msg.timestamp is not None else time.time(),
+                )
+                if self._on_trade:
+                    self._on_trade(trade)
+
+    def _handle_price_change(self, msg: PriceChangeMessage):
+        """Apply an orderbook delta, validated against the book's sync state."""
+        token_id = msg.asset_id
+        if not token_id or token_id not in self._orderbooks:
+            return
+        with self._lock:
+            book = self._orderbooks[token_id]
+            status = book.apply_delta(msg)
+            mid_price = book.mid
+            if status not in ("ok", "stale"):
+                self._buffer_delta(msg)
+
+        if status == "ok":
+            if self._on_mid_change:
+                self._on_mid_change(token_id, mid_price)
+        elif status == "stale":
+            self.stale_deltas += 1
+        else:
+            # "unsynced" means the book already was: its drift was counted when it happened
+            self._request_resync(token_id, None if status == "unsynced" else status)
+
+    def _buffer_delta(self, msg: PriceChangeMessage):
+        """Keep a delta the book could not trust for replay over the next snapshot (lock held)."""
+        pending = self._pending.setdefault(msg.asset_id, [])
+        if len(pending) >= PENDING_DELTAS_MAX:
+            del pending[0]  # a snapshot must then be newer than the oldest one kept
+        pending.append(msg)
+
+    def _load_snapshot(self, book: CachedOrderBook, snapshot: BookMessage) -> str:
+        """Load ``snapshot`` and replay the buffered deltas newer than it (lock held).
+
+        Returns "stale" (older than the oldest buffered delta, or than the book when none
+        are buffered: not loaded), "ok", or the drift a replayed delta exposed, which
+        leaves the book unsynced. A snapshot without a timestamp (0) is taken as current:
+        it is loaded and the buffer dropped, since nothing in it can be ordered against it.
+        """
+        pending = self._pending.pop(book.token_id, [])
+        if not snapshot.timestamp:
+            book.load_snapshot(snapshot)
+            return "ok"
+        if snapshot.timestamp < (pending[0].timestamp if pending else book.server_ts):
+            if pending:
+                self._pending[book.token_id] = pending
+            return "stale"
+        book.load_snapshot(snapshot)
+        for msg in pending:
+            if msg.timestamp > snapshot.timestamp:
+                status = book.apply_delta(msg)
+                if status not in ("ok", "stale"):
+                    return status
+        return "ok"
+
+    def _request_resync(self, token_id: str, reason: str | None = None):
+        """Refetch just ``token_id``'s book over REST (rate-limited).
+
+        ``reason`` is the drift that just took the book out of sync, counted in
+        ``book_drift``; None when the book already was out of sync.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if reason is not None:
+                self.book_drift[reason] = self.book_drift.get(reason, 0) + 1
+            recently = now - self._last_resync.get(token_id, -RESYNC_MIN_INTERVAL_S) < RESYNC_MIN_INTERVAL_S
+            if token_id in self._resyncing or recently:
+                return
+            self._resyncing.add(token_id)
+            self._last_resync[token_id] = now
+        asyncio.get_running_loop().create_task(self._resync(token_id))
 
-        if msg_type == "book":
-            # Full orderbook snapshot
-            token_id = data.get("asset_id", "")
-            if token_id:
-                with self._lock:
-                    if token_id not in self._orderbooks:
-                        self._orderbooks[token_id] = CachedOrderBook(token_id=token_id)
-                    self._orderbooks[token_id].update_from_snapshot(data)
-
-        elif msg_type == "price_change":
-            # Orderbook delta
-            token_id = data.get("asset_id", "")
-            if token_id and token_id in self._orderbooks:
-                mid_price: float | None = None
-                with self._lock:
-                    self._orderbooks[token_id].update_from_delta(data)
-                    mid_price = self._orderbooks[token_id].mid
-
-                if self._on_mid_change and mid_price is not None:
-                    self._on_mid_change(token_id, mid_price)
-
-        elif msg_type == "last_trade_price":
-            # Trade event
-            token_id = data.get("asset_id", "")
-            market_id = data.get("market", "")
-            price = float(data.get("price", 0))
-            size = float(data.get("size", 0))
-            side = data.get("side", "BUY")
-            ts = float(data.get("timestamp", time.time()))
-
-            trade = TradeEvent(
-                token_id=token_id,
-                market_id=market_id,
-                price=price,
-                size=size,
-                side=side,
-                timestamp=ts,
-            )
-
-            if self._on_trade:
-                self._on_trade(trade)
+    async def _resync(self, token_id: str):
+        """Replace a drifted book with a REST ``/book`` snapshot."""
+        try:
+            if self._rest_client is None:
+                self._rest_client = PolymarketClient()
+            data = await asyncio.get_running_loop().run_in_executor(None, self._rest_client.get_orderbook, token_id)
+            with self._lock:
+                book = self._orderbooks.get(token_id)
+                snapshot = parse_book(data) if data else None
+                status = self._load_snapshot(book, snapshot) if snapshot is not None and book is not None else "stale"
+                if status == "stale":
+                    self.resync_failures += 1
+                else:
+                    self.resyncs += 1
+                    if status != "ok":
+                        self.book_drift[status] = self.book_drift.get(status, 0) + 1
+        finally:
+            with self._lock:
+                self._resyncing.discard(token_id)
 
     def subscribe_market(self, condition_id: str, token_ids: list[str] | None = None):
         """Subscribe to a market's orderbook and trade updates.
@@ -378,8 +390,11 @@ class PolymarketWebSocket:
             self._subscribed_markets.add(condition_id)
 
             if token_ids:
+                tokens = self._market_tokens.setdefault(condition_id, [])
                 for tid in token_ids:
                     self._subscribed_tokens.add(tid)
+                    if tid not in tokens:
+                        tokens.append(tid)
                     if tid not in self._orderbooks:
                         self._orderbooks[tid] = CachedOrderBook(token_id=tid)
 
@@ -387,9 +402,14 @@ class PolymarketWebSocket:
             asyncio.run_coroutine_threadsafe(self._send_subscribe(condition_id), self._loop)
 
     def unsubscribe_market(self, condition_id: str):
-        """Unsubscribe from a market."""
+        """Unsubscribe from a market and drop its cached orderbooks."""
         with self._lock:
             self._subscribed_markets.discard(condition_id)
+            for tid in self._market_tokens.pop(condition_id, []):
+                self._subscribed_tokens.discard(tid)
+                self._orderbooks.pop(tid, None)
+                self._last_resync.pop(tid, None)
+                self._pending.pop(tid, None)
 
         if self._loop and self._ws:
             msg = {
@@ -399,13 +419,24 @@ class PolymarketWebSocket:
             }
             asyncio.run_coroutine_threadsafe(self._ws.send(json.dumps(msg)), self._loop)
 
-    def get_orderbook(self, token_id: str) -> CachedOrderBook | None:
-        """Get cached orderbook for a token.
+    def get_orderbook(self, token_id: str) -> BookSnapshot | None:
+        """Get the latest immutable snapshot of a token's cached orderbook.
 
-        Returns None if not subscribed or no data yet.
+        Lock-free: the feed thread publishes a new snapshot after every update, so
+        the returned book never changes under the caller. Returns None if not
+        subscribed.
         """
-        with self._lock:
-            return self._orderbooks.get(token_id)
+        book = self._orderbooks.get(token_id)  # single dict lookup, atomic
+        return book.view if book is not None else None
+
+    def get_synced_orderbook(self, token_id: str, max_age_s: float = SYNCED_BOOK_MAX_AGE_S) -> BookSnapshot | None:
+        """Snapshot if the feed is connected and the book is in sync and younger than ``max_age_s``."""
+        if not self.is_connected():
+            return None
+        book = self.get_orderbook(token_id)
+        if book is None or not book.in_sync or book.timestamp <= time.time() - max_age_s:
+            return None
+        return book
 
     def get_execution_price(
         self, token_id: str, side: str, amount_usd: float, copy_delay_ms: int = 0
@@ -453,6 +484,15 @@ class PolymarketWebSocket:
         # No cached data
         return 0.5, 0.0, 0.0, 100.0, 0.0, None
 
+    def get_execution_curve(
+        self, token_id: str, side: str, amounts: Sequence[float]
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+        """``execution_curve`` on the latest book snapshot; None if no data yet."""
+        book = self.get_orderbook(token_id)
+        if book is None or book.timestamp <= 0:
+            return None
+        return book.execution_curve(side, amounts)
+
     def get_mid(self, token_id: str) -> float | None:
         """Get midpoint price from cached orderbook."""
         book = self.get_orderbook(token_id)
@@ -474,6 +514,9 @@ class PolymarketWebSocket:
         with self._lock:
             subscribed_markets = len(self._subscribed_markets)
             cached_orderbooks = len(self._orderbooks)
+            books_in_sync = sum(book.view.in_sync for book in self._orderbooks.values())
+            rejected_levels = sum(book.bids.rejected + book.asks.rejected for book in self._orderbooks.values())
+            book_drift = dict(self.book_drift)
 
         return {
             "connected": self.is_connected(),
@@ -482,6 +525,12 @@ class PolymarketWebSocket:
             "last_message_age": time.time() - self.last_message_time if self.last_message_time else None,
             "subscribed_markets": subscribed_markets,
             "cached_orderbooks": cached_orderbooks,
+            "books_in_sync": books_in_sync,
+            "book_drift": book_drift,
+            "resyncs": self.resyncs,
+            "resync_failures": self.resync_failures,
+            "stale_deltas": self.stale_deltas,
+            "rejected_levels": rejected_levels,
         }
 
 
@@ -618,6 +667,7 @@ class UserWebSocket:
                     self._ws = ws
                     self._connected.set()
                     print(f"[user-ws] Connected to {self.USER_WS_URL}")
+                    log_decoder_notice()
 
                     # Authenticate
                     await self._authenticate()
@@ -665,11 +715,11 @@ class UserWebSocket:
 
     async def _handle_message(self, raw: str | bytes):
         """Handle incoming WebSocket message."""
-        if isinstance(raw, bytes):
-            raw = raw.decode("utf-8")
         try:
-            data = json.loads(raw)
-        except json.JSONDecodeError:
+            data = loads(raw)
+        except ValueError:
+            return
+        if not isinstance(data, dict):
             return
 
         msg_type = data.get("type", data.get("event_type", ""))
@@ -789,13 +839,15 @@ class MarketDataCache:
         self._condition_cache: dict[int, str] = {}  # timestamp -> condition_id
         self._market_cache: dict[int, dict] = {}  # timestamp -> market data
         self._cache_ttl = 60  # seconds
+        # Guards _condition_cache: markets are fetched from several trading threads
+        self._market_lock = threading.Lock()
 
         # Trade callbacks
         self._trade_callbacks: list[Callable[[TradeEvent], None]] = []
         self._trade_callbacks_lock = threading.Lock()
 
         if use_websocket:
-            self._ws = PolymarketWebSocket(on_trade=self._handle_trade)
+            self._ws = PolymarketWebSocket(on_trade=self._handle_trade, rest_client=self._rest_client)
 
     def start(self):
         """Start data feeds."""
@@ -833,8 +885,18 @@ class MarketDataCache:
         for ts in timestamps:
             self._fetch_and_cache_market(ts)
 
+    def _unsubscribe_expired(self):
+        """Unsubscribe from markets that closed over ``EXPIRED_MARKET_GRACE_S`` ago."""
+        cutoff = time.time() - 300 - EXPIRED_MARKET_GRACE_S  # 5-min window ends 300s after start
+        with self._market_lock:
+            expired = [self._condition_cache.pop(ts) for ts in list(self._condition_cache) if ts < cutoff]
+        if self._ws:
+            for condition_id in expired:
+                self._ws.unsubscribe_market(condition_id)
+
     def _fetch_and_cache_market(self, timestamp: int) -> bool:
         """Fetch market data and cache token IDs."""
+        self._unsubscribe_expired()
         if timestamp in self._token_cache:
             return True
 
@@ -858,6 +920,8 @@ class MarketDataCache:
             # Use slug as condition_id for BTC markets
             token_ids = [t for t in [market.up_token_id, market.down_token_id] if t is not None]
             self._ws.subscribe_market(market.slug, token_ids or None)
+            with self._market_lock:
+                self._condition_cache[timestamp] = market.slug
 
         return True
 
@@ -876,10 +940,10 @@ class MarketDataCache:
 
     def get_orderbook(self, token_id: str) -> dict:
         """Get orderbook - from WebSocket cache or REST fallback."""
-        # Try WebSocket cache first
-        if self._ws and self._ws.is_connected():
-            book = self._ws.get_orderbook(token_id)
-            if book and book.timestamp > time.time() - 5:  # Max 5s stale
+        # Try WebSocket cache first (trusted while in sync; drifted books are resynced)
+        if self._ws:
+            book = self._ws.get_synced_orderbook(token_id)
+            if book:
                 return {
                     "bids": [{"price": str(l.price), "size": str(l.size)} for l in book.bids],
                     "asks": [{"price": str(l.price), "size": str(l.size)} for l in book.asks],
@@ -900,11 +964,9 @@ class MarketDataCache:
 
         Returns: (exec_price, spread, slippage_pct, fill_pct, delay_impact_pct, delay_breakdown)
         """
-        # Try WebSocket cache first
-        if self._ws and self._ws.is_connected():
-            book = self._ws.get_orderbook(token_id)
-            if book and book.timestamp > time.time() - 2:  # Max 2s stale for execution
-                return self._ws.get_execution_price(token_id, side, amount_usd, copy_delay_ms)
+        # Try WebSocket cache first (trusted while in sync; drifted books are resynced)
+        if self._ws and self._ws.get_synced_orderbook(token_id, EXECUTION_BOOK_MAX_AGE_S):
+            return self._ws.get_execution_price(token_id, side, amount_usd, copy_delay_ms)
 
         # Fallback to REST
         return self._rest_client.get_execution_price(token_id, side, amount_usd, copy_delay_ms)
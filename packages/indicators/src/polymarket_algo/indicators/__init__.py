@@ -1,8 +1,18 @@
 from .bollinger import bollinger_bands
+from .cache import IndicatorCache as IndicatorCache
+from .cache import indicator_cache as indicator_cache
 from .ema import ema
 from .macd import macd
 from .rsi import rsi
 from .sma import sma
+from .streak import candle_directions as candle_directions
+from .streak import streak_lengths as streak_lengths
+from .streak import trailing_streak as trailing_streak
+from .streaming import BollingerState as BollingerState
+from .streaming import EMAState as EMAState
+from .streaming import MACDState as MACDState
+from .streaming import RSIState as RSIState
+from .streaming import SMAState as SMAState
 
 
 class EMAIndicator:
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import pandas as pd
 
+from .cache import indicator_cache
+
 
 def bollinger_bands(
     series: pd.Series,
@@ -9,6 +11,12 @@ def bollinger_bands(
     std_dev: float = 2.0,
 ) -> pd.DataFrame:
     """Bollinger Bands: middle SMA, upper, lower."""
+    return indicator_cache.frame(
+        "bollinger", series, (period, std_dev), lambda: _bollinger_bands(series, period, std_dev)
+    )
+
+
+def _bollinger_bands(series: pd.Series, period: int, std_dev: float) -> pd.DataFrame:
     middle = series.rolling(window=period, min_periods=period).mean()
     rolling_std = series.rolling(window=period, min_periods=period).std(ddof=0)
     upper = middle + (rolling_std * std_dev)
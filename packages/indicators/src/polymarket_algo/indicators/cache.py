@@ -0,0 +1,134 @@
+"""Memoization for indicator outputs.
+
+Indicator results are keyed on a content digest of the input
+series plus the indicator name and parameters, so repeated calls on the same
+candles (e.g. every grid point of a parameter sweep) reuse one computation.
+Only the values are cached; results are rebuilt on the caller's index.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+
+import numpy as np
+import pandas as pd
+
+type CacheKey = tuple[Hashable, ...]
+type CachedValue = np.ndarray | dict[str, np.ndarray]
+
+
+def series_fingerprint(series: pd.Series) -> CacheKey | None:
+    """Content fingerprint of a numeric series, or None if it can't be fingerprinted.
+
+    A 128-bit BLAKE2b digest of the raw float64 bytes plus length and dtype
+    (~1 ms per 1M values), still much cheaper than the indicators themselves.
+    """
+    try:
+        values = np.ascontiguousarray(series.to_numpy(dtype=np.float64))
+    except (TypeError, ValueError):
+        return None
+    digest = hashlib.blake2b(values.view(np.uint8), digest_size=16).digest()
+    return (len(values), str(series.dtype), digest)
+
+
+class IndicatorCache:
+    """Thread-safe bounded LRU of indicator outputs with hit/miss/eviction counters."""
+
+    def __init__(self, maxsize: int = 64):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[CacheKey, CachedValue] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _key(self, name: str, series: pd.Series, params: tuple[Hashable, ...]) -> CacheKey | None:
+        if self.maxsize <= 0:
+            return None
+        fingerprint = series_fingerprint(series)
+        return None if fingerprint is None else (name, params, *fingerprint)
+
+    def _get(self, key: CacheKey) -> CachedValue | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def _put(self, key: CacheKey, value: CachedValue) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def series(
+        self,
+        name: str,
+        series: pd.Series,
+        params: tuple[Hashable, ...],
+        compute: Callable[[], pd.Series],
+    ) -> pd.Series:
+        """Return ``compute()`` for ``series``, memoized on (name, params, fingerprint)."""
+        key = self._key(name, series, params)
+        if key is None:
+            return compute()
+
+        cached = self._get(key)
+        if isinstance(cached, np.ndarray):
+            return pd.Series(cached, index=series.index, name=series.name, copy=True)
+
+        result = compute()
+        self._put(key, result.to_numpy(copy=True))
+        return result
+
+    def frame(
+        self,
+        name: str,
+        series: pd.Series,
+        params: tuple[Hashable, ...],
+        compute: Callable[[], pd.DataFrame],
+    ) -> pd.DataFrame:
+        """DataFrame counterpart of ``series`` (one cached array per column)."""
+        key = self._key(name, series, params)
+        if key is None:
+            return compute()
+
+        cached = self._get(key)
+        if isinstance(cached, dict):
+            return pd.DataFrame({col: values.copy() for col, values in cached.items()}, index=series.index)
+
+        result = compute()
+        self._put(key, {str(col): result[col].to_numpy(copy=True) for col in result.columns})
+        return result
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    @property
+    def stats(self) -> dict:
+        """Get cache statistics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+# Process-wide cache used by all indicator functions. Set ``maxsize = 0`` to disable.
+indicator_cache = IndicatorCache()
@@ -2,8 +2,14 @@ from __future__ import annotations
 
 import pandas as pd
 
+from .cache import indicator_cache
+
 
 def ema(series: pd.Series, period: int = 20) -> pd.Series:
     """Exponential moving average."""
+    return indicator_cache.series("ema", series, (period,), lambda: _ema(series, period))
+
+
+def _ema(series: pd.Series, period: int) -> pd.Series:
     result = series.ewm(span=period, adjust=False, min_periods=period).mean()
     return pd.Series(result, index=series.index)
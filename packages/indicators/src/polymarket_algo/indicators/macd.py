@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import pandas as pd
 
-from .ema import ema
+from .cache import indicator_cache
+from .ema import _ema, ema
 
 
 def macd(
@@ -12,8 +13,19 @@ def macd(
     signal_period: int = 9,
 ) -> pd.DataFrame:
     """MACD line, signal, and histogram."""
+    return indicator_cache.frame(
+        "macd",
+        series,
+        (fast_period, slow_period, signal_period),
+        lambda: _macd(series, fast_period, slow_period, signal_period),
+    )
+
+
+def _macd(series: pd.Series, fast_period: int, slow_period: int, signal_period: int) -> pd.DataFrame:
+    # Fast/slow EMAs go through the cache (shared with plain ema() callers); the
+    # signal EMA runs on the derived MACD line, which is cached as part of this frame.
     macd_line = ema(series, fast_period) - ema(series, slow_period)
-    signal_line = ema(macd_line, signal_period)
+    signal_line = _ema(macd_line, signal_period)
     histogram = macd_line - signal_line
     return pd.DataFrame(
         {
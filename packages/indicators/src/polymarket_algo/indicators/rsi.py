@@ -1,18 +1,25 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
+from .cache import indicator_cache
+
 
 def rsi(series: pd.Series, period: int = 14) -> pd.Series:
     """Relative Strength Index (Wilder smoothing)."""
+    return indicator_cache.series("rsi", series, (period,), lambda: _rsi(series, period))
+
+
+def _rsi(series: pd.Series, period: int) -> pd.Series:
     delta = series.diff()
     gain = pd.Series(delta.clip(lower=0), index=series.index)
-    loss = pd.Series((-delta).clip(upper=0), index=series.index)
+    loss = pd.Series(-delta.clip(upper=0), index=series.index)
 
     avg_gain = pd.Series(gain.ewm(alpha=1 / period, adjust=False, min_periods=period).mean(), index=series.index)
     avg_loss = pd.Series(loss.ewm(alpha=1 / period, adjust=False, min_periods=period).mean(), index=series.index)
 
-    rs: pd.Series = avg_gain / avg_loss.replace(0, pd.NA)
+    rs: pd.Series = avg_gain / avg_loss.replace(0, np.nan)
     rsi_values: pd.Series = pd.Series(100 - (100 / (1 + rs)), index=series.index)
 
     both_flat = (avg_gain == 0) & (avg_loss == 0)
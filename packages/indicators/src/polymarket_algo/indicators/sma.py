@@ -2,8 +2,14 @@ from __future__ import annotations
 
 import pandas as pd
 
+from .cache import indicator_cache
+
 
 def sma(series: pd.Series, period: int = 20) -> pd.Series:
     """Simple moving average."""
+    return indicator_cache.series("sma", series, (period,), lambda: _sma(series, period))
+
+
+def _sma(series: pd.Series, period: int) -> pd.Series:
     result = series.rolling(window=period, min_periods=period).mean()
     return pd.Series(result, index=series.index)
@@ -0,0 +1,40 @@
+"""Run-length streak kernels (pure NumPy, no per-element Python)."""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def streak_lengths(values: np.ndarray) -> np.ndarray:
+    """Length of the run of equal values ending at each position (1-based).
+
+    ``[1, 1, -1, -1, -1, 1]`` -> ``[1, 2, 1, 2, 3, 1]``.
+    """
+    values = np.asarray(values)
+    n = len(values)
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+    is_start = np.empty(n, dtype=bool)
+    is_start[0] = True
+    np.not_equal(values[1:], values[:-1], out=is_start[1:])
+    starts = np.flatnonzero(is_start)
+    run_id = np.cumsum(is_start) - 1
+    return np.arange(1, n + 1, dtype=np.int64) - starts[run_id]
+
+
+def trailing_streak(values: np.ndarray) -> int:
+    """Length of the run of equal values at the end of ``values`` (0 if empty)."""
+    values = np.asarray(values)
+    if len(values) == 0:
+        return 0
+    breaks = np.flatnonzero(values != values[-1])
+    return len(values) - (int(breaks[-1]) + 1 if len(breaks) else 0)
+
+
+def candle_directions(close: np.ndarray) -> np.ndarray:
+    """+1 for a candle that closed above the previous close, else -1 (the first candle is -1)."""
+    close = np.asarray(close, dtype=np.float64)
+    direction = np.full(len(close), -1, dtype=np.int64)
+    if len(close) > 1:
+        direction[1:][close[1:] > close[:-1]] = 1
+    return direction
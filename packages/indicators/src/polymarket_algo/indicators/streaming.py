@@ -0,0 +1,337 @@
+"""Incremental (O(1) per update) counterparts of the batch indicators.
+
+Each state object consumes one value at a time and returns the value the
+batch function would produce at that position. The arithmetic mirrors
+pandas' ``ewm``/``rolling`` kernels step for step (including their Kahan
+compensation and constant-run handling), so a state fed the same series
+reproduces the batch output bit for bit.
+"""
+
+from __future__ import annotations
+
+import math
+import sys
+from collections.abc import Iterable, Iterator
+from typing import NamedTuple
+
+NAN = float("nan")
+# pandas treats a Welford update as ill-conditioned below ~3 significant digits
+_INV_COND_TOL = sys.float_info.epsilon * 1e3
+
+
+class _EWMean:
+    """pandas ``ewm(com=..., adjust=False, ignore_na=False).mean()`` as a stream."""
+
+    __slots__ = ("_old_wt", "_old_wt_factor", "_new_wt", "_min_periods", "_nobs", "_weighted")
+
+    def __init__(self, com: float, min_periods: int):
+        alpha = 1.0 / (1.0 + com)
+        self._old_wt_factor = 1.0 - alpha
+        self._new_wt = alpha
+        self._min_periods = max(min_periods, 1)
+        self._old_wt = 1.0
+        self._nobs = 0
+        self._weighted = NAN
+
+    def update(self, value: float) -> float:
+        is_observation = value == value
+        self._nobs += is_observation
+        weighted = self._weighted
+        if weighted == weighted:
+            self._old_wt *= self._old_wt_factor
+            if is_observation:
+                # pandas skips the update on equal values to keep constant series exact
+                if weighted != value:
+                    weighted = self._old_wt * weighted + self._new_wt * value
+                    weighted /= self._old_wt + self._new_wt
+                self._old_wt = 1.0
+        elif is_observation:
+            weighted = value
+        self._weighted = weighted
+        return weighted if self._nobs >= self._min_periods else NAN
+
+
+class _RollingWindow:
+    """Fixed-size ring buffer holding the last ``period`` values."""
+
+    __slots__ = ("_buffer", "_head", "count")
+
+    def __init__(self, period: int):
+        if period < 1:
+            raise ValueError("period must be >= 1")
+        self._buffer = [NAN] * period
+        self._head = 0
+        self.count = 0  # values pushed so far
+
+    def __len__(self) -> int:
+        return min(self.count, len(self._buffer))
+
+    def __iter__(self) -> Iterator[float]:
+        """Values currently in the window, oldest first."""
+        if self.count < len(self._buffer):
+            return iter(self._buffer[: self.count])
+        return iter(self._buffer[self._head :] + self._buffer[: self._head])
+
+    def push(self, value: float) -> float | None:
+        """Store ``value``; return the value that left the window, if any."""
+        period = len(self._buffer)
+        evicted = self._buffer[self._head] if self.count >= period else None
+        self._buffer[self._head] = value
+        self._head = (self._head + 1) % period
+        self.count += 1
+        return evicted
+
+
+class _RollingMean:
+    """pandas ``rolling(period, min_periods=period).mean()`` as a stream (Kahan sums)."""
+
+    __slots__ = ("_window", "_min_periods", "_nobs", "_sum", "_neg_ct", "_comp_add", "_comp_remove")
+    __slots__ += ("_same_run", "_prev")
+
+    def __init__(self, period: int):
+        self._window = _RollingWindow(period)
+        self._min_periods = period
+        self._nobs = 0
+        self._sum = 0.0
+        self._neg_ct = 0
+        self._comp_add = 0.0
+        self._comp_remove = 0.0
+        self._same_run = 0  # trailing run of equal values; lets constant windows return exactly
+        self._prev = NAN
+
+    def _add(self, value: float) -> None:
+        if value != value:
+            return
+        self._nobs += 1
+        y = value - self._comp_add
+        t = self._sum + y
+        self._comp_add = t - self._sum - y
+        self._sum = t
+        if math.copysign(1.0, value) < 0:
+            self._neg_ct += 1
+        self._same_run = self._same_run + 1 if value == self._prev else 1
+        self._prev = value
+
+    def _remove(self, value: float) -> None:
+        if value != value:
+            return
+        self._nobs -= 1
+        y = -value - self._comp_remove
+        t = self._sum + y
+        self._comp_remove = t - self._sum - y
+        self._sum = t
+        if math.copysign(1.0, value) < 0:
+            self._neg_ct -= 1
+
+    def update(self, value: float) -> float:
+        first = self._window.count == 0
+        evicted = self._window.push(value)
+        if first or len(self._window) == 1:
+            self._nobs = self._neg_ct = self._same_run = 0
+            self._sum = self._comp_add = self._comp_remove = 0.0
+            self._prev = value
+        elif evicted is not None:
+            self._remove(evicted)
+        self._add(value)
+
+        nobs = self._nobs
+        if not (nobs >= self._min_periods and nobs > 0):
+            return NAN
+        if self._same_run >= nobs:
+            return self._prev
+        result = self._sum / nobs
+        if (self._neg_ct == 0 and result < 0) or (self._neg_ct == nobs and result > 0):
+            return 0.0
+        return result
+
+
+class _RollingVar:
+    """pandas ``rolling(period, min_periods=period).var(ddof)`` as a stream.
+
+    Welford updates with Kahan compensation; like pandas, the window is re-summed
+    from scratch whenever an update loses most of its significant digits.
+    """
+
+    __slots__ = ("_window", "_min_periods", "_ddof", "_nobs", "_mean", "_ssqdm", "_comp_add", "_comp_remove")
+
+    def __init__(self, period: int, ddof: int = 0):
+        self._window = _RollingWindow(period)
+        self._min_periods = period
+        self._ddof = ddof
+        self._nobs = 0.0
+        self._mean = 0.0
+        self._ssqdm = 0.0
+        self._comp_add = 0.0
+        self._comp_remove = 0.0
+
+    def _add(self, value: float) -> bool:
+        """Welford add; True if the update was ill-conditioned."""
+        if value != value:
+            return False
+        prev_m2 = self._ssqdm
+        self._nobs += 1
+        prev_mean = self._mean - self._comp_add
+        y = value - self._comp_add
+        t = y - self._mean
+        self._comp_add = t + self._mean - y
+        self._mean = self._mean + t / self._nobs if self._nobs else 0.0
+        self._ssqdm = self._ssqdm + (value - prev_mean) * (value - self._mean)
+        return prev_m2 * _INV_COND_TOL > self._ssqdm
+
+    def _remove(self, value: float) -> bool:
+        if value != value:
+            return False
+        prev_m2 = self._ssqdm
+        self._nobs -= 1
+        if not self._nobs:
+            self._mean = self._ssqdm = 0.0
+            return False
+        prev_mean = self._mean - self._comp_remove
+        y = value - self._comp_remove
+        t = y - self._mean
+        self._comp_remove = t + self._mean - y
+        self._mean = self._mean - t / self._nobs
+        self._ssqdm = self._ssqdm - (value - prev_mean) * (value - self._mean)
+        return prev_m2 * _INV_COND_TOL > self._ssqdm
+
+    def update(self, value: float) -> float:
+        first = self._window.count == 0
+        evicted = self._window.push(value)
+        unstable = False
+        recompute = first or len(self._window) == 1  # a 1-wide window never overlaps the previous one
+        if not recompute:
+            if evicted is not None:
+                unstable |= self._remove(evicted)
+            unstable |= self._add(value)
+        if recompute or unstable:
+            self._nobs = self._mean = self._ssqdm = self._comp_add = self._comp_remove = 0.0
+            for v in self._window:
+                self._add(v)
+
+        nobs = self._nobs
+        if not (nobs >= self._min_periods and nobs > self._ddof):
+            return NAN
+        return self._ssqdm / (nobs - self._ddof)
+
+
+class EMAState:
+    """Streaming ``ema(series, period)``."""
+
+    __slots__ = ("period", "value", "_ewm")
+
+    def __init__(self, period: int = 20):
+        self.period = period
+        self.value = NAN
+        self._ewm = _EWMean(com=(period - 1) / 2, min_periods=period)
+
+    def update(self, price: float) -> float:
+        self.value = self._ewm.update(float(price))
+        return self.value
+
+
+class SMAState:
+    """Streaming ``sma(series, period)`` over a ring buffer."""
+
+    __slots__ = ("period", "value", "_mean")
+
+    def __init__(self, period: int = 20):
+        self.period = period
+        self.value = NAN
+        self._mean = _RollingMean(period)
+
+    def update(self, price: float) -> float:
+        self.value = self._mean.update(float(price))
+        return self.value
+
+
+class RSIState:
+    """Streaming ``rsi(series, period)`` (Wilder smoothing)."""
+
+    __slots__ = ("period", "value", "_prev_price", "_avg_gain", "_avg_loss")
+
+    def __init__(self, period: int = 14):
+        alpha = 1 / period
+        com = (1 - alpha) / alpha  # same alpha -> com conversion as pandas ewm(alpha=...)
+        self.period = period
+        self.value = NAN
+        self._prev_price = NAN
+        self._avg_gain = _EWMean(com=com, min_periods=period)
+        self._avg_loss = _EWMean(com=com, min_periods=period)
+
+    def update(self, price: float) -> float:
+        price = float(price)
+        delta = price - self._prev_price
+        self._prev_price = price
+
+        # Mirrors rsi(): gain = delta.clip(lower=0), loss = -delta.clip(upper=0)
+        gain = delta if delta != delta else max(delta, 0.0)
+        loss = -(delta if delta != delta else min(delta, 0.0))
+        avg_gain = self._avg_gain.update(gain)
+        avg_loss = self._avg_loss.update(loss)
+
+        if avg_gain == 0 and avg_loss == 0:
+            self.value = 50.0
+        elif avg_gain != avg_gain or avg_loss != avg_loss or avg_loss == 0:
+            self.value = 100.0  # NaN (warmup / zero loss) is filled with 100
+        else:
+            self.value = 100 - (100 / (1 + avg_gain / avg_loss))
+        return self.value
+
+
+class MACDValue(NamedTuple):
+    macd: float
+    signal: float
+    histogram: float
+
+
+class MACDState:
+    """Streaming ``macd(series, fast_period, slow_period, signal_period)``."""
+
+    __slots__ = ("value", "_fast", "_slow", "_signal")
+
+    def __init__(self, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9):
+        self.value = MACDValue(NAN, NAN, NAN)
+        self._fast = EMAState(fast_period)
+        self._slow = EMAState(slow_period)
+        self._signal = EMAState(signal_period)
+
+    def update(self, price: float) -> MACDValue:
+        macd_line = self._fast.update(price) - self._slow.update(price)
+        signal_line = self._signal.update(macd_line)
+        self.value = MACDValue(macd_line, signal_line, macd_line - signal_line)
+        return self.value
+
+
+class BollingerValue(NamedTuple):
+    middle: float
+    upper: float
+    lower: float
+
+
+class BollingerState:
+    """Streaming ``bollinger_bands(series, period, std_dev)`` over ring buffers."""
+
+    __slots__ = ("std_dev", "value", "_mean", "_var")
+
+    def __init__(self, period: int = 20, std_dev: float = 2.0):
+        self.std_dev = std_dev
+        self.value = BollingerValue(NAN, NAN, NAN)
+        self._mean = _RollingMean(period)
+        self._var = _RollingVar(period, ddof=0)
+
+    def update(self, price: float) -> BollingerValue:
+        price = float(price)
+        middle = self._mean.update(price)
+        variance = self._var.update(price)
+        rolling_std = math.sqrt(variance) if variance >= 0 else (variance if variance != variance else 0.0)
+        band = rolling_std * self.std_dev
+        self.value = BollingerValue(middle, middle + band, middle - band)
+        return self.value
+
+
+type IndicatorState = EMAState | SMAState | RSIState | MACDState | BollingerState
+
+
+def feed(state: IndicatorState, values: Iterable[float]) -> list:
+    """Advance ``state`` over ``values``; return the per-value outputs."""
+    return [state.update(v) for v in values]
@@ -1,9 +1,38 @@
 from __future__ import annotations
 
+from collections.abc import Iterator, Mapping
 from typing import Any, cast
 
+import numpy as np
 import pandas as pd
-from polymarket_algo.indicators import ema, macd, rsi
+from polymarket_algo.indicators import EMAState, MACDState, RSIState, ema, macd, rsi
+
+
+class _CandleDirectionStream:
+    """Indicator states behind ``CandleDirectionStrategy.on_candle``."""
+
+    __slots__ = ("ema_fast", "ema_slow", "macd", "rsi", "rsi_overbought", "rsi_oversold")
+
+    def __init__(self, config: dict[str, Any]):
+        self.ema_fast = EMAState(int(config["ema_fast"]))
+        self.ema_slow = EMAState(int(config["ema_slow"]))
+        self.macd = MACDState(int(config["macd_fast"]), int(config["macd_slow"]), int(config["macd_signal"]))
+        self.rsi = RSIState(int(config["rsi_period"]))
+        self.rsi_overbought = float(config["rsi_overbought"])
+        self.rsi_oversold = float(config["rsi_oversold"])
+
+    def update(self, close: float) -> tuple[int, float]:
+        fast = self.ema_fast.update(close)
+        slow = self.ema_slow.update(close)
+        macd_line, signal_line, histogram = self.macd.update(close)
+        rsi_value = self.rsi.update(close)
+
+        # Same conditions as evaluate(); NaN comparisons are False there too.
+        if fast < slow and macd_line < signal_line and rsi_value < self.rsi_overbought:
+            return -1, 20.0 if histogram < 0 and 35 <= rsi_value <= 50 else 15.0
+        if fast > slow and macd_line > signal_line and rsi_value > self.rsi_oversold:
+            return 1, 20.0 if histogram > 0 and 50 <= rsi_value <= 65 else 15.0
+        return 0, 0.0
 
 
 class CandleDirectionStrategy:
@@ -11,6 +40,8 @@ class CandleDirectionStrategy:
     description = "EMA/MACD/RSI alignment strategy with optional stronger position sizing"
     timeframe = "5m"
 
+    _stream: _CandleDirectionStream | None = None
+
     @property
     def default_params(self) -> dict[str, Any]:
         return {
@@ -76,3 +107,113 @@ class CandleDirectionStrategy:
         size.loc[signal == 0] = 0.0
 
         return pd.DataFrame({"signal": signal, "size": size}, index=candles.index)
+
+    def evaluate_batch(
+        self,
+        candles: pd.DataFrame,
+        param_sets: list[dict[str, Any]],
+        chunk_size: int,
+    ) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        """Evaluate many param sets, computing each distinct indicator series once.
+
+        Conditions are built per unique indicator key (EMA pair, MACD triple, RSI
+        period/threshold), then gathered into (candles x param sets) matrices chunk by chunk.
+        """
+        configs = [{**self.default_params, **params} for params in param_sets]
+        close = cast(pd.Series, candles["close"])
+
+        ema_lines: dict[int, np.ndarray] = {}
+        rsi_lines: dict[int, np.ndarray] = {}
+
+        def ema_line(period: int) -> np.ndarray:
+            if period not in ema_lines:
+                ema_lines[period] = ema(close, period).to_numpy(dtype=np.float64)
+            return ema_lines[period]
+
+        def rsi_line(period: int) -> np.ndarray:
+            if period not in rsi_lines:
+                rsi_lines[period] = rsi(close, period=period).to_numpy(dtype=np.float64)
+            return rsi_lines[period]
+
+        ema_keys: dict[tuple[int, int], int] = {}
+        macd_keys: dict[tuple[int, int, int], int] = {}
+        oversold_keys: dict[tuple[int, float], int] = {}
+        overbought_keys: dict[tuple[int, float], int] = {}
+        rsi_keys: dict[int, int] = {}
+        combo_index = np.empty((len(configs), 5), dtype=np.intp)
+
+        for i, config in enumerate(configs):
+            rsi_period = int(config["rsi_period"])
+            combo_index[i] = (
+                ema_keys.setdefault((int(config["ema_fast"]), int(config["ema_slow"])), len(ema_keys)),
+                macd_keys.setdefault(
+                    (int(config["macd_fast"]), int(config["macd_slow"]), int(config["macd_signal"])), len(macd_keys)
+                ),
+                oversold_keys.setdefault((rsi_period, float(config["rsi_oversold"])), len(oversold_keys)),
+                overbought_keys.setdefault((rsi_period, float(config["rsi_overbought"])), len(overbought_keys)),
+                rsi_keys.setdefault(rsi_period, len(rsi_keys)),
+            )
+
+        n = len(candles)
+        bullish_ema = np.empty((n, len(ema_keys)), dtype=bool)
+        bearish_ema = np.empty((n, len(ema_keys)), dtype=bool)
+        for (fast, slow), j in ema_keys.items():
+            fast_line, slow_line = ema_line(fast), ema_line(slow)
+            bullish_ema[:, j] = fast_line > slow_line
+            bearish_ema[:, j] = fast_line < slow_line
+
+        bullish_macd = np.empty((n, len(macd_keys)), dtype=bool)
+        bearish_macd = np.empty((n, len(macd_keys)), dtype=bool)
+        hist_pos = np.empty((n, len(macd_keys)), dtype=bool)
+        hist_neg = np.empty((n, len(macd_keys)), dtype=bool)
+        for (fast, slow, signal_period), j in macd_keys.items():
+            macd_df = macd(close, fast_period=fast, slow_period=slow, signal_period=signal_period)
+            macd_values = macd_df["macd"].to_numpy(dtype=np.float64)
+            signal_line = macd_df["signal"].to_numpy(dtype=np.float64)
+            histogram = macd_df["histogram"].to_numpy(dtype=np.float64)
+            bullish_macd[:, j] = macd_values > signal_line
+            bearish_macd[:, j] = macd_values < signal_line
+            hist_pos[:, j] = histogram > 0
+            hist_neg[:, j] = histogram < 0
+
+        bullish_rsi = np.empty((n, len(oversold_keys)), dtype=bool)
+        for (period, oversold), j in oversold_keys.items():
+            bullish_rsi[:, j] = rsi_line(period) > oversold
+        bearish_rsi = np.empty((n, len(overbought_keys)), dtype=bool)
+        for (period, overbought), j in overbought_keys.items():
+            bearish_rsi[:, j] = rsi_line(period) < overbought
+
+        strong_long_rsi = np.empty((n, len(rsi_keys)), dtype=bool)
+        strong_short_rsi = np.empty((n, len(rsi_keys)), dtype=bool)
+        for period, j in rsi_keys.items():
+            values = rsi_line(period)
+            strong_long_rsi[:, j] = (values >= 50) & (values <= 65)
+            strong_short_rsi[:, j] = (values >= 35) & (values <= 50)
+
+        for start in range(0, len(configs), chunk_size):
+            e, m, lo, hi, r = combo_index[start : start + chunk_size].T
+
+            long_cond = bullish_ema[:, e] & bullish_macd[:, m] & bullish_rsi[:, lo]
+            short_cond = bearish_ema[:, e] & bearish_macd[:, m] & bearish_rsi[:, hi]
+
+            signals = np.zeros(long_cond.shape, dtype=np.int64)
+            signals[long_cond] = 1
+            signals[short_cond] = -1
+
+            strong = (long_cond & hist_pos[:, m] & strong_long_rsi[:, r]) | (
+                short_cond & hist_neg[:, m] & strong_short_rsi[:, r]
+            )
+            sizes = np.where(signals == 0, 0.0, np.where(strong, 20.0, 15.0))
+            yield signals, sizes
+
+    def warmup(self, candles: pd.DataFrame, **params: Any) -> None:
+        """Start a live stream with ``params`` and replay ``candles`` through it."""
+        self._stream = _CandleDirectionStream({**self.default_params, **params})
+        for close in candles["close"].to_numpy(dtype=np.float64):
+            self._stream.update(float(close))
+
+    def on_candle(self, candle: Mapping[str, Any] | pd.Series) -> tuple[int, float]:
+        """(signal, size) for the next closed candle, in O(1)."""
+        if self._stream is None:
+            raise RuntimeError("warmup() must be called before on_candle()")
+        return self._stream.update(float(candle["close"]))
@@ -1,4 +1,32 @@
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+import numpy as np
 import pandas as pd
+from polymarket_algo.indicators import candle_directions, streak_lengths
+
+
+class _StreakStream:
+    """Running candle-direction streak behind ``StreakReversalStrategy.on_candle``."""
+
+    __slots__ = ("trigger", "size", "prev_close", "direction", "streak")
+
+    def __init__(self, trigger: int, size: float):
+        self.trigger = trigger
+        self.size = size
+        self.prev_close = float("nan")
+        self.direction = 0
+        self.streak = 0
+
+    def update(self, close: float) -> tuple[int, float]:
+        # Like evaluate(): a non-rising candle (including the first) counts as down.
+        direction = 1 if close - self.prev_close > 0 else -1
+        self.prev_close = close
+        self.streak = self.streak + 1 if direction == self.direction else 1
+        self.direction = direction
+        if self.streak >= self.trigger:
+            return -direction, self.size
+        return 0, 0.0
 
 
 class StreakReversalStrategy:
@@ -6,6 +34,8 @@ class StreakReversalStrategy:
     description = "Reversal on directional candle streak"
     timeframe = "5m"
 
+    _stream: _StreakStream | None = None
+
     @property
     def default_params(self):
         return {"trigger": 4, "size": 15.0}
@@ -17,11 +47,37 @@ class StreakReversalStrategy:
     def evaluate(self, candles: pd.DataFrame, **params):
         trigger = int(params.get("trigger", 4))
         size_val = float(params.get("size", 15.0))
-        direction = (candles["close"].diff() > 0).map({True: 1, False: -1}).fillna(0)
-        streak = direction.groupby((direction != direction.shift()).cumsum()).cumcount() + 1
-        signal = pd.Series(0, index=candles.index, dtype=int)
-        signal[(streak >= trigger) & (direction == 1)] = -1
-        signal[(streak >= trigger) & (direction == -1)] = 1
-        size = pd.Series(size_val, index=candles.index)
-        size[signal == 0] = 0.0
+        direction = candle_directions(candles["close"].to_numpy(dtype=np.float64))
+        streak = streak_lengths(direction)
+        signal = np.where(streak >= trigger, -direction, 0)
+        size = np.where(signal != 0, size_val, 0.0)
         return pd.DataFrame({"signal": signal, "size": size}, index=candles.index)
+
+    def evaluate_batch(
+        self,
+        candles: pd.DataFrame,
+        param_sets: list[dict[str, Any]],
+        chunk_size: int,
+    ) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        """Evaluate many param sets from one shared direction/streak array."""
+        direction = candle_directions(candles["close"].to_numpy(dtype=np.float64))
+        streak = streak_lengths(direction)
+        triggers = np.array([int(p.get("trigger", 4)) for p in param_sets], dtype=np.int64)
+        sizes = np.array([float(p.get("size", 15.0)) for p in param_sets], dtype=np.float64)
+
+        for start in range(0, len(param_sets), chunk_size):
+            chunk = slice(start, start + chunk_size)
+            signals = np.where(streak[:, None] >= triggers[None, chunk], -direction[:, None], 0)
+            yield signals, np.where(signals != 0, sizes[None, chunk], 0.0)
+
+    def warmup(self, candles: pd.DataFrame, **params: Any) -> None:
+        """Start a live stream with ``params`` and replay ``candles`` through it."""
+        self._stream = _StreakStream(int(params.get("trigger", 4)), float(params.get("size", 15.0)))
+        for close in candles["close"].to_numpy(dtype=float):
+            self._stream.update(float(close))
+
+    def on_candle(self, candle: Mapping[str, Any] | pd.Series) -> tuple[int, float]:
+        """(signal, size) for the next closed candle, in O(1)."""
+        if self._stream is None:
+            raise RuntimeError("warmup() must be called before on_candle()")
+        return self._stream.update(float(candle["close"]))
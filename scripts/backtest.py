@@ -2,6 +2,7 @@ from pathlib import Path
 
 import pandas as pd
 from polymarket_algo.backtest.engine import parameter_sweep, run_backtest, walk_forward_split
+from polymarket_algo.data import partition_paths, read_candles
 from polymarket_algo.strategies.candle_direction import CandleDirectionStrategy
 
 PARAM_GRID = {
@@ -17,15 +18,18 @@ PARAM_GRID = {
 
 
 def main() -> None:
-    df = pd.read_parquet(Path("data") / "btc_1h.parquet")
-    df["open_time"] = pd.to_datetime(df["open_time"], utc=True)
-    candles = df.set_index("open_time").sort_index()
+    if partition_paths("BTCUSDT", "1h"):
+        candles = read_candles("BTCUSDT", "1h").set_index("open_time")
+    else:
+        df = pd.read_parquet(Path("data") / "btc_1h.parquet")
+        df["open_time"] = pd.to_datetime(df["open_time"], utc=True)
+        candles = df.set_index("open_time").sort_index()
     train, test = walk_forward_split(candles)
     strategy = CandleDirectionStrategy()
-    sweep = parameter_sweep(train, strategy.evaluate, PARAM_GRID)
+    sweep = parameter_sweep(train, strategy, PARAM_GRID)
     best = sweep.iloc[0].to_dict()
     params = {k: best[k] for k in PARAM_GRID}
-    result = run_backtest(test, strategy.evaluate, params)
+    result = run_backtest(test, strategy, params)
     print(result.metrics)
 
 
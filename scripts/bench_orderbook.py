@@ -0,0 +1,142 @@
+"""Microbenchmark: tick-keyed CachedOrderBook vs the previous sorted-list book.
+
+Replays one ``book`` snapshot followed by ``price_change`` deltas through both
+implementations, checks they end with the same levels, best bid/ask and mid, and
+reports throughput. Pass ``--replay`` a JSONL capture of one token's market-channel
+messages (one object per line with ``event_type`` ``book`` or ``price_change``) to replay
+real traffic instead of the synthetic random walk.
+
+Usage: python scripts/bench_orderbook.py [--levels 200] [--updates 200000] [--tick 0.001] [--replay FILE]
+"""
+
+import argparse
+import json
+import random
+import time
+from dataclasses import dataclass, field
+
+from polymarket_algo.executor.orderbook import CachedOrderBook
+
+
+@dataclass
+class _Level:
+    price: float
+    size: float
+
+
+@dataclass
+class ListOrderBook:
+    """The book as it was before: linear scan with float epsilon, full re-sort per delta."""
+
+    token_id: str
+    bids: list[_Level] = field(default_factory=list)
+    asks: list[_Level] = field(default_factory=list)
+    best_bid: float = 0.0
+    best_ask: float = 0.0
+    mid: float = 0.5
+
+    def update_from_snapshot(self, data: dict):
+        self.bids = [_Level(float(b["price"]), float(b["size"])) for b in data.get("bids", [])]
+        self.asks = [_Level(float(a["price"]), float(a["size"])) for a in data.get("asks", [])]
+        self._recalculate()
+
+    def update_from_delta(self, data: dict):
+        for change in data.get("changes", []):
+            side = change.get("side")
+            price = float(change.get("price", 0))
+            size = float(change.get("size", 0))
+            if side == "BUY":
+                self._update_level(self.bids, price, size, reverse=True)
+            elif side == "SELL":
+                self._update_level(self.asks, price, size, reverse=False)
+        self._recalculate()
+
+    def _update_level(self, levels: list[_Level], price: float, size: float, reverse: bool):
+        for i, level in enumerate(levels):
+            if abs(level.price - price) < 0.0001:
+                if size == 0:
+                    levels.pop(i)
+                else:
+                    level.size = size
+                return
+        if size > 0:
+            levels.append(_Level(price, size))
+            levels.sort(key=lambda x: x.price, reverse=reverse)
+
+    def _recalculate(self):
+        if self.bids:
+            self.bids.sort(key=lambda x: x.price, reverse=True)
+            self.best_bid = self.bids[0].price
+        if self.asks:
+            self.asks.sort(key=lambda x: x.price)
+            self.best_ask = self.asks[0].price
+        if self.best_bid > 0 and self.best_ask > 0:
+            self.mid = (self.best_bid + self.best_ask) / 2
+
+
+def _synthetic(levels: int, updates: int, tick: float) -> list[dict]:
+    """Snapshot with ``levels`` per side around 0.5, then single-level deltas drifting with the mid."""
+    rng = random.Random(0)
+    decimals = len(f"{tick:f}".rstrip("0").split(".")[1])
+
+    def price(ticks: int) -> str:
+        return f"{min(max(ticks, 1), round(1 / tick) - 1) * tick:.{decimals}f}"
+
+    mid = round(0.5 / tick)
+    snapshot = {
+        "event_type": "book",
+        "bids": [{"price": price(mid - 1 - i), "size": "100"} for i in range(levels)],
+        "asks": [{"price": price(mid + 1 + i), "size": "100"} for i in range(levels)],
+    }
+    messages = [snapshot]
+    for _ in range(updates):
+        mid += rng.choice((-1, 0, 0, 1))
+        side = rng.choice(("BUY", "SELL"))
+        offset = int(rng.expovariate(0.1)) + 1
+        ticks = mid - offset if side == "BUY" else mid + offset
+        size = 0 if rng.random() < 0.3 else round(rng.uniform(1, 500), 2)
+        change = {"side": side, "price": price(ticks), "size": str(size)}
+        messages.append({"event_type": "price_change", "changes": [change]})
+    return messages
+
+
+def _replay(book, messages: list[dict]) -> float:
+    start = time.perf_counter()
+    for message in messages:
+        if message.get("event_type") == "book":
+            book.update_from_snapshot(message)
+        elif message.get("event_type") == "price_change":
+            book.update_from_delta(message)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="CachedOrderBook replay benchmark")
+    parser.add_argument("--levels", type=int, default=200)
+    parser.add_argument("--updates", type=int, default=200_000)
+    parser.add_argument("--tick", type=float, default=0.001)
+    parser.add_argument("--replay", help="JSONL file of captured market-channel messages")
+    args = parser.parse_args()
+
+    if args.replay:
+        with open(args.replay) as f:
+            messages = [json.loads(line) for line in f if line.strip()]
+    else:
+        messages = _synthetic(args.levels, args.updates, args.tick)
+
+    old, new = ListOrderBook("bench"), CachedOrderBook("bench")
+    old_time = _replay(old, messages)
+    new_time = _replay(new, messages)
+
+    assert (old.best_bid, old.best_ask, old.mid) == (new.best_bid, new.best_ask, new.mid)
+    assert [(lv.price, lv.size) for lv in old.bids] == [(lv.price, lv.size) for lv in new.bids]
+    assert [(lv.price, lv.size) for lv in old.asks] == [(lv.price, lv.size) for lv in new.asks]
+
+    print(f"messages={len(messages):,}  final depth bids={len(new.bids)} asks={len(new.asks)}")
+    print(f"sorted list : {old_time * 1000:8.1f} ms  {len(messages) / old_time:12,.0f} msg/s")
+    print(f"tick-keyed  : {new_time * 1000:8.1f} ms  {len(messages) / new_time:12,.0f} msg/s")
+    print(f"speedup {old_time / new_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
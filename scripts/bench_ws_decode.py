@@ -0,0 +1,116 @@
+"""Microbenchmark: WebSocket frame decoding, per message, for each JSON backend.
+
+Compares the previous handler path (bytes -> str -> ``json.loads`` -> ``float(str)``
+per level) with ``decode_messages`` on every installed backend (orjson, msgspec,
+stdlib). Pass ``--corpus`` a JSONL capture of raw market-channel frames (one frame
+per line) to measure real traffic; otherwise a synthetic mix is generated.
+
+Usage: python scripts/bench_ws_decode.py [--messages 50000] [--levels 50] [--repeat 5] [--corpus FILE]
+"""
+
+import argparse
+import json
+import random
+import time
+
+from polymarket_algo.executor import messages
+
+
+def _synthetic(count: int, levels: int) -> list[bytes]:
+    """~2% book snapshots, ~88% price_change, ~10% last_trade_price for one asset."""
+    rng = random.Random(0)
+    asset = str(rng.getrandbits(250))
+    market = "0x" + "ab" * 32
+    frames = []
+    for i in range(count):
+        ts = str(1_760_000_000_000 + i * 50)
+        roll = rng.random()
+        if roll < 0.02:
+            msg = {
+                "event_type": "book",
+                "asset_id": asset,
+                "market": market,
+                "timestamp": ts,
+                "hash": f"{rng.getrandbits(160):040x}",
+                "bids": [
+                    {"price": f"{0.49 - k * 0.001:.3f}", "size": f"{rng.uniform(1, 900):.2f}"} for k in range(levels)
+                ],
+                "asks": [
+                    {"price": f"{0.51 + k * 0.001:.3f}", "size": f"{rng.uniform(1, 900):.2f}"} for k in range(levels)
+                ],
+            }
+        elif roll < 0.90:
+            change = {"price": f"{rng.uniform(0.3, 0.7):.3f}", "side": rng.choice(["BUY", "SELL"]), "size": "12.5"}
+            msg = {
+                "event_type": "price_change",
+                "asset_id": asset,
+                "market": market,
+                "timestamp": ts,
+                "hash": f"{rng.getrandbits(160):040x}",
+                "changes": [change],
+            }
+        else:
+            msg = {
+                "event_type": "last_trade_price",
+                "asset_id": asset,
+                "market": market,
+                "price": f"{rng.uniform(0.3, 0.7):.3f}",
+                "size": "25",
+                "side": "BUY",
+                "timestamp": ts,
+            }
+        frames.append(json.dumps(msg).encode())
+    return frames
+
+
+def _previous(raw: bytes) -> None:
+    """What the handler did before: decode, stdlib loads, float() per level on dict access."""
+    data = json.loads(raw.decode("utf-8"))
+    msg_type = data.get("type", data.get("event_type", ""))
+    if msg_type == "book":
+        [(float(b["price"]), float(b["size"])) for b in data.get("bids", [])]
+        [(float(a["price"]), float(a["size"])) for a in data.get("asks", [])]
+    elif msg_type == "price_change":
+        for change in data.get("changes", []):
+            float(change.get("price", 0)), float(change.get("size", 0))
+    elif msg_type == "last_trade_price":
+        float(data.get("price", 0)), float(data.get("size", 0)), float(data.get("timestamp", 0))
+
+
+def _measure(decode, frames: list[bytes], repeat: int) -> float:
+    """Best CPU seconds per message over ``repeat`` passes."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.process_time()
+        for raw in frames:
+            decode(raw)
+        best = min(best, time.process_time() - start)
+    return best / len(frames)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="WebSocket frame decoding microbenchmark")
+    parser.add_argument("--messages", type=int, default=50_000)
+    parser.add_argument("--levels", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--corpus", help="JSONL file of raw market-channel frames")
+    args = parser.parse_args()
+
+    if args.corpus:
+        with open(args.corpus, "rb") as f:
+            frames = [line.rstrip(b"\n") for line in f if line.strip()]
+    else:
+        frames = _synthetic(args.messages, args.levels)
+
+    print(f"frames={len(frames):,}  mean size {sum(map(len, frames)) / len(frames):.0f} B")
+    baseline = _measure(_previous, frames, args.repeat)
+    print(f"{'previous (str + json)':24s}: {baseline * 1e6:7.2f} us/msg")
+    for name in messages.BACKENDS:
+        messages.set_json_decoder(name)
+        per_msg = _measure(messages.decode_messages, frames, args.repeat)
+        print(f"{'decode_messages/' + name:24s}: {per_msg * 1e6:7.2f} us/msg  ({baseline / per_msg:.2f}x)")
+    messages.set_json_decoder()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,29 @@
-from datetime import UTC, datetime
-from pathlib import Path
+import argparse
+import time
 
-from polymarket_algo.data.binance import INTERVALS, START, SYMBOLS, fetch_klines
+from polymarket_algo.data.binance import main as fetch_all
+from polymarket_algo.data.outcomes import OutcomeStore
 
 
 def main() -> None:
-    start_ms = int(START.timestamp() * 1000)
-    end_ms = int(datetime.now(tz=UTC).timestamp() * 1000)
-    data_dir = Path("data")
-    data_dir.mkdir(exist_ok=True)
-    for symbol in SYMBOLS:
-        asset = symbol.replace("USDT", "").lower()
-        for interval in INTERVALS:
-            df = fetch_klines(symbol, interval, start_ms, end_ms)
-            out = data_dir / f"{asset}_{interval}.parquet"
-            df.to_parquet(out, index=False)
-            print(f"Saved {len(df):,} candles -> {out}")
+    parser = argparse.ArgumentParser(description="Fetch Binance klines into the local candle store")
+    parser.add_argument("--full", action="store_true", help="Refetch all history and rewrite the flat parquet files")
+    parser.add_argument(
+        "--outcomes-days",
+        type=int,
+        default=0,
+        help="Also backfill resolved btc-updown-5m markets for this many days (incremental after the first run)",
+    )
+    args = parser.parse_args()
+    fetch_all(full=args.full)
+
+    if args.outcomes_days:
+        from polymarket_algo.executor.client import PolymarketClient
+
+        client = PolymarketClient()
+        start_ts = int(time.time()) - args.outcomes_days * 86_400
+        written = OutcomeStore().update(client.get_market, start_ts=start_ts, fetch_markets=client.get_markets)
+        print(f"btc-updown-5m: {written:,} new resolved markets")
 
 
 if __name__ == "__main__":
@@ -1,17 +1,15 @@
 from __future__ import annotations
 
+import argparse
 import json
-import sys
 from pathlib import Path
 
 import pandas as pd
-
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.append(str(ROOT))
-
-from backtest_engine import parameter_sweep, run_backtest, walk_forward_split
-from strategies.candle_direction import candle_direction_strategy
+from polymarket_algo.backtest import walk_forward
+from polymarket_algo.backtest.engine import parameter_sweep, run_backtest, walk_forward_split
+from polymarket_algo.data import load_resampled
+from polymarket_algo.data.resample import source_interval
+from polymarket_algo.strategies.candle_direction import CandleDirectionStrategy
 
 PARAM_GRID = {
     "ema_fast": [8, 12, 16],
@@ -33,6 +31,11 @@ TARGETS = [
 
 
 def load_candles(asset: str, timeframe: str) -> pd.DataFrame:
+    symbol = f"{asset.upper()}USDT"
+    if source_interval(symbol, timeframe):
+        # Stored natively, or derived (and cached) from the finest stored interval.
+        return load_resampled(symbol, timeframe).set_index("open_time")
+
     path = Path("data") / f"{asset}_{timeframe}.parquet"
     df = pd.read_parquet(path)
     df["open_time"] = pd.to_datetime(df["open_time"], utc=True)
@@ -40,7 +43,19 @@ def load_candles(asset: str, timeframe: str) -> pd.DataFrame:
     return df
 
 
+def best_params_from(row: dict) -> dict:
+    """The grid's params from a sweep or fold row, as Python scalars (rows are object dtype)."""
+    return {k: row[k].item() if hasattr(row[k], "item") else row[k] for k in PARAM_GRID}
+
+
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Walk-forward CandleDirection backtests")
+    parser.add_argument("--n-jobs", type=int, default=1, help="Sweep worker processes (-1 = all cores)")
+    parser.add_argument("--folds", type=int, default=1, help="Walk-forward folds (1 = single 75/25 split)")
+    parser.add_argument("--mode", choices=["rolling", "anchored"], default="rolling", help="Walk-forward windows")
+    args = parser.parse_args()
+
+    strategy = CandleDirectionStrategy()
     out_dir = Path("backtest_results")
     out_dir.mkdir(exist_ok=True)
 
@@ -48,13 +63,23 @@ def main() -> None:
 
     for asset, timeframe in TARGETS:
         candles = load_candles(asset, timeframe)
+
+        if args.folds > 1:
+            wf = walk_forward(candles, strategy, PARAM_GRID, n_folds=args.folds, mode=args.mode, n_jobs=args.n_jobs)
+            wf.folds.to_csv(out_dir / f"folds_{asset}_{timeframe}.csv", index=False)
+            wf.oos_pnl_curve.to_csv(out_dir / f"equity_{asset}_{timeframe}.csv", index=True)
+            last_fold = wf.folds.iloc[-1].to_dict()
+            best_params = best_params_from(last_fold)
+            summary.append({"asset": asset, "timeframe": timeframe, "best_params": best_params, **wf.metrics})
+            continue
+
         train, test = walk_forward_split(candles, train_ratio=0.75)
 
-        sweep_df = parameter_sweep(train, candle_direction_strategy, PARAM_GRID)
+        sweep_df = parameter_sweep(train, strategy, PARAM_GRID, n_jobs=args.n_jobs)
         best_row = sweep_df.iloc[0].to_dict()
-        best_params = {k: best_row[k] for k in PARAM_GRID.keys()}
+        best_params = best_params_from(best_row)
 
-        test_result = run_backtest(test, candle_direction_strategy, best_params)
+        test_result = run_backtest(test, strategy, best_params)
 
         sweep_path = out_dir / f"sweep_{asset}_{timeframe}.csv"
         trades_path = out_dir / f"trades_{asset}_{timeframe}.csv"
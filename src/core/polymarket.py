@@ -3,15 +3,20 @@
 
 import json
 import math
+import sqlite3
 import time
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from polymarket_algo.executor.market_store import MarketStore, shared_market_store
+from polymarket_algo.executor.transport import PooledTransport, shared_transport
 
 from src.config import Config
 
+if TYPE_CHECKING:
+    from polymarket_algo.data.outcomes import OutcomeStore
+
 
 @dataclass
 class DelayImpactModel:
@@ -116,48 +121,47 @@ class PolymarketClient:
     """Read-only client for Polymarket APIs (no auth needed).
 
     Features:
-    - Connection pooling for better performance
+    - Connection pooling shared process-wide (see ``transport``)
     - Configurable timeouts and retries
+    - Per-endpoint latency histograms in ``stats``
     - Token ID caching for BTC 5-min markets
     """
 
-    def __init__(self, timeout: float | None = None, use_cache: bool = True):
+    def __init__(
+        self,
+        timeout: float | None = None,
+        use_cache: bool = True,
+        outcome_store: "OutcomeStore | None" = None,
+        transport: PooledTransport | None = None,
+        market_store: MarketStore | None = None,
+    ):
         self.gamma = Config.GAMMA_API
         self.clob = Config.CLOB_API
         self.timeout = timeout or Config.REST_TIMEOUT
 
-        # Create session with connection pooling
-        self.session = requests.Session()
-
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=Config.REST_RETRIES,
-            backoff_factor=0.1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET"],
-        )
-
-        # Configure connection pooling
-        adapter = HTTPAdapter(
-            pool_connections=20,
-            pool_maxsize=20,
-            max_retries=retry_strategy,
-        )
-        self.session.mount("https://", adapter)
-
-        self.session.headers.update(
-            {
-                "User-Agent": "PolymarketBot/2.0",
-                "Accept": "application/json",
-                "Connection": "keep-alive",
-            }
-        )
+        # Pooled, retrying transport shared with the other REST clients in this process;
+        # it has the same get() signature as requests.Session and times every request
+        self.transport = transport or shared_transport()
+        self.session = self.transport
 
         # Token ID cache for BTC 5-min markets: timestamp -> (up_token, down_token)
         self._token_cache: dict[int, tuple[str | None, str | None]] = {}
         self._market_cache: dict[int, Market] = {}
         self._cache_ttl = 300  # 5 minutes
         self._use_cache = use_cache
+        # Persistent cache of resolved markets (None when Config.MARKET_CACHE_DB is empty)
+        self.market_store = market_store if market_store is not None else shared_market_store()
+        # Local history of resolved windows; get_recent_outcomes only fetches what it lacks
+        self.outcome_store = outcome_store
+
+    @property
+    def stats(self) -> dict:
+        """Transport counters and latency histograms, plus cache sizes."""
+        return {
+            **self.transport.stats,
+            "market_cache_size": len(self._market_cache),
+            "token_cache_size": len(self._token_cache),
+        }
 
     def get_market(self, timestamp: int, use_cache: bool = True) -> Market | None:
         """Fetch a BTC 5-min market by its timestamp.
@@ -182,6 +186,12 @@ class PolymarketClient:
                 # Market still in window - cache is reasonably fresh
                 return cached
             # Otherwise, market may have closed/resolved - fetch fresh data
+        elif use_cache and self._use_cache and self.market_store is not None:
+            stored = self.market_store.get_market(timestamp, Market)
+            if stored is not None:
+                self._token_cache[timestamp] = (stored.up_token_id, stored.down_token_id)
+                self._market_cache[timestamp] = stored
+                return stored
 
         slug = f"btc-updown-5m-{timestamp}"
         try:
@@ -255,6 +265,8 @@ class PolymarketClient:
             # Cache market
             if self._use_cache:
                 self._market_cache[timestamp] = market
+            if self.market_store is not None and self.market_store.wants(market):
+                self._persist(market)
 
             return market
         except requests.exceptions.Timeout:
@@ -264,6 +276,13 @@ class PolymarketClient:
             print(f"[polymarket] Error fetching {slug}: {e}")
             return None
 
+    def _persist(self, market: Market) -> None:
+        # A store failure (e.g. "database is locked" with a shared MARKET_CACHE_DB) must not lose the fetch
+        try:
+            self.market_store.put_market(market)
+        except sqlite3.Error as e:
+            print(f"[polymarket] Market store write failed: {e}")
+
     def get_token_ids(self, timestamp: int) -> tuple[str | None, str | None]:
         """Get cached token IDs for a market, fetching if needed.
 
@@ -271,6 +290,10 @@ class PolymarketClient:
         """
         if timestamp in self._token_cache:
             return self._token_cache[timestamp]
+        stored = self.market_store.get_token_ids(timestamp) if self.market_store is not None else None
+        if stored is not None:
+            self._token_cache[timestamp] = stored
+            return stored
 
         # Fetch market to populate cache
         market = self.get_market(timestamp)
@@ -299,7 +322,14 @@ class PolymarketClient:
         return [current_window + (i * 300) for i in range(count)]
 
     def get_recent_outcomes(self, count: int = 10) -> list[str]:
-        """Get the last N resolved market outcomes (oldest first)."""
+        """Get the last N resolved market outcomes (oldest first).
+
+        With an ``outcome_store`` the outcomes come from the store, which is first
+        topped up with the windows it does not have yet.
+        """
+        if self.outcome_store is not None:
+            return self.outcome_store.recent_outcomes(count, self.get_market)
+
         now = int(time.time())
         current_window = (now // 300) * 300
         outcomes: list[str] = []
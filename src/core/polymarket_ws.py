@@ -9,125 +9,13 @@ import json
 import threading
 import time
 from collections.abc import Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 import websockets
+from polymarket_algo.executor.orderbook import CachedOrderBook, OrderBookLevel  # noqa: F401 - re-exported
 from websockets.exceptions import ConnectionClosed
 
 
-@dataclass
-class OrderBookLevel:
-    """Single price level in orderbook."""
-
-    price: float
-    size: float
-
-
-@dataclass
-class CachedOrderBook:
-    """Cached order book state with timestamp."""
-
-    token_id: str
-    bids: list[OrderBookLevel] = field(default_factory=list)
-    asks: list[OrderBookLevel] = field(default_factory=list)
-    timestamp: float = 0.0
-    best_bid: float = 0.0
-    best_ask: float = 0.0
-    mid: float = 0.5
-
-    def update_from_snapshot(self, data: dict):
-        """Update from full orderbook snapshot."""
-        self.bids = [OrderBookLevel(float(b["price"]), float(b["size"])) for b in data.get("bids", [])]
-        self.asks = [OrderBookLevel(float(a["price"]), float(a["size"])) for a in data.get("asks", [])]
-        self._recalculate()
-
-    def update_from_delta(self, data: dict):
-        """Update from orderbook delta (price_change event)."""
-        changes = data.get("changes", [])
-        for change in changes:
-            side = change.get("side")
-            price = float(change.get("price", 0))
-            size = float(change.get("size", 0))
-
-            if side == "BUY":
-                self._update_level(self.bids, price, size, reverse=True)
-            elif side == "SELL":
-                self._update_level(self.asks, price, size, reverse=False)
-        self._recalculate()
-
-    def _update_level(self, levels: list[OrderBookLevel], price: float, size: float, reverse: bool):
-        """Update a single price level."""
-        # Find existing level
-        for i, level in enumerate(levels):
-            if abs(level.price - price) < 0.0001:
-                if size == 0:
-                    levels.pop(i)
-                else:
-                    level.size = size
-                return
-
-        # Add new level if size > 0
-        if size > 0:
-            levels.append(OrderBookLevel(price, size))
-            levels.sort(key=lambda x: x.price, reverse=reverse)
-
-    def _recalculate(self):
-        """Recalculate best bid/ask and mid."""
-        self.timestamp = time.time()
-        if self.bids:
-            self.bids.sort(key=lambda x: x.price, reverse=True)
-            self.best_bid = self.bids[0].price
-        if self.asks:
-            self.asks.sort(key=lambda x: x.price)
-            self.best_ask = self.asks[0].price
-        if self.best_bid > 0 and self.best_ask > 0:
-            self.mid = (self.best_bid + self.best_ask) / 2
-
-    def get_execution_price(self, side: str, amount_usd: float) -> tuple[float, float, float]:
-        """Calculate execution price by walking the book.
-
-        Returns: (execution_price, slippage_pct, fill_pct)
-        """
-        levels = self.asks if side == "BUY" else self.bids
-
-        if not levels:
-            return self.mid, 0.0, 0.0
-
-        remaining = amount_usd
-        total_shares = 0.0
-        total_cost = 0.0
-
-        for level in levels:
-            if remaining <= 0:
-                break
-            level_value = level.price * level.size
-            if level_value >= remaining:
-                shares = remaining / level.price
-                total_shares += shares
-                total_cost += remaining
-                remaining = 0
-            else:
-                total_shares += level.size
-                total_cost += level_value
-                remaining -= level_value
-
-        if total_shares == 0:
-            return self.mid, 0.0, 0.0
-
-        exec_price = total_cost / total_shares
-        filled_amount = amount_usd - remaining
-        fill_pct = (filled_amount / amount_usd * 100) if amount_usd > 0 else 100.0
-
-        # Calculate slippage vs best price
-        best_price = self.best_ask if side == "BUY" else self.best_bid
-        if best_price > 0:
-            slippage_pct = abs(exec_price - best_price) / best_price * 100
-        else:
-            slippage_pct = 0.0
-
-        return exec_price, slippage_pct, fill_pct
-
-
 @dataclass
 class TradeEvent:
     """Real-time trade event from WebSocket."""
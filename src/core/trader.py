@@ -782,15 +782,18 @@ class TradingState:
         print(f"Current Bankroll: ${self.bankroll:.2f}")
         print(f"{'=' * 80}\n")
 
-    def update_unrealized_pnl(self):
-        """Update unrealized PnL for all pending trades based on current market prices."""
+    def update_unrealized_pnl(self, client=None):
+        """Update unrealized PnL for all pending trades based on current market prices.
+
+        Requests go over the shared pooled transport (pass ``client`` to reuse its caches).
+        """
         from src.core.polymarket import PolymarketClient
 
         pending = [t for t in self.trades if t.outcome is None]
         if not pending:
             return
 
-        client = PolymarketClient()
+        client = client or PolymarketClient()
 
         for trade in pending:
             try:
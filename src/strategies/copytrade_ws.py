@@ -10,6 +10,7 @@ import threading
 import time
 from collections.abc import Callable
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 import websockets
 from websockets.exceptions import ConnectionClosed
@@ -18,6 +19,9 @@ from src.config import Config
 from src.core.blockchain import PolygonscanClient
 from src.strategies.copytrade import CopySignal
 
+if TYPE_CHECKING:
+    from polymarket_algo.executor.transport import PooledTransport
+
 
 @dataclass
 class WalletActivity:
@@ -252,36 +256,15 @@ class HybridCopytradeMonitor:
         self,
         wallets: list[str],
         poll_interval: float = 1.0,  # Much faster than default 5s
+        transport: "PooledTransport | None" = None,
     ):
-        import requests
-        from requests.adapters import HTTPAdapter
-        from urllib3.util.retry import Retry
+        from polymarket_algo.executor.transport import shared_transport
 
         self.wallets = wallets
         self.poll_interval = poll_interval
 
-        # Fast HTTP session with connection pooling
-        self.session = requests.Session()
-
-        # Configure retry with exponential backoff
-        retry_strategy = Retry(
-            total=2,
-            backoff_factor=0.1,
-            status_forcelist=[429, 500, 502, 503, 504],
-        )
-        adapter = HTTPAdapter(
-            pool_connections=10,
-            pool_maxsize=10,
-            max_retries=retry_strategy,
-        )
-        self.session.mount("https://", adapter)
-        self.session.headers.update(
-            {
-                "User-Agent": "PolymarketCopyBot/2.0",
-                "Accept": "application/json",
-                "Connection": "keep-alive",
-            }
-        )
+        # Pooled keep-alive transport shared with PolymarketClient (per-endpoint latency in stats)
+        self.session = transport or shared_transport()
 
         # Track last seen trade per wallet
         self._last_seen: dict[str, int] = {w: int(time.time()) for w in wallets}
@@ -513,4 +496,5 @@ class HybridCopytradeMonitor:
             "avg_poll_latency_ms": round(self.avg_poll_latency_ms, 1),
             "seen_trades": len(self._seen_trades),
             "polygonscan_available": self._polygonscan.is_available(),
+            "http": self.session.stats,
         }
@@ -2,6 +2,9 @@
 
 from dataclasses import dataclass
 
+import numpy as np
+from polymarket_algo.indicators import trailing_streak
+
 
 @dataclass
 class Signal:
@@ -32,16 +35,7 @@ def detect_streak(outcomes: list[str]) -> tuple[int, str]:
     if not outcomes:
         return 0, ""
 
-    current = outcomes[-1]
-    streak = 1
-
-    for i in range(len(outcomes) - 2, -1, -1):
-        if outcomes[i] == current:
-            streak += 1
-        else:
-            break
-
-    return streak, current
+    return trailing_streak(np.asarray(outcomes)), outcomes[-1]
 
 
 def evaluate(outcomes: list[str], trigger: int = 4) -> Signal:
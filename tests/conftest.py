@@ -0,0 +1,8 @@
+import pytest
+from polymarket_algo.core.config import Config
+
+
+@pytest.fixture(autouse=True)
+def _no_market_cache_db(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep clients built in tests from writing the persistent market cache under data/."""
+    monkeypatch.setattr(Config, "MARKET_CACHE_DB", "")
@@ -1,5 +1,10 @@
+import numpy as np
 import pandas as pd
-from polymarket_algo.backtest.engine import run_backtest
+import pytest
+from polymarket_algo.backtest import walk_forward, walk_forward_folds
+from polymarket_algo.backtest.engine import backtest_metrics, parameter_sweep, run_backtest
+from polymarket_algo.strategies.candle_direction import CandleDirectionStrategy
+from polymarket_algo.strategies.streak_reversal import StreakReversalStrategy
 
 
 def always_up(candles: pd.DataFrame, **_) -> pd.DataFrame:
@@ -13,3 +18,102 @@ def test_backtest_runs_on_synthetic_data() -> None:
     result = run_backtest(candles, always_up)
     assert "win_rate" in result.metrics
     assert result.metrics["trade_count"] > 0
+
+
+def _random_walk_candles(n: int = 600, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    idx = pd.date_range("2025-01-01", periods=n, freq="5min", tz="UTC")
+    closes = 100 + np.cumsum(rng.normal(0, 1, n))
+    return pd.DataFrame({"close": closes}, index=idx)
+
+
+def test_vectorized_sweep_matches_per_combo_sweep() -> None:
+    candles = _random_walk_candles()
+    strategy = CandleDirectionStrategy()
+    grid = {
+        "ema_fast": [8, 12],
+        "ema_slow": [21, 26],
+        "rsi_period": [10, 14],
+        "rsi_overbought": [65.0, 70.0],
+        "rsi_oversold": [30.0, 35.0],
+        "macd_fast": [8, 12],
+        "macd_slow": [26],
+        "macd_signal": [7, 9],
+    }
+    expected = parameter_sweep(candles, strategy, grid, vectorized=False)
+    batched = parameter_sweep(candles, strategy, grid, chunk_size=7)
+    generic = parameter_sweep(candles, strategy.evaluate, grid, chunk_size=5)
+    pd.testing.assert_frame_equal(batched, expected, check_exact=True)
+    pd.testing.assert_frame_equal(generic, expected, check_exact=True)
+
+
+def test_streak_batch_sweep_matches_per_combo_sweep() -> None:
+    candles = _random_walk_candles()
+    candles["close"] = candles["close"].round(0)  # flat candles count as down moves
+    strategy = StreakReversalStrategy()
+    grid = {"trigger": [1, 2, 3, 4, 6], "size": [10.0, 20.0]}
+    expected = parameter_sweep(candles, strategy, grid, vectorized=False)
+    pd.testing.assert_frame_equal(parameter_sweep(candles, strategy, grid, chunk_size=3), expected, check_exact=True)
+
+
+def test_parallel_sweep_matches_serial_order() -> None:
+    candles = _random_walk_candles(n=400)
+    strategy = CandleDirectionStrategy()
+    grid = {"ema_fast": [8, 12, 16], "ema_slow": [21, 26], "rsi_period": [10, 14], "macd_signal": [7, 9]}
+    grid |= {"rsi_overbought": [65.0, 70.0], "rsi_oversold": [30.0, 35.0]}
+    # Workers score different chunk shapes than the serial pass; the result must still be bit-identical
+    serial = parameter_sweep(candles, strategy, grid, chunk_size=5)
+    parallel = parameter_sweep(candles, strategy, grid, n_jobs=2)
+    assert parallel.equals(serial)
+
+
+def test_metrics_only_backtest_matches_full_run() -> None:
+    candles = _random_walk_candles()
+    strategy = CandleDirectionStrategy()
+    full = run_backtest(candles, strategy)
+    fast = backtest_metrics(candles, strategy)
+    assert fast == full.metrics
+
+
+def test_walk_forward_folds_rolling_and_anchored() -> None:
+    rolling = walk_forward_folds(100, n_folds=3, train_size=40, test_size=20)
+    assert [(f.train_start, f.train_end, f.test_start, f.test_end) for f in rolling] == [
+        (0, 40, 40, 60),
+        (20, 60, 60, 80),
+        (40, 80, 80, 100),
+    ]
+    anchored = walk_forward_folds(100, n_folds=3, mode="anchored", train_size=40, test_size=20)
+    assert [f.train_start for f in anchored] == [0, 0, 0]
+    with pytest.raises(ValueError):
+        walk_forward_folds(100, n_folds=4, train_size=40, test_size=20)
+
+
+def test_walk_forward_picks_train_best_and_stitches_oos() -> None:
+    candles = _random_walk_candles(n=800)
+    strategy = CandleDirectionStrategy()
+    grid = {"ema_fast": [8, 12], "ema_slow": [21, 26], "rsi_period": [10, 14]}
+    result = walk_forward(candles, strategy, grid, n_folds=3, mode="anchored", train_size=500, test_size=100)
+
+    assert len(result.folds) == 3
+    assert result.folds.loc[0, "train_end"] == candles.index[499]
+    best = parameter_sweep(candles.iloc[:500], strategy, grid).iloc[0]
+    for key in grid:
+        assert result.folds.loc[0, key] == best[key]
+
+    assert result.oos_pnl_curve.index[0] == candles.index[500]
+    assert result.oos_pnl_curve.iloc[-1] == pytest.approx(result.folds["test_total_pnl"].sum())
+    assert result.metrics["trade_count"] == result.folds["test_trade_count"].sum()
+
+    parallel = walk_forward(
+        candles, strategy, grid, n_folds=3, mode="anchored", train_size=500, test_size=100, n_jobs=2
+    )
+    pd.testing.assert_frame_equal(parallel.folds, result.folds)
+    pd.testing.assert_series_equal(parallel.oos_pnl_curve, result.oos_pnl_curve)
+
+
+def test_walk_forward_fold_boundaries_use_the_next_candle() -> None:
+    idx = pd.date_range("2025-01-01", periods=110, freq="5min", tz="UTC")
+    candles = pd.DataFrame({"close": np.arange(110, dtype=float)}, index=idx)  # every candle closes higher
+    result = walk_forward(candles, always_up, {"size": [10.0]}, n_folds=3, train_size=40, test_size=20)
+    assert (result.folds["train_win_rate"] == 1.0).all() and (result.folds["test_win_rate"] == 1.0).all()
+    assert result.folds["train_trade_count"].dtype.kind == "i"
@@ -0,0 +1,344 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pandas as pd
+import pytest
+from polymarket_algo.data import (
+    WeightRateLimiter,
+    binance,
+    download_klines,
+    load_resampled,
+    open_candles_mmap,
+    partition_paths,
+    read_candles,
+    resample_candles,
+    write_candle_partitions,
+    write_candles,
+)
+
+
+def _hourly_candles(n: int = 24 * 120, start: str = "2024-01-01") -> pd.DataFrame:
+    open_time = pd.date_range(start, periods=n, freq="h", tz="UTC")
+    close = 100 + np.arange(n, dtype=float)
+    return pd.DataFrame({"open_time": open_time, "open": close - 0.5, "close": close})
+
+
+def test_partitioned_store_prunes_months_and_columns(tmp_path: Path) -> None:
+    candles = _hourly_candles()
+    written = write_candle_partitions(candles, "btcusdt", "1h", root=tmp_path)
+    assert [p.stem for p in written] == ["2024-01", "2024-02", "2024-03", "2024-04"]
+    assert [p.stem for p in partition_paths("BTCUSDT", "1h", "2024-02-10", "2024-03-01", root=tmp_path)] == ["2024-02"]
+
+    out = read_candles("BTCUSDT", "1h", "2024-02-10", "2024-03-01", columns=["close"], root=tmp_path)
+    assert list(out.columns) == ["open_time", "close"]
+    assert out["open_time"].iloc[0] == pd.Timestamp("2024-02-10", tz="UTC")
+    assert out["open_time"].iloc[-1] == pd.Timestamp("2024-02-29 23:00", tz="UTC")
+    assert out["open_time"].is_monotonic_increasing
+
+    full = read_candles("BTCUSDT", "1h", root=tmp_path)
+    np.testing.assert_array_equal(full["close"], candles["close"])
+
+
+def test_partitioned_store_merges_overlapping_writes(tmp_path: Path) -> None:
+    candles = _hourly_candles(n=48)
+    write_candle_partitions(candles.iloc[:30], "ETHUSDT", "1h", root=tmp_path)
+    write_candle_partitions(candles.iloc[20:].assign(close=-1.0), "ETHUSDT", "1h", root=tmp_path)
+
+    out = read_candles("ETHUSDT", "1h", root=tmp_path)
+    assert len(out) == 48
+    assert (out["close"].iloc[20:] == -1.0).all()
+    assert read_candles("SOLUSDT", "1h", root=tmp_path).empty
+
+
+def test_single_file_api_still_works(tmp_path: Path) -> None:
+    candles = _hourly_candles(n=10)
+    write_candles(candles, tmp_path / "btc_1h.parquet")
+    pd.testing.assert_frame_equal(read_candles(tmp_path / "btc_1h.parquet"), candles, check_dtype=False)
+
+
+def test_update_klines_fetches_tail_and_backfills_gaps(tmp_path: Path, monkeypatch) -> None:
+    step = binance.interval_ms("1h")
+    t0 = int(pd.Timestamp("2024-01-30", tz="UTC").timestamp() * 1000)
+    truth = _hourly_candles(n=96, start="2024-01-30")
+    calls: list[tuple[int, int]] = []
+
+    def fake_fetch(symbol: str, interval: str, start_ms: int, end_ms: int) -> pd.DataFrame:
+        calls.append((start_ms, end_ms))
+        ms = pd.DatetimeIndex(truth["open_time"]).as_unit("ms").asi8
+        return truth[(ms >= start_ms) & (ms <= end_ms)].reset_index(drop=True)
+
+    monkeypatch.setattr(binance, "fetch_klines", fake_fetch)
+
+    # Seed the store with a hole (candles 10..19) and a missing tail (60..95).
+    write_candle_partitions(pd.concat([truth.iloc[:10], truth.iloc[20:60]]), "BTCUSDT", "1h", root=tmp_path)
+    assert binance.find_gaps(binance.stored_open_times("BTCUSDT", "1h", root=tmp_path), step) == [
+        (t0 + 10 * step, t0 + 20 * step)
+    ]
+
+    fetched = binance.update_klines("BTCUSDT", "1h", end_ms=t0 + 95 * step, root=tmp_path)
+    assert calls == [(t0 + 10 * step, t0 + 20 * step - 1), (t0 + 59 * step, t0 + 95 * step)]
+    assert len(fetched) == 10 + 37
+
+    stored = read_candles("BTCUSDT", "1h", root=tmp_path)
+    pd.testing.assert_frame_equal(stored, truth, check_dtype=False)
+    assert binance.update_klines("BTCUSDT", "1h", end_ms=t0 + 95 * step, root=tmp_path)["open_time"].size == 1
+
+
+class _KlineStub(BaseHTTPRequestHandler):
+    """Replays a canned 1m kline history with Binance's paging semantics."""
+
+    candles: list[list] = []
+    requests_seen = 0
+
+    def do_GET(self) -> None:
+        query = parse_qs(urlparse(self.path).query)
+        start, end, limit = (int(query[k][0]) for k in ("startTime", "endTime", "limit"))
+        page = [row for row in self.candles if start <= row[0] <= end][:limit]
+        type(self).requests_seen += 1
+        body = json.dumps(page).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("X-MBX-USED-WEIGHT-1M", "10")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def test_download_klines_shards_concurrently_against_stub_server() -> None:
+    t0 = int(pd.Timestamp("2024-03-01", tz="UTC").timestamp() * 1000)
+    step = 60_000
+    _KlineStub.candles = [
+        [t0 + i * step, "1.0", "2.0", "0.5", str(1.0 + i), "10", t0 + (i + 1) * step - 1, "5", i, "1", "2", "0"]
+        for i in range(5000)
+        if not 1200 <= i < 1300  # an exchange outage the downloader must tolerate
+    ]
+    _KlineStub.requests_seen = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KlineStub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/api/v3/klines"
+    try:
+        limiter = WeightRateLimiter()
+        frames = download_klines(
+            [("BTCUSDT", "1m"), ("ETHUSDT", "1m")],
+            t0,
+            t0 + 5000 * step - 1,
+            max_workers=4,
+            shard_pages=1,
+            limiter=limiter,
+            base_url=url,
+        )
+        serial = binance.fetch_klines("BTCUSDT", "1m", t0, t0 + 5000 * step - 1, base_url=url)
+    finally:
+        server.shutdown()
+
+    assert set(frames) == {("BTCUSDT", "1m"), ("ETHUSDT", "1m")}
+    btc = frames[("BTCUSDT", "1m")]
+    assert len(btc) == 4900
+    assert btc["open_time"].is_monotonic_increasing and btc["open_time"].is_unique
+    pd.testing.assert_frame_equal(btc, serial)
+
+
+def test_weight_rate_limiter_respects_server_reported_usage() -> None:
+    limiter = WeightRateLimiter(weight_per_minute=6000, headroom=1.0)
+    limiter.acquire(100)
+    assert limiter.waited_s == 0
+    limiter.observe_used_weight("5999")
+    limiter.acquire(2)
+    assert limiter.waited_s > 0
+
+
+def test_kline_buffer_decodes_pages_into_typed_columns() -> None:
+    def row(i: int) -> list:
+        t = 1_700_000_000_000 + i * 60_000
+        return [t, "1.5", "2.5", "0.5", f"{i}.25", "10", t + 59_999, "5", i, "1", "2", "0"]
+
+    buffer = binance.KlineBuffer(capacity=2)
+    buffer.append([row(3), row(1)])
+    buffer.append([row(2), row(1), row(4)])  # out of order, with a duplicate
+    assert buffer.capacity >= 5
+
+    df = buffer.to_frame()
+    assert list(df.columns) == binance.KLINE_COLUMNS
+    assert df["close"].tolist() == [1.25, 2.25, 3.25, 4.25]
+    assert df["number_of_trades"].dtype == np.int64
+    assert df["open"].dtype == np.float64
+    assert str(df["open_time"].dtype) == "datetime64[ms, UTC]"
+    assert df["open_time"].is_monotonic_increasing
+
+
+def test_fetch_kline_buffer_accepts_variable_length_intervals() -> None:
+    class _Session:
+        def __init__(self, pages: list[list]):
+            self.pages = pages
+
+        def get(self, url: str, params: dict, timeout: float) -> SimpleNamespace:
+            page = self.pages.pop(0) if self.pages else []
+            return SimpleNamespace(json=lambda: page, headers={}, raise_for_status=lambda: None)
+
+    month = [[1_700_000_000_000, "1", "2", "0.5", "1.5", "10", 1_702_000_000_000, "5", 3, "1", "2", "0"]]
+    t0 = 1_700_000_000_000
+    buffer = binance.fetch_kline_buffer("BTCUSDT", "1M", t0, t0 + 10**11, session=_Session([month]))
+    assert len(buffer) == 1 and buffer.capacity == binance.MAX_LIMIT
+    wide = binance.fetch_kline_buffer("BTCUSDT", "1s", 0, 1_800_000_000_000, session=_Session([]))
+    assert wide.capacity == binance.PREALLOC_ROWS
+
+
+def test_open_candles_mmap_maps_sidecar_and_tracks_source_version(tmp_path: Path) -> None:
+    candles = _hourly_candles(n=48)
+    path = tmp_path / "btc_1h.parquet"
+    write_candles(candles, path, mmap_sidecar=True)
+    assert (tmp_path / "btc_1h.parquet.mmap").is_dir()
+
+    arrays = open_candles_mmap(path, columns=["close"])
+    assert isinstance(arrays["close"], np.memmap)
+    assert list(arrays) == ["open_time", "close"]
+    np.testing.assert_array_equal(arrays["close"], candles["close"])
+    frame = arrays.to_frame()
+    assert frame.index[0] == candles["open_time"].iloc[0]
+    assert np.shares_memory(frame["close"].to_numpy(), arrays["close"])
+
+    write_candle_partitions(candles.iloc[:30], "BTCUSDT", "1h", root=tmp_path)
+    assert open_candles_mmap("BTCUSDT", "1h", root=tmp_path).length == 30
+    write_candle_partitions(candles.iloc[30:], "BTCUSDT", "1h", root=tmp_path)
+    appended = open_candles_mmap("BTCUSDT", "1h", root=tmp_path)
+    np.testing.assert_array_equal(appended["open"], candles["open"])
+    assert len(list((tmp_path / "BTCUSDT" / "1h" / "_mmap").iterdir())) == 1
+
+
+def test_write_candles_without_time_axis_skips_sidecar(tmp_path: Path) -> None:
+    frame = pd.DataFrame({"close": [1.0, 2.0]})
+    write_candles(frame, tmp_path / "plain.parquet")
+    assert [p.name for p in tmp_path.iterdir()] == ["plain.parquet"]
+    with pytest.raises(ValueError):
+        write_candles(frame, tmp_path / "strict.parquet", mmap_sidecar=True)
+    assert not (tmp_path / "strict.parquet").exists()
+
+
+def test_resample_candles_matches_pandas_ohlc(tmp_path: Path) -> None:
+    rng = np.random.default_rng(7)
+    candles = _hourly_candles(n=24 * 10, start="2024-01-01 02:00")
+    candles["high"] = candles["close"] + rng.random(len(candles))
+    candles["low"] = candles["open"] - rng.random(len(candles))
+    candles["volume"] = rng.random(len(candles))
+    candles = candles.drop(index=[50, 51])  # a gap inside one bucket
+
+    out = resample_candles(candles, "4h")
+    expected = (
+        candles.set_index("open_time")
+        .resample("4h")
+        .agg({"open": "first", "close": "last", "high": "max", "low": "min", "volume": "sum"})
+        .dropna()
+    )
+    assert out["open_time"].iloc[0] == pd.Timestamp("2024-01-01", tz="UTC")
+    np.testing.assert_array_equal(out["open_time"], expected.index)
+    for name in ["open", "close", "high", "low"]:
+        np.testing.assert_array_equal(out[name], expected[name])
+    np.testing.assert_allclose(out["volume"], expected["volume"])
+    assert len(resample_candles(candles, "4h", drop_incomplete=True)) == len(out) - 3  # first, gap, last
+
+
+def test_load_resampled_caches_by_source_version(tmp_path: Path) -> None:
+    candles = _hourly_candles(n=24 * 40)
+    write_candle_partitions(candles.iloc[:500], "BTCUSDT", "1h", root=tmp_path)
+    first = load_resampled("BTCUSDT", "2h", root=tmp_path)
+    assert len(first) == 250
+    cache_dir = tmp_path / "BTCUSDT" / "_derived" / "2h"
+    (cached,) = cache_dir.glob("*.parquet")
+    pd.testing.assert_frame_equal(load_resampled("BTCUSDT", "2h", root=tmp_path), first)
+
+    write_candle_partitions(candles.iloc[500:], "BTCUSDT", "1h", root=tmp_path)
+    second = load_resampled("BTCUSDT", "2h", start="2024-02-01", root=tmp_path)
+    assert not cached.exists() and len(list(cache_dir.glob("*.parquet"))) == 1
+    assert second["open_time"].iloc[0] == pd.Timestamp("2024-02-01", tz="UTC")
+    assert second["open_time"].iloc[-1] == candles["open_time"].iloc[-2]
+    assert len(load_resampled("BTCUSDT", "1h", root=tmp_path)) == len(candles)
+
+
+def test_outcome_store_fetches_only_missing_windows(tmp_path: Path, monkeypatch) -> None:
+    from types import SimpleNamespace
+
+    from polymarket_algo.backtest import run_backtest
+    from polymarket_algo.data import OutcomeStore
+    from polymarket_algo.strategies import StreakReversalStrategy
+
+    now = 1_700_000_000 - 1_700_000_000 % 300 + 10
+    monkeypatch.setattr("polymarket_algo.data.outcomes.time.time", lambda: now)
+    calls: list[int] = []
+
+    def fetch_market(ts: int) -> SimpleNamespace | None:
+        calls.append(ts)
+        if ts == now - 10 - 300:  # previous window still resolving
+            return SimpleNamespace(timestamp=ts, outcome=None, up_price=0.5, down_price=0.5, volume=1, taker_fee_bps=0)
+        up = (ts // 300) % 3 != 0
+        return SimpleNamespace(
+            timestamp=ts,
+            outcome="up" if up else "down",
+            up_price=float(up),
+            down_price=float(not up),
+            volume=10.0,
+            taker_fee_bps=1000,
+        )
+
+    store = OutcomeStore(tmp_path)
+    outcomes = store.recent_outcomes(5, fetch_market, now=now)
+    assert len(outcomes) == 5 and len(calls) == 15
+    assert store.last_timestamp() == now - 10 - 600
+
+    calls.clear()
+    assert store.recent_outcomes(5, fetch_market, now=now) == outcomes
+    assert calls == [now - 10 - 300]  # only the unresolved window is retried
+
+    candles = store.as_candles()
+    assert list(candles["up"].iloc[:3]) == [int(o == "up") for o in store.read()["outcome"].iloc[:3]]
+    result = run_backtest(candles, StreakReversalStrategy(), {"trigger": 2})
+    assert result.metrics["trade_count"] > 0
+
+
+def _market(ts: int, outcome: str | None = "up") -> SimpleNamespace:
+    return SimpleNamespace(timestamp=ts, outcome=outcome, up_price=1.0, down_price=0.0, volume=1.0, taker_fee_bps=0)
+
+
+def test_outcome_store_skips_a_failed_lookup_and_retries_it(tmp_path: Path, monkeypatch) -> None:
+    from polymarket_algo.data import OutcomeStore
+
+    current = 1_700_000_100 - 1_700_000_100 % 300
+    monkeypatch.setattr("polymarket_algo.data.outcomes.time.time", lambda: current + 10)
+    gap = current - 900
+    timeouts = {gap}
+    calls: list[int] = []
+
+    def fetch_market(ts: int) -> SimpleNamespace | None:
+        calls.append(ts)
+        return None if ts in timeouts else _market(ts)
+
+    store = OutcomeStore(tmp_path)
+    assert store.update(fetch_market, start_ts=current - 3000, end_ts=current, pause_s=0) == 9
+    assert store.last_timestamp() == current - 300 and gap not in store.read()["timestamp"].tolist()
+
+    timeouts.clear()
+    calls.clear()
+    assert store.update(fetch_market, start_ts=current - 3000, end_ts=current, pause_s=0) == 1
+    assert calls == [gap]
+    assert store.read()["timestamp"].tolist() == list(range(current - 3000, current, 300))
+
+
+def test_outcome_store_backfills_before_the_stored_range(tmp_path: Path, monkeypatch) -> None:
+    from polymarket_algo.data import OutcomeStore
+
+    current = 1_700_000_100 - 1_700_000_100 % 300
+    monkeypatch.setattr("polymarket_algo.data.outcomes.time.time", lambda: current + 10)
+    store = OutcomeStore(tmp_path)
+    store.update(_market, start_ts=current - 600, end_ts=current, pause_s=0)
+    assert store.first_timestamp() == current - 600
+
+    assert store.update(_market, start_ts=current - 86_400 * 2, end_ts=current, pause_s=0) == 86_400 * 2 // 300 - 2
+    assert store.first_timestamp() == current - 86_400 * 2
+    assert len(store.read()) == 86_400 * 2 // 300
@@ -0,0 +1,74 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from polymarket_algo.executor.async_client import AsyncPolymarketClient  # noqa: E402
+from polymarket_algo.executor.client import execution_price_from_book  # noqa: E402
+
+BOOK = {
+    "bids": [{"price": "0.48", "size": "100"}],
+    "asks": [{"price": "0.52", "size": "10"}, {"price": "0.55", "size": "100"}],
+}
+
+
+class _ClobStub(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # noqa: N802
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        if url.path == "/events":
+            slug = query["slug"][0]
+            market = {"clobTokenIds": '["u", "d"]', "outcomePrices": '["0", "1"]', "closed": True}
+            payload = [{"slug": slug, "title": slug, "volume": 3.0, "markets": [market]}]
+        elif url.path == "/book":
+            payload = BOOK
+        elif url.path == "/fee-rate":
+            payload = {"base_fee": 700}
+        else:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def test_async_client_issues_signal_lookups_concurrently() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ClobStub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+
+    async def lookups():
+        async with AsyncPolymarketClient() as client:
+            client.gamma = client.clob = base
+            return await asyncio.gather(
+                client.get_market(1_700_000_100),
+                client.get_orderbooks(["u", "d"]),
+                client.get_fee_rate("u"),
+                client.get_execution_price("u", "BUY", 20.0),
+            )
+
+    try:
+        market, books, fee, execution = asyncio.run(lookups())
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert market.outcome == "down" and market.up_token_id == "u"
+    assert set(books) == {"u", "d"}  # /books is missing, so single requests were gathered
+    assert fee == 700
+    assert execution == execution_price_from_book(BOOK, "BUY", 20.0)
@@ -0,0 +1,212 @@
+import dataclasses
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from polymarket_algo.executor import PooledTransport, TransportConfig
+from polymarket_algo.executor.cache import TTLCache
+from polymarket_algo.executor.client import Market, PolymarketClient, market_slug
+from polymarket_algo.executor.market_store import MarketStore
+from polymarket_algo.executor.transport import LatencyHistogram
+
+
+class _FakeResponse:
+    def __init__(self, payload):
+        self._payload = payload
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def json(self):
+        return self._payload
+
+
+class _GammaSession:
+    """Answers ``/events`` lookups for resolved windows; ``multi_slug=False`` mimics a server honoring one slug."""
+
+    def __init__(self, known: set[int], multi_slug: bool = True):
+        self.known = known
+        self.multi_slug = multi_slug
+        self.requests: list[list[str]] = []
+
+    def get(self, url, params=None, timeout=None):
+        slugs = [v for k, v in params] if isinstance(params, list) else [params["slug"]]
+        self.requests.append(slugs)
+        if not self.multi_slug:
+            slugs = slugs[:1]
+        return _FakeResponse([_event(slug) for slug in slugs if int(slug.rsplit("-", 1)[1]) in self.known])
+
+
+def _event(slug: str) -> dict:
+    market = {
+        "clobTokenIds": json.dumps([f"{slug}-up", f"{slug}-down"]),
+        "outcomePrices": json.dumps(["1", "0"]),
+        "closed": True,
+        "umaResolutionStatus": "resolved",
+        "takerBaseFee": 1000,
+    }
+    return {"slug": slug, "title": slug, "closed": True, "volume": 5.0, "markets": [market]}
+
+
+def test_get_markets_batches_slugs_and_fills_caches() -> None:
+    client = PolymarketClient()
+    windows = [1_700_000_100 + 300 * i for i in range(45)]
+    client.session = _GammaSession(known=set(windows[:-3]))
+
+    markets = client.get_markets(windows)
+    assert sorted(markets) == windows[:-3]
+    assert [len(r) for r in client.session.requests] == [20, 20, 5]
+    assert client.get_token_ids(windows[0]) == (f"{market_slug(windows[0])}-up", f"{market_slug(windows[0])}-down")
+
+    client.session.requests.clear()
+    assert client.get_market(windows[0]).outcome == "up"
+    assert client.get_markets(windows[:10]).keys() == set(windows[:10])
+    assert client.session.requests == []
+
+
+def test_get_markets_falls_back_to_single_requests() -> None:
+    client = PolymarketClient()
+    windows = [1_700_000_100 + 300 * i for i in range(5)]
+    client.session = _GammaSession(known=set(windows), multi_slug=False)
+
+    assert sorted(client.get_markets(windows)) == windows
+    assert len(client.session.requests) == 1 + 4
+
+
+def test_market_store_persists_resolved_markets(tmp_path) -> None:
+    windows = [1_700_000_100 + 300 * i for i in range(3)]
+    client = PolymarketClient(market_store=MarketStore(tmp_path / "markets.sqlite"))
+    client.session = _GammaSession(known=set(windows))
+    client.get_markets(windows)
+    client.market_store.close()
+
+    restarted = PolymarketClient(market_store=MarketStore(tmp_path / "markets.sqlite"))
+    restarted.session = _GammaSession(known=set())
+    assert restarted.get_market(windows[1]) == client.get_market(windows[1])
+    assert restarted.get_token_ids(windows[2])[0] == f"{market_slug(windows[2])}-up"
+    assert sorted(restarted.get_markets(windows)) == windows
+    assert restarted.session.requests == []
+    assert restarted.stats["market_store"]["hits"] == 3  # the rest come from memory
+
+
+def test_market_store_writes_tokens_once_and_resolution_once(tmp_path) -> None:
+    store = MarketStore(tmp_path / "markets.sqlite")
+    ts = 1_700_000_100
+    open_market = Market(ts, market_slug(ts), "", False, None, "up-tok", "down-tok", 0.5, 0.5, 1.0, True)
+    assert store.wants(open_market)
+    store.put_market(open_market)
+    store.close()
+    assert not store.wants(open_market)
+    assert store.put_markets([open_market]) == 0 and store._conn is None  # polling an open market stays off disk
+
+    resolved = dataclasses.replace(open_market, closed=True, outcome="up", up_price=1.0, down_price=0.0)
+    assert store.wants(resolved) and store.put_markets([resolved]) == 1
+    assert not store.wants(resolved) and store.stats["writes"] == 1
+
+
+def test_execution_curve_prices_sizes_from_one_book_fetch() -> None:
+    book = {
+        "bids": [{"price": "0.45", "size": "100"}],
+        "asks": [{"price": "0.52", "size": "100"}, {"price": "0.50", "size": "100"}],
+    }
+    client = PolymarketClient()
+    client.session = _BookSession(book)
+    price, slippage, fill = client.get_execution_curve("tok", "BUY", [25, 75, 200])
+    assert client.session.calls == 1
+    assert price[0] == 0.5 and fill[0] == 100.0
+    assert price[1] == 75 / (100 + 25 / 0.52)
+    assert fill[2] == (50 + 52) / 200 * 100 and slippage[2] > slippage[1] > 0
+    for amount, curve_price, curve_fill in zip([25, 75, 200], price, fill, strict=True):
+        execution = client.get_execution_price("tok", "BUY", amount)
+        assert execution[0] == curve_price and execution[3] == curve_fill and execution[1] == 0.5 - 0.45
+
+
+class _BookSession:
+    def __init__(self, book: dict):
+        self.book = book
+        self.calls = 0
+
+    def get(self, url, params=None, timeout=None):
+        self.calls += 1
+        return _FakeResponse(self.book)
+
+
+class _OkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # noqa: N802
+        body = b"[]" if self.path.startswith("/events") else b'{"error": "nope"}'
+        self.send_response(200 if self.path.startswith("/events") else 404)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def test_pooled_transport_records_latency_per_endpoint() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OkHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    try:
+        transport = PooledTransport(TransportConfig(pool_maxsize=2, retries=0))
+        client = PolymarketClient(transport=transport)
+        client.gamma = client.clob = base
+        assert client.get_market(1_700_000_100) is None
+        assert client.get_markets([1_700_000_400, 1_700_000_700]) == {}  # batch + 2 single fallbacks
+        assert client.get_fee_rate("tok") == 1000  # 404 -> default
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    stats = client.stats
+    assert stats["requests"] == 5 and stats["errors"] == 1
+    endpoints = stats["endpoints"]
+    host = base.removeprefix("http://")
+    assert endpoints[f"{host}/events"]["count"] == 4
+    assert endpoints[f"{host}/fee-rate"]["count"] == 1
+    assert sum(endpoints[f"{host}/events"]["buckets"].values()) == 4
+
+
+def test_latency_histogram_percentiles() -> None:
+    histogram = LatencyHistogram((10, 100))
+    for ms in [1, 2, 3, 50, 500]:
+        histogram.record(ms)
+    assert histogram.percentile(0.5) == 10
+    assert histogram.percentile(0.8) == 100
+    assert histogram.percentile(0.99) == 500
+    assert histogram.snapshot()["buckets"] == {"<=10ms": 3, "<=100ms": 1, ">100ms": 1}
+
+
+def test_ttl_cache_expires_and_evicts_least_recently_used() -> None:
+    now = [0.0]
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, clock=lambda: now[0])
+    cache.put("a", 1)
+    cache.put("b", 2, ttl=10)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.put("c", 3)
+    assert cache.get("b") is None and cache.get("c") == 3
+    cache.put("d", 4, ttl=5)  # evicts "a"
+    now[0] = 5.0
+    assert cache.get("d") is None
+    assert cache.stats | {"hit_rate": 0} == {
+        "size": 1,
+        "maxsize": 2,
+        "hits": 2,
+        "misses": 2,
+        "evictions": 2,
+        "expirations": 1,
+        "hit_rate": 0,
+    }
+
+
+def test_market_cache_ttl_follows_lifecycle() -> None:
+    def market(closed: bool, outcome: str | None) -> Market:
+        return Market(1000, "s", "t", closed, outcome, "u", "d", 0.5, 0.5, 0.0, not closed)
+
+    ttl = PolymarketClient._market_ttl
+    assert ttl(market(False, None), now=1100) == 200  # open: until the window ends
+    assert ttl(market(True, None), now=1400) == 15  # closed, resolution pending
+    assert ttl(market(True, "up"), now=1400) is None  # resolved: final
@@ -0,0 +1,52 @@
+import json
+
+import pytest
+from polymarket_algo.executor import messages
+from polymarket_algo.executor.messages import BookMessage, LastTradeMessage, PriceChangeMessage, decode_messages
+
+
+def test_decode_messages_types_frames_from_bytes() -> None:
+    frame = json.dumps(
+        [
+            {"event_type": "book", "asset_id": "a", "timestamp": "5", "bids": [{"price": "0.4", "size": "2"}]},
+            {"event_type": "last_trade_price", "asset_id": "a", "market": "m", "price": "0.41", "size": "3"},
+            {"event_type": "tick_size_change", "asset_id": "a"},
+        ]
+    ).encode()
+    book, trade, other = decode_messages(frame)
+    assert book == BookMessage("a", timestamp=5, bids=[(0.4, 2.0)])
+    assert trade == LastTradeMessage("a", "m", 0.41, 3.0, "BUY")
+    assert other == {"event_type": "tick_size_change", "asset_id": "a"}
+
+
+def test_price_changes_layout_is_split_per_asset() -> None:
+    frame = {
+        "event_type": "price_change",
+        "market": "m",
+        "timestamp": "9",
+        "price_changes": [
+            {"asset_id": "a", "side": "BUY", "price": "0.5", "size": "1", "hash": "x", "best_bid": "0.5"},
+            {"asset_id": "b", "side": "SELL", "price": "0.5", "size": "0", "hash": "y", "best_ask": ""},
+            {"asset_id": "a", "side": "SELL", "price": "0.6", "size": "4", "hash": "z"},
+        ],
+    }
+    first, second = decode_messages(json.dumps(frame))
+    assert isinstance(first, PriceChangeMessage) and (first.asset_id, first.hash, first.timestamp) == ("a", "z", 9)
+    assert [(c.side, c.price, c.best_bid) for c in first.changes] == [("BUY", 0.5, 0.5), ("SELL", 0.6, None)]
+    assert second.asset_id == "b" and second.changes[0].best_ask is None
+
+
+def test_json_decoder_selection() -> None:
+    assert messages.json_decoder in messages.BACKENDS
+    with pytest.raises(ValueError):
+        messages.set_json_decoder("simdjson")
+    with pytest.raises(ValueError):
+        decode_messages(b"{not json")
+
+
+def test_decoder_notice_is_logged_once(monkeypatch, caplog) -> None:
+    monkeypatch.setattr(messages, "_decoder_notice", "orjson is not installed")
+    with caplog.at_level("WARNING", logger=messages.__name__):
+        messages.log_decoder_notice()
+        messages.log_decoder_notice()
+    assert [r.getMessage() for r in caplog.records] == ["orjson is not installed"]
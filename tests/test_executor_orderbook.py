@@ -0,0 +1,223 @@
+import asyncio
+import json
+import random
+import threading
+
+import numpy as np
+import pytest
+from polymarket_algo.executor.messages import PriceChangeMessage, parse_book, parse_price_change
+from polymarket_algo.executor.orderbook import BookSide, BookSnapshot, CachedOrderBook, price_to_tick
+from polymarket_algo.executor.ws import PolymarketWebSocket
+
+
+def test_book_side_keeps_best_first_on_tick_grid() -> None:
+    bids = BookSide(descending=True, levels=[(0.48, 10), (0.5, 5), (0.49, 0)])
+    assert [lv.price for lv in bids] == [0.5, 0.48]
+    bids.set(0.1 + 0.39, 7)  # 0.49000000000000005 lands on the 0.49 tick
+    bids.set(0.5, 0)
+    assert [(lv.price, lv.size) for lv in bids] == [(0.49, 7), (0.48, 10)]
+    assert bids[0].price == 0.49 and len(bids) == 2
+    assert price_to_tick(0.001) == 10
+
+
+def test_cached_order_book_matches_naive_replay() -> None:
+    rng = random.Random(7)
+    book = CachedOrderBook("tok")
+    book.update_from_snapshot({"bids": [{"price": "0.49", "size": "10"}], "asks": [{"price": "0.51", "size": "10"}]})
+    naive = {"BUY": {49: 10.0}, "SELL": {51: 10.0}}
+    for _ in range(2000):
+        side = rng.choice(("BUY", "SELL"))
+        cents = rng.randint(1, 49) if side == "BUY" else rng.randint(51, 99)
+        size = 0 if rng.random() < 0.4 else rng.randint(1, 50)
+        book.update_from_delta({"changes": [{"side": side, "price": f"{cents / 100:.2f}", "size": str(size)}]})
+        if size:
+            naive[side][cents] = float(size)
+        else:
+            naive[side].pop(cents, None)
+
+    assert [(round(lv.price * 100), lv.size) for lv in book.bids] == sorted(naive["BUY"].items(), reverse=True)
+    assert [(round(lv.price * 100), lv.size) for lv in book.asks] == sorted(naive["SELL"].items())
+    assert book.best_bid == max(naive["BUY"]) / 100 and book.best_ask == min(naive["SELL"]) / 100
+    price, _, fill_pct = book.get_execution_price("BUY", book.asks[0].price * book.asks[0].size)
+    assert price == pytest.approx(book.best_ask) and fill_pct == pytest.approx(100.0)
+
+    amounts = [0, 0.5, 3, 20, 75, 400, 5000]
+    for side, levels in (("BUY", book.asks), ("SELL", book.bids)):
+        curve = np.column_stack(book.execution_curve(side, amounts))
+        for amount, row in zip(amounts, curve, strict=True):
+            assert row == pytest.approx(book.get_execution_price(side, amount))
+            assert row[0] == pytest.approx(_walk(levels, amount) or book.mid)
+
+
+def _walk(levels, amount: float) -> float:
+    """Reference linear book walk: VWAP for ``amount`` USD (0.0 if nothing fills)."""
+    remaining, shares = amount, 0.0
+    for level in levels:
+        take = min(remaining, level.price * level.size)
+        shares += take / level.price
+        remaining -= take
+    return (amount - remaining) / shares if shares else 0.0
+
+
+def _snapshot(ts: int, bid: str = "0.48", ask: str = "0.52") -> dict:
+    return {
+        "event_type": "book",
+        "asset_id": "tok",
+        "timestamp": str(ts),
+        "hash": f"h{ts}",
+        "bids": [{"price": bid, "size": "10"}],
+        "asks": [{"price": ask, "size": "10"}],
+    }
+
+
+def _change(ts: int, side: str, price: str, size: str, best_bid: str, best_ask: str) -> dict:
+    change = {"side": side, "price": price, "size": size, "best_bid": best_bid, "best_ask": best_ask}
+    return {"event_type": "price_change", "asset_id": "tok", "timestamp": str(ts), "changes": [change]}
+
+
+def _delta(*args) -> PriceChangeMessage:
+    return parse_price_change(_change(*args))[0]
+
+
+def test_apply_delta_detects_stale_and_drifted_messages() -> None:
+    book = CachedOrderBook("tok")
+    assert book.apply_delta(_delta(1, "BUY", "0.49", "5", "0.49", "0.52")) == "unsynced"
+    book.update_from_snapshot(_snapshot(100))
+    assert book.in_sync and book.hash == "h100"
+    assert book.apply_delta(_delta(101, "BUY", "0.49", "5", "0.49", "0.52")) == "ok"
+    assert book.apply_delta(_delta(99, "BUY", "0.50", "5", "0.50", "0.52")) == "stale"
+    assert book.best_bid == 0.49 and book.in_sync
+    # The server says 0.50 is best after this change, so a delta adding it was missed
+    assert book.apply_delta(_delta(102, "SELL", "0.53", "5", "0.50", "0.52")) == "best_mismatch"
+    assert not book.in_sync
+
+
+def test_out_of_range_levels_are_dropped_and_counted() -> None:
+    ws = PolymarketWebSocket()
+    bad = _snapshot(100) | {"bids": [{"price": "1.5", "size": "3"}, {"price": "0.48", "size": "10"}]}
+
+    async def replay() -> None:
+        await ws._handle_message(json.dumps(bad))
+        await ws._handle_message(json.dumps(_change(101, "SELL", "-0.1", "4", "0.48", "0.52")))
+
+    asyncio.run(replay())
+    book = ws.get_orderbook("tok")
+    assert [lv.price for lv in book.bids] == [0.48] and [lv.price for lv in book.asks] == [0.52]
+    assert ws.stats["rejected_levels"] == 2
+
+
+def test_unsubscribe_drops_the_market_books() -> None:
+    ws = PolymarketWebSocket()
+    ws.subscribe_market("m1", ["a", "b"])
+    ws.subscribe_market("m2", ["c"])
+    ws.unsubscribe_market("m1")
+    assert ws.get_orderbook("a") is None and ws.get_orderbook("c") is not None
+    assert ws.stats["cached_orderbooks"] == 1
+
+
+def test_websocket_resyncs_only_the_drifted_token() -> None:
+    class _Rest:
+        def __init__(self):
+            self.fetched: list[str] = []
+
+        def get_orderbook(self, token_id: str) -> dict:
+            self.fetched.append(token_id)
+            return _snapshot(200, bid="0.50")
+
+    rest = _Rest()
+    ws = PolymarketWebSocket(rest_client=rest)
+    ws._connected.set()
+
+    async def replay() -> None:
+        await ws._handle_message(json.dumps(_snapshot(100)))
+        other = _snapshot(100) | {"asset_id": "other"}
+        await ws._handle_message(json.dumps(other))
+        await ws._handle_message(json.dumps(_change(150, "BUY", "0.45", "5", "0.55", "0.52")))  # drift
+        await ws._handle_message(json.dumps(_change(151, "BUY", "0.44", "5", "0.50", "0.52")))  # skipped
+        assert ws.get_synced_orderbook("tok") is None and ws.get_synced_orderbook("other") is not None
+        await asyncio.gather(*(t for t in asyncio.all_tasks() if t is not asyncio.current_task()))
+
+    asyncio.run(replay())
+    assert rest.fetched == ["tok"]
+    assert ws.get_synced_orderbook("tok").best_bid == 0.50
+    stats = ws.stats
+    assert stats["resyncs"] == 1 and stats["book_drift"] == {"best_mismatch": 1}  # one drift, not one per delta
+
+
+def test_resync_replays_deltas_newer_than_the_rest_snapshot() -> None:
+    class _Rest:
+        def get_orderbook(self, token_id: str) -> dict:
+            return _snapshot(155, bid="0.50")  # taken between the two deltas below
+
+    ws = PolymarketWebSocket(rest_client=_Rest())
+    ws._connected.set()
+
+    async def replay() -> None:
+        await ws._handle_message(json.dumps(_snapshot(100)))
+        await ws._handle_message(json.dumps(_change(150, "BUY", "0.45", "5", "0.55", "0.52")))  # drift
+        await ws._handle_message(json.dumps(_change(160, "BUY", "0.49", "5", "0.50", "0.52")))  # buffered
+        await asyncio.gather(*(t for t in asyncio.all_tasks() if t is not asyncio.current_task()))
+
+    asyncio.run(replay())
+    book = ws.get_synced_orderbook("tok")
+    assert [(lv.price, lv.size) for lv in book.bids] == [(0.50, 10), (0.49, 5)]
+    assert ws.stats["resyncs"] == 1 and ws.stats["resync_failures"] == 0
+
+
+def test_resync_accepts_a_snapshot_without_timestamp() -> None:
+    class _Rest:
+        def get_orderbook(self, token_id: str) -> dict:
+            return _snapshot(0, bid="0.50") | {"timestamp": None}
+
+    ws = PolymarketWebSocket(rest_client=_Rest())
+    ws._connected.set()
+
+    async def replay() -> None:
+        await ws._handle_message(json.dumps(_snapshot(100)))
+        await ws._handle_message(json.dumps(_change(150, "BUY", "0.45", "5", "0.55", "0.52")))  # drift
+        await asyncio.gather(*(t for t in asyncio.all_tasks() if t is not asyncio.current_task()))
+
+    asyncio.run(replay())
+    assert ws.get_synced_orderbook("tok").best_bid == 0.50
+    assert ws.stats["resyncs"] == 1 and ws.stats["resync_failures"] == 0
+
+
+def test_snapshot_is_frozen_and_prices_like_the_live_book() -> None:
+    book = CachedOrderBook("tok")
+    book.load_snapshot(parse_book(_snapshot(100)))
+    view = book.view
+    book.update_from_delta({"changes": [{"side": "SELL", "price": "0.55", "size": "20"}]})
+    book.update_from_delta({"changes": [{"side": "SELL", "price": "0.52", "size": "0"}]})
+    assert view.best_ask == 0.52 and view.asks[0].price == 0.52 and book.best_ask != 0.52
+    assert book.view.bids is view.bids  # untouched side is shared, not copied
+    assert book.view.depth == (book.bids.depth(), book.asks.depth())  # one depth index for book and view
+    for amount in (1.0, 30.0, 1e6):
+        assert book.view.get_execution_price("BUY", amount) == pytest.approx(book.get_execution_price("BUY", amount))
+    assert np.allclose(book.view.execution_curve("SELL", [1, 50]), book.execution_curve("SELL", [1, 50]))
+    assert book.bids.depth().arrays is not None  # the curve priced from the shared depth index
+    book.mark_unsynced()
+    assert not book.view.in_sync and view.in_sync
+
+
+def test_lock_free_reads_see_consistent_books() -> None:
+    book = CachedOrderBook("tok")
+    book.update_from_snapshot({"bids": [{"price": "0.49", "size": "1"}], "asks": [{"price": "0.51", "size": "1"}]})
+    done = threading.Event()
+    torn: list[BookSnapshot] = []
+
+    def reader() -> None:
+        while not done.is_set():
+            view = book.view
+            prices = [lv.price for lv in view.bids]
+            if prices != sorted(prices, reverse=True) or (view.bids and view.best_bid != prices[0]):
+                torn.append(view)
+
+    thread = threading.Thread(target=reader)
+    thread.start()
+    rng = random.Random(3)
+    for _ in range(3000):
+        cents = rng.randint(1, 49)
+        book.update_from_delta({"changes": [{"side": "BUY", "price": f"{cents / 100:.2f}", "size": "1"}]})
+    done.set()
+    thread.join()
+    assert not torn
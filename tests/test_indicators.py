@@ -1,5 +1,22 @@
+import numpy as np
 import pandas as pd
-from polymarket_algo.indicators import ema, macd, rsi, sma
+from polymarket_algo.indicators import (
+    BollingerState,
+    EMAState,
+    IndicatorCache,
+    MACDState,
+    RSIState,
+    SMAState,
+    bollinger_bands,
+    ema,
+    indicator_cache,
+    macd,
+    rsi,
+    sma,
+    streak_lengths,
+    trailing_streak,
+)
+from polymarket_algo.indicators.streaming import feed
 
 
 def test_ema_sma_shapes() -> None:
@@ -15,8 +32,97 @@ def test_rsi_range_and_shape() -> None:
     assert out.dropna().between(0, 100).all()
 
 
+def test_rsi_values_use_positive_losses() -> None:
+    # Wilder, period 2: avg gain/loss after the 2.0 -> 1.0 steps are 0.5/0.5, then 0.25/0.75
+    out = rsi(pd.Series([1.0, 2.0, 3.0, 2.0, 1.0]), 2)
+    np.testing.assert_allclose(out.to_numpy(), [100.0, 100.0, 100.0, 50.0, 25.0])
+    rising = rsi(pd.Series(np.arange(1.0, 40.0)), 14)
+    assert (rising.iloc[14:] == 100).all()
+    falling = rsi(pd.Series(np.arange(40.0, 1.0, -1)), 14)
+    assert (falling.iloc[14:] == 0).all()
+    steps = rsi(pd.Series(np.round(100 + np.random.default_rng(5).normal(0, 1, 300).cumsum(), 0)), 14)
+    assert steps.dtype == np.float64 and steps.between(0, 100).all()
+
+
 def test_macd_dataframe_columns() -> None:
     s = pd.Series(range(1, 100))
     out = macd(s)
     assert set(out.columns) == {"macd", "signal", "histogram"}
     assert len(out) == len(s)
+
+
+def test_indicator_cache_reuses_results_on_equal_series() -> None:
+    s = pd.Series(np.random.default_rng(3).normal(100, 1, 500))
+    indicator_cache.clear()
+
+    first = macd(s, 8, 21, 9)
+    hits = indicator_cache.stats["hits"]
+    second = macd(s.copy(), 8, 21, 9)
+    assert indicator_cache.stats["hits"] == hits + 1
+    pd.testing.assert_frame_equal(first, second)
+
+    # The macd() above already computed EMA(8) on the same values.
+    pd.testing.assert_series_equal(ema(s, 8), s.ewm(span=8, adjust=False, min_periods=8).mean())
+    assert indicator_cache.stats["hits"] == hits + 2
+
+    changed = s.copy()
+    changed.iloc[250] += 1e-9
+    assert not ema(changed, 8).equals(ema(s, 8))
+
+
+def test_indicator_cache_keys_distinguish_permuted_series() -> None:
+    indicator_cache.clear()
+    a = pd.Series([1.0, -1.0, 1.0, 1.0, -1.0, -1.0])
+    b = pd.Series([-1.0, -1.0, -1.0, 1.0, 1.0, 1.0])
+    pd.testing.assert_series_equal(sma(a, 3), a.rolling(3).mean())
+    pd.testing.assert_series_equal(sma(b, 3), b.rolling(3).mean())
+
+    c = pd.Series(np.ones(8192))
+    c.iloc[10], c.iloc[10 + 4096] = 2.0, 4.0
+    d = c.copy()
+    d.iloc[10], d.iloc[10 + 4096] = 4.0, 2.0
+    pd.testing.assert_series_equal(sma(c, 3), c.rolling(3).mean())
+    pd.testing.assert_series_equal(sma(d, 3), d.rolling(3).mean())
+    assert indicator_cache.stats["hits"] == 0
+
+
+def test_indicator_cache_is_bounded() -> None:
+    cache = IndicatorCache(maxsize=2)
+    s = pd.Series(np.arange(50, dtype=float))
+    for period in (3, 4, 5):
+        cache.series("sma", s, (period,), lambda p=period: s.rolling(p).mean())
+    assert cache.stats["size"] == 2
+    assert cache.stats["evictions"] == 1
+
+
+def test_streak_kernels() -> None:
+    values = np.array([1, 1, -1, -1, -1, 1])
+    np.testing.assert_array_equal(streak_lengths(values), [1, 2, 1, 2, 3, 1])
+    assert trailing_streak(np.array(["down", "up", "up", "up"])) == 3
+    assert trailing_streak(np.array(["up"] * 5)) == 5
+    assert trailing_streak(np.array([])) == 0
+    assert len(streak_lengths(np.array([]))) == 0
+
+
+def test_streaming_states_match_batch_bit_for_bit() -> None:
+    rng = np.random.default_rng(11)
+    walk = 100 + rng.normal(0, 1, 2000).cumsum()
+    steps = np.round(walk, 0)  # long flat runs exercise pandas' constant-window handling
+    for values in (walk, steps):
+        s = pd.Series(values)
+        for period in (1, 5, 20):
+            np.testing.assert_array_equal(feed(EMAState(period), values), ema(s, period))
+            np.testing.assert_array_equal(feed(SMAState(period), values), sma(s, period))
+            np.testing.assert_array_equal(feed(RSIState(period), values), rsi(s, period))
+            np.testing.assert_array_equal(
+                np.array(feed(BollingerState(period, 2.0), values)),
+                bollinger_bands(s, period, 2.0)[["middle", "upper", "lower"]].to_numpy(),
+            )
+        np.testing.assert_array_equal(np.array(feed(MACDState(8, 21, 5), values)), macd(s, 8, 21, 5).to_numpy())
+
+
+def test_streaming_state_exposes_latest_value() -> None:
+    state = MACDState()
+    out = state.update(101.5)
+    assert state.value is out
+    assert np.isnan(out.signal)
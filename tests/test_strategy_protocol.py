@@ -1,5 +1,8 @@
+import numpy as np
 import pandas as pd
-from polymarket_algo.core.types import Strategy
+import pytest
+from polymarket_algo.core.types import IncrementalStrategy, Strategy
+from polymarket_algo.strategies.candle_direction import CandleDirectionStrategy
 from polymarket_algo.strategies.streak_reversal import StreakReversalStrategy
 
 
@@ -9,3 +12,32 @@ def test_streak_strategy_conforms_protocol() -> None:
     candles = pd.DataFrame({"close": range(20)}, index=idx)
     out = strategy.evaluate(candles)
     assert {"signal", "size"}.issubset(out.columns)
+
+
+def _random_walk(n: int = 1500, seed: int = 21) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    idx = pd.date_range("2025-01-01", periods=n, freq="5min", tz="UTC")
+    close = np.round(100 + rng.normal(0, 0.4, n).cumsum(), 1)  # rounding leaves some flat candles
+    return pd.DataFrame({"close": close}, index=idx)
+
+
+@pytest.mark.parametrize(
+    ("strategy", "params"),
+    [
+        (CandleDirectionStrategy(), {}),
+        (CandleDirectionStrategy(), {"ema_fast": 8, "ema_slow": 21, "rsi_period": 10, "macd_signal": 7}),
+        (StreakReversalStrategy(), {}),
+        (StreakReversalStrategy(), {"trigger": 2, "size": 10.0}),
+    ],
+)
+def test_incremental_strategy_matches_batch(strategy: IncrementalStrategy, params: dict) -> None:
+    candles = _random_walk()
+    batch = strategy.evaluate(candles, **params)  # type: ignore[attr-defined]
+    split = 400
+
+    assert isinstance(strategy, IncrementalStrategy)
+    strategy.warmup(candles.iloc[:split], **params)
+    streamed = [strategy.on_candle(row) for _, row in candles.iloc[split:].iterrows()]
+
+    expected = list(zip(batch["signal"].iloc[split:], batch["size"].iloc[split:], strict=True))
+    assert streamed == expected